@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Re-renderizado incremental (caché de secciones) frente al renderizado completo
+
+Corpus: metodologías sintéticas de bench_writer con --tasks tareas. Para cada una mide
+(mejor de --repeat) el renderizado completo, el incremental con la caché vacía, con la
+caché llena y tras editar un párrafo (la descripción de una tarea de la última fase), y
+verifica que word/document.xml sea idéntico al del renderizado completo. La caché se
+crea en un directorio temporal.
+
+Uso:
+    python benchmarks/bench_incremental.py [--tasks 10,50,200] [--writer docx,ooxml]
+                                           [--repeat N] [--json]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import zipfile
+import argparse
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from bench_writer import synthetic_methodology
+from src.document_writer import create_word_document, WRITERS
+from src.section_cache import SectionCache
+from src.translations import get_language_config
+
+
+def render(methodology: dict, writer: str, incremental: bool, directory: Path = None) -> tuple:
+    """Segundos y word/document.xml de un renderizado (con la caché en directory)"""
+    if directory is not None and directory.exists():
+        shutil.rmtree(directory)
+    buffer = io.BytesIO()
+    started = time.perf_counter()
+    create_word_document(methodology, buffer, get_language_config('en'), writer=writer,
+                         incremental=incremental)
+    elapsed = time.perf_counter() - started
+    with zipfile.ZipFile(buffer) as package:
+        return elapsed, package.read('word/document.xml')
+
+
+def measure(methodology: dict, edited: dict, writer: str, repeat: int, directory: Path) -> dict:
+    best = {}
+
+    def keep(name, seconds):
+        best[name] = round(min(best.get(name, seconds), seconds), 4)
+
+    for _ in range(repeat):
+        seconds, full = render(edited, writer, False)
+        keep('full', seconds)
+        seconds, cold = render(methodology, writer, True, directory)
+        keep('cold', seconds)
+        seconds, warm = render(methodology, writer, True)
+        keep('warm', seconds)
+        seconds, edit = render(edited, writer, True)
+        keep('edit', seconds)
+    best['speedup'] = round(best['full'] / best['edit'], 1)
+    best['identical'] = edit == full
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--tasks', default='10,50,200', help='Tareas de las metodologías sintéticas')
+    parser.add_argument('--writer', default=','.join(WRITERS), help='Escritores a comparar')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='Salida JSON')
+    args = parser.parse_args()
+
+    task_counts = [int(count) for count in args.tasks.split(',') if count.strip()]
+    writers = [writer.strip() for writer in args.writer.split(',') if writer.strip()]
+    temp = tempfile.mkdtemp(prefix='bench_incremental_')
+    os.environ['DOCX_TEMPLATE_CACHE_DIR'] = temp
+    directory = SectionCache('docx', {}).directory
+    try:
+        # Primer renderizado fuera de la medición (importaciones y documento base)
+        for writer in writers:
+            render(synthetic_methodology(1), writer, False)
+
+        results = {}
+        for count in task_counts:
+            methodology = synthetic_methodology(count)
+            edited = synthetic_methodology(count)
+            edited['phases'][-1]['tasks'][0]['description'] = 'Edited **paragraph** of the task.'
+            for writer in writers:
+                results[f"{count}/{writer}"] = measure(methodology, edited, writer, args.repeat,
+                                                       directory)
+    finally:
+        shutil.rmtree(temp, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'tareas/escritor':<16} {'completo':>9} {'vacía':>8} {'llena':>8} {'edición':>8} "
+          f"{'x':>6} {'idéntico':>9}")
+    for name, r in results.items():
+        print(f"{name:<16} {r['full']:>9.3f} {r['cold']:>8.3f} {r['warm']:>8.3f} "
+              f"{r['edit']:>8.3f} {r['speedup']:>6} {'sí' if r['identical'] else 'NO':>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark de reparación de JSON: motor de una pasada vs. reparación por conteo (legacy)
+
+Corpus:
+- Metodologías reales de los proyectos registrados, serializadas como las devuelve el LLM
+  y truncadas en 25 puntos cada una, más variantes con fallos típicos inyectados
+  (coma faltante, coma final, saltos de línea literales, literales de Python)
+- Opcionalmente, respuestas crudas guardadas (--corpus DIR, p. ej. LLM_RESPONSE_CACHE_DIR)
+
+Uso:
+    python benchmarks/bench_json_repair.py [--corpus DIR] [--repeat N]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.json_repair import repair_json
+
+
+def legacy_repair(json_str: str) -> str:
+    """Reparación anterior (_repair_truncated_json): conteo global de llaves y corchetes"""
+    open_braces = json_str.count('{') - json_str.count('}')
+    open_brackets = json_str.count('[') - json_str.count(']')
+    if json_str.rstrip().endswith('"') is False:
+        last_quote = json_str.rfind('"')
+        if last_quote > 0:
+            before_quote = json_str[:last_quote].rfind('"')
+            if before_quote >= 0:
+                json_str = json_str.rstrip()
+                if not json_str.endswith('"'):
+                    json_str += '"'
+    json_str += ']' * open_brackets
+    json_str += '}' * open_braces
+    return json_str
+
+
+def load_project_methodologies() -> dict:
+    """Carga las metodologías de los proyectos registrados (sin variantes)"""
+    from src.project_registry import list_projects, load_project
+
+    return {project_id: load_project(project_id)
+            for project_id, info in list_projects().items() if not info.get('variant_of')}
+
+
+def _inject_faults(text: str) -> list:
+    """Variantes con fallos típicos de los modelos"""
+    return [
+        ('missing_comma', text.replace('",\n', '"\n', 3)),
+        ('trailing_comma', text.replace('"\n            }', '",\n            }')),
+        ('raw_newlines', text.replace('\\n', '\n')),
+        ('python_literals', text.replace('"start_week": 1,', '"start_week": 1, "optional": None,')),
+    ]
+
+
+def build_corpus(corpus_dir: str = None) -> list:
+    """Retorna [(nombre, texto)] con las respuestas a reparar"""
+    corpus = []
+    for name, methodology in load_project_methodologies().items():
+        text = '```json\n' + json.dumps(methodology, ensure_ascii=False, indent=4) + '\n```'
+        for k in range(1, 26):
+            cut = int(len(text) * k / 26)
+            corpus.append((f'{name}/truncated_{k:02d}', text[:cut]))
+        for fault, variant in _inject_faults(text):
+            corpus.append((f'{name}/{fault}', variant))
+
+    if corpus_dir:
+        for path in sorted(Path(corpus_dir).glob('*.txt')):
+            corpus.append((f'real/{path.stem}', path.read_text(encoding='utf-8')))
+    return corpus
+
+
+def _extract(text: str) -> str:
+    """Recorta desde la primera llave (el paso previo de ambos parsers)"""
+    start = text.find('{')
+    return text[start:] if start >= 0 else text
+
+
+def run(repair, corpus: list, repeat: int) -> dict:
+    """Mide tasa de éxito, contenido recuperado y velocidad de una función de reparación"""
+    ok = 0
+    recovered = 0.0
+    total_bytes = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for name, text in corpus:
+            total_bytes += len(text)
+            try:
+                data = json.loads(repair(_extract(text)))
+            except (json.JSONDecodeError, RecursionError):
+                continue
+            if isinstance(data, dict):
+                ok += 1
+                recovered += min(1.0, len(json.dumps(data, ensure_ascii=False)) / max(1, len(text)))
+    elapsed = time.perf_counter() - started
+    cases = len(corpus) * repeat
+    return {
+        'cases': cases,
+        'success_rate': round(ok / cases, 4),
+        'recovered_share': round(recovered / cases, 4),
+        'seconds': round(elapsed, 4),
+        'mb_per_s': round(total_bytes / 1e6 / elapsed, 2) if elapsed else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--corpus', default=os.getenv('LLM_RESPONSE_CACHE_DIR'),
+                        help='Directorio con respuestas crudas (*.txt)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='Salida JSON')
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.corpus)
+    results = {
+        'legacy': run(legacy_repair, corpus, args.repeat),
+        'json_repair': run(repair_json, corpus, args.repeat),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Corpus: {len(corpus)} respuestas")
+    print(f"{'motor':<12} {'éxito':>8} {'recuperado':>11} {'segundos':>9} {'MB/s':>7}")
+    for engine, r in results.items():
+        print(f"{engine:<12} {r['success_rate']:>8.1%} {r['recovered_share']:>11.1%} "
+              f"{r['seconds']:>9.3f} {r['mb_per_s']:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Análisis del marcado de los textos (markup) frente al troceado anterior línea a línea
+
+Corpus: los textos largos de los proyectos registrados (contexto, riesgos, calidad y
+descripciones de fases y tareas), repetidos --scale veces. Mide (mejor de --repeat):
+- anterior: el content_blocks previo (prefijos de línea y re.split de las negritas en
+  cada línea, con la importación dentro de la función), reproducido aquí
+- markup: document_ir.content_blocks sobre markup.parse_content (runs directos)
+- docx / ooxml: dibujo de los bloques de los textos con cada escritor
+y cuenta las itálicas que el troceado anterior dejaba como asteriscos literales.
+
+Uso:
+    python benchmarks/bench_markup.py [--scale N] [--repeat N] [--json]
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.document_ir import content_blocks
+from src.document_writer import _add_blocks
+from src.base_template import new_document
+from src.ooxml_writer import _Body, _base_package, _write_blocks
+from src.project_registry import list_projects, load_project
+
+
+def _legacy_runs(text: str) -> list:
+    import re
+    runs = []
+    for part in re.split(r'(\*\*[^*]+\*\*)', text):
+        if part.startswith('**') and part.endswith('**'):
+            runs.append((part[2:-2], True, False))
+        elif part:
+            runs.append((part, False, False))
+    return runs
+
+
+def legacy_content_blocks(content: str) -> list:
+    """content_blocks anterior a markup (solo negritas; listas 1. a 9. sin anidar)"""
+    blocks = []
+    if not content:
+        return blocks
+    for para_text in content.split('\n\n'):
+        if not para_text.strip():
+            continue
+        for line in para_text.strip().split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('**') and line.endswith('**') and line.count('**') == 2:
+                blocks.append({'type': 'subheading', 'text': line[2:-2]})
+            elif line.startswith(('- ', '• ', '* ')):
+                blocks.append({'type': 'bullet', 'level': 0, 'runs': _legacy_runs(line[2:])})
+            elif line.startswith(tuple(f'{n}.' for n in range(1, 10))):
+                blocks.append({'type': 'numbered', 'level': 0,
+                               'runs': _legacy_runs(line.split('.', 1)[1].strip())})
+            else:
+                blocks.append({'type': 'paragraph', 'runs': _legacy_runs(line)})
+    return blocks
+
+
+def project_texts() -> list:
+    """Textos con marcado de los proyectos registrados"""
+    texts = []
+    for project_id in list_projects():
+        methodology = load_project(project_id)
+        texts += [methodology.get(key) or '' for key in ('context', 'risks', 'quality')]
+        for phase in methodology.get('phases', []):
+            texts.append(phase.get('description') or '')
+            texts += [task.get('description') or '' for task in phase.get('tasks', [])]
+    return [text for text in texts if text]
+
+
+def best_of(repeat: int, run) -> float:
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 4)
+
+
+def _italics(blocks: list) -> int:
+    return sum(1 for block in blocks for run in block.get('runs', ()) if run[2])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--scale', type=int, default=5, help='Repeticiones del corpus')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='Salida JSON')
+    args = parser.parse_args()
+
+    texts = project_texts() * args.scale
+    blocks = [block for text in texts for block in content_blocks(text)]
+    base = _base_package()
+
+    def ooxml():
+        body = _Body(base)
+        _write_blocks(body, blocks)
+        return ''.join(body.parts)
+
+    results = {
+        'texts': len(texts),
+        'kilobytes': round(sum(len(text.encode('utf-8')) for text in texts) / 1024, 1),
+        'blocks': len(blocks),
+        'italic_runs': _italics(blocks),
+        'legacy_italic_runs': _italics([block for text in texts
+                                        for block in legacy_content_blocks(text)]),
+        'legacy': best_of(args.repeat, lambda: [legacy_content_blocks(text) for text in texts]),
+        'markup': best_of(args.repeat, lambda: [content_blocks(text) for text in texts]),
+        'docx': best_of(args.repeat, lambda: _add_blocks(new_document(), blocks)),
+        'ooxml': best_of(args.repeat, ooxml),
+    }
+    results['speedup'] = round(results['legacy'] / results['markup'], 2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{results['texts']} textos, {results['kilobytes']} KB, {results['blocks']} bloques, "
+          f"{results['italic_runs']} itálicas (antes {results['legacy_italic_runs']})")
+    print(f"{'anterior ms':>12} {'markup ms':>10} {'x':>6} {'docx ms':>9} {'ooxml ms':>9}")
+    print(f"{results['legacy'] * 1000:>12.1f} {results['markup'] * 1000:>10.1f} "
+          f"{results['speedup']:>6} {results['docx'] * 1000:>9.0f} {results['ooxml'] * 1000:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark del renderizado de fases en paralelo (phase_workers)
+
+Corpus: metodologías sintéticas de bench_writer con --phases fases de 5 tareas (8 por
+defecto, como una info_systems grande). Mide create_word_document (mejor de --repeat)
+con cada número de procesos de --workers y verifica que word/document.xml sea idéntico
+al del renderizado en serie.
+
+Uso:
+    python benchmarks/bench_phases.py [--phases 8] [--workers 1,2,4,8] [--writer docx]
+                                      [--repeat N] [--json]
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import zipfile
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from bench_writer import synthetic_methodology, TASKS_PER_PHASE
+from src.document_writer import create_word_document, WRITERS
+from src.translations import get_language_config
+
+
+def render(methodology: dict, writer: str, workers: int, repeat: int) -> dict:
+    """Mejor tiempo de repeat renderizados y su word/document.xml"""
+    lang_config = get_language_config('en')
+    best = None
+    for _ in range(repeat):
+        buffer = io.BytesIO()
+        started = time.perf_counter()
+        create_word_document(methodology, buffer, lang_config, writer=writer,
+                             phase_workers=workers)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    with zipfile.ZipFile(buffer) as package:
+        document = package.read('word/document.xml')
+    return {'seconds': round(best, 4), 'document': document}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--phases', type=int, default=8)
+    parser.add_argument('--workers', default='1,2,4,8', help='Procesos a comparar')
+    parser.add_argument('--writer', default='docx', choices=WRITERS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='Salida JSON')
+    args = parser.parse_args()
+
+    methodology = synthetic_methodology(args.phases * TASKS_PER_PHASE)
+    counts = [int(count) for count in args.workers.split(',') if count.strip()]
+    # Primer renderizado fuera de la medición (importaciones y documento base)
+    create_word_document(synthetic_methodology(1), io.BytesIO(), get_language_config('en'),
+                         writer=args.writer)
+
+    serial = render(methodology, args.writer, 1, args.repeat)
+    results = {}
+    for workers in counts:
+        run = serial if workers == 1 else render(methodology, args.writer, workers, args.repeat)
+        results[workers] = {'seconds': run['seconds'],
+                            'speedup': round(serial['seconds'] / run['seconds'], 2),
+                            'identical': run['document'] == serial['document']}
+
+    if args.json:
+        print(json.dumps({'phases': args.phases, 'writer': args.writer, 'cpus': os.cpu_count(),
+                          'results': results}, indent=2))
+        return
+
+    print(f"{args.phases} fases, escritor {args.writer}, {os.cpu_count()} CPU")
+    print(f"{'procesos':>8} {'s':>8} {'x':>6} {'idéntico':>9}")
+    for workers, r in results.items():
+        print(f"{workers:>8} {r['seconds']:>8.3f} {r['speedup']:>6} "
+              f"{'sí' if r['identical'] else 'NO':>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Vista previa HTML y Markdown (preview_writer) frente al Word
+
+Corpus: metodologías sintéticas (ver bench_writer.synthetic_methodology) y opcionalmente
+los proyectos registrados. Para cada una mide (mejor de --repeat) la construcción del IR,
+las vistas previas HTML y Markdown y el Word con cada escritor.
+
+Uso:
+    python benchmarks/bench_preview.py [--tasks 10,50,200] [--repeat N] [--projects] [--json]
+"""
+
+import io
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from bench_writer import synthetic_methodology, build_corpus
+from src.document_ir import build_document
+from src.document_writer import create_word_document, WRITERS
+from src.preview_writer import create_preview, PREVIEW_FORMATS
+from src.translations import get_language_config
+
+
+def best_of(repeat: int, run) -> float:
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--tasks', default='10,50,200', help='Tareas de las metodologías sintéticas')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--projects', action='store_true', help='Incluye los proyectos registrados')
+    parser.add_argument('--json', action='store_true', help='Salida JSON')
+    args = parser.parse_args()
+
+    task_counts = [int(count) for count in args.tasks.split(',') if count.strip()]
+    corpus = build_corpus(task_counts, args.projects)
+    # Primer renderizado fuera de la medición (importaciones y documento base)
+    for writer in WRITERS:
+        create_word_document(synthetic_methodology(1), io.BytesIO(), get_language_config('en'),
+                             writer=writer)
+
+    results = {}
+    for name, methodology, language, options in corpus:
+        lang_config = get_language_config(language)
+        result = {'ir': best_of(args.repeat, lambda: build_document(methodology, lang_config))}
+        for fmt in PREVIEW_FORMATS:
+            result[fmt] = best_of(args.repeat, lambda: create_preview(methodology, lang_config, fmt))
+        for writer in WRITERS:
+            result[writer] = best_of(args.repeat, lambda: create_word_document(
+                methodology, io.BytesIO(), lang_config, writer=writer, **options))
+        results[name] = result
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'metodología':<26} {'IR ms':>7} {'html ms':>8} {'md ms':>7} {'docx ms':>8} "
+          f"{'ooxml ms':>9}")
+    for name, r in results.items():
+        print(f"{name:<26} {r['ir'] * 1000:>7.1f} {r['html'] * 1000:>8.1f} {r['md'] * 1000:>7.1f} "
+              f"{r['docx'] * 1000:>8.0f} {r['ooxml'] * 1000:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Escalado de create_word_document (python-docx) por etapas, con historial de resultados
+
+Corpus: metodologías sintéticas de tamaño creciente (CASES: de 3 fases, 5 tareas, 12
+semanas y 1 KB de texto por sección a 20 fases, 500 tareas, 260 semanas y 20 KB). Cada
+caso corre en un proceso aparte y mide (mejor de --repeat):
+- las etapas del renderizado, con las mismas llamadas que create_word_document:
+  schedule (cronograma), styles (documento base con los estilos), text (título,
+  introducción, contexto, riesgos y calidad), principles, phases (IR y bloques de las
+  fases salvo los Gantt), gantt (tablas Gantt), work_plan y save
+- el total de create_word_document, y si su word/document.xml es idéntico al de las etapas
+- el pico de memoria del proceso (RSS, Unix) y de Python (tracemalloc, un renderizado)
+- el tamaño del .docx y de word/document.xml
+
+Cada ejecución se agrega a --history (JSON lines, con el commit y el hash de
+document_writer.py) y se compara con la última ejecución anterior que tenga el caso:
+las etapas más lentas que --threshold se marcan con '!'. --history-report muestra el
+total de cada caso a lo largo del historial.
+
+Uso:
+    python benchmarks/bench_render.py [--cases xs,s,m,l,xl] [--repeat N] [--threshold 0.15]
+                                      [--history PATH] [--no-save] [--fail-on-regression]
+                                      [--json]
+    python benchmarks/bench_render.py --history-report
+"""
+
+import io
+import sys
+import json
+import time
+import random
+import hashlib
+import zipfile
+import argparse
+import platform
+import datetime
+import subprocess
+import tracemalloc
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from bench_writer import _sentence, _prose
+
+HISTORY = ROOT / 'benchmarks' / 'results' / 'bench_render.jsonl'
+
+# Tamaños de los casos: fases, tareas, semanas y KB de texto por sección
+CASES = {
+    'xs': {'phases': 3, 'tasks': 5, 'weeks': 12, 'text_kb': 1},
+    's': {'phases': 5, 'tasks': 30, 'weeks': 26, 'text_kb': 2},
+    'm': {'phases': 8, 'tasks': 100, 'weeks': 52, 'text_kb': 5},
+    'l': {'phases': 12, 'tasks': 250, 'weeks': 130, 'text_kb': 10},
+    'xl': {'phases': 20, 'tasks': 500, 'weeks': 260, 'text_kb': 20},
+}
+
+STAGES = ('schedule', 'styles', 'text', 'principles', 'phases', 'gantt', 'work_plan', 'save')
+
+# Diferencia mínima (segundos) para marcar una etapa como regresión
+MIN_REGRESSION_SECONDS = 0.005
+
+
+def _text(rng: random.Random, kb: int) -> str:
+    """Texto de una sección de al menos kb KB: párrafos, listas, itálicas y encabezados"""
+    blocks = []
+    size = 0
+    while size < kb * 1024:
+        block = _prose(rng, rng.randint(3, 8))
+        if rng.random() < 0.3:
+            block = f"**{_sentence(rng, 4)[:-1].replace('**', '')}**\n{block}"
+        if rng.random() < 0.3:
+            block += f"\n\n*{_sentence(rng, 10).replace('**', '')}*"
+        blocks.append(block)
+        size += len(block) + 2
+    return '\n\n'.join(blocks)
+
+
+def scaled_methodology(phases: int, tasks: int, weeks: int, text_kb: int, seed: int = 1) -> dict:
+    """
+    Metodología sintética de phases fases y tasks tareas en weeks semanas
+
+    Las fases se reparten las semanas con un leve solapamiento y las tareas de cada fase
+    caen dentro de ella; la introducción, el contexto, los riesgos, la calidad y la
+    descripción de cada fase tienen text_kb KB de texto.
+    """
+    rng = random.Random(seed)
+    span = weeks / phases
+    phase_list = []
+    deliverable = 0
+    for p_idx in range(phases):
+        phase_start = max(1, int(p_idx * span) + 1 - rng.randint(0, 1))
+        phase_end = max(phase_start, int((p_idx + 1) * span))
+        task_list, deliverables = [], []
+        for t_idx in range(tasks // phases + (p_idx < tasks % phases)):
+            start = rng.randint(phase_start, phase_end)
+            end = min(phase_end, start + rng.randint(0, 8))
+            task = {'code': f"{p_idx + 1}{chr(ord('A') + t_idx % 26)}{t_idx // 26 or ''}",
+                    'title': _sentence(rng, 5)[:-1].replace('**', ''),
+                    'description': _prose(rng, rng.randint(3, 6)),
+                    'items': [_sentence(rng, 5) for _ in range(rng.randint(0, 3))],
+                    'start_week': start, 'end_week': end}
+            if rng.random() < 0.4:
+                deliverable += 1
+                task['deliverable_week'] = end
+                task['deliverable_code'] = f"D{deliverable}"
+                deliverables.append({'code': f"D{deliverable}", 'name': _sentence(rng, 8)})
+            elif rng.random() < 0.5:
+                task['event_week'] = start
+                task['event_code'] = f"E{p_idx + 1}"
+            task_list.append(task)
+        phase_list.append({'title': f"Phase {p_idx + 1}: {_sentence(rng, 4)[:-1]}".replace('**', ''),
+                           'description': _text(rng, text_kb),
+                           'start_week': phase_start, 'end_week': phase_end,
+                           'tasks': task_list, 'deliverables': deliverables})
+    return {
+        'introduction': _text(rng, text_kb),
+        'context': _text(rng, text_kb),
+        'principles': [{'name': _sentence(rng, 3)[:-1].replace('**', ''),
+                        'description': _prose(rng, 3, lists=False)} for _ in range(6)],
+        'phases': phase_list,
+        'risks': _text(rng, text_kb),
+        'quality': _text(rng, text_kb),
+    }
+
+
+def staged_render(methodology: dict, lang_config: dict) -> tuple:
+    """
+    Renderizado de create_word_document (writer='docx', sin caché ni paralelismo) con el
+    tiempo de cada etapa
+
+    Returns:
+        ({etapa: segundos}, bytes del .docx)
+    """
+    from src.base_template import new_document
+    from src.document_ir import (heading, paragraph_blocks, text_blocks, principles_blocks,
+                                 phase_blocks, work_plan_blocks)
+    from src.document_writer import _add_blocks
+    from src.methodology_model import as_methodology
+    from src.schedule import build_schedule
+
+    times = dict.fromkeys(STAGES, 0.0)
+    clock = time.perf_counter
+
+    def timed(stage, function, *args):
+        started = clock()
+        result = function(*args)
+        times[stage] += clock() - started
+        return result
+
+    methodology = as_methodology(methodology)
+    sections = lang_config['sections']
+    schedule = timed('schedule', build_schedule, methodology)
+    doc = timed('styles', new_document)
+
+    def draw(stage, build, *args):
+        timed(stage, lambda: _add_blocks(doc, build(*args)))
+
+    draw('text', lambda: [heading(0, sections['title'])]
+         + paragraph_blocks(methodology.introduction))
+    if methodology.context:
+        draw('text', text_blocks, sections['context'], 2, methodology.context)
+    if methodology.principles:
+        draw('principles', principles_blocks, methodology.principles, lang_config)
+    draw('text', lambda: [heading(1, sections['approach'])])
+    for p_idx, phase in enumerate(methodology.phases):
+        blocks = timed('phases', phase_blocks, phase, lang_config, schedule, p_idx)
+        for block in blocks:
+            timed('gantt' if block['type'] == 'gantt' else 'phases', _add_blocks, doc, [block])
+    if methodology.risks:
+        draw('text', text_blocks, sections['risks'], 1, methodology.risks)
+    if methodology.quality:
+        draw('text', text_blocks, sections['quality'], 1, methodology.quality)
+    if methodology.phases:
+        draw('work_plan', work_plan_blocks, methodology, lang_config, schedule)
+
+    buffer = io.BytesIO()
+    timed('save', doc.save, buffer)
+    return times, buffer.getvalue()
+
+
+def _document_xml(package: bytes) -> bytes:
+    with zipfile.ZipFile(io.BytesIO(package)) as docx_file:
+        return docx_file.read('word/document.xml')
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    # ru_maxrss en KB en Linux, en bytes en macOS
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1)
+
+
+def run_case(size: dict, repeat: int) -> dict:
+    """Mediciones de un caso (en el proceso actual; main lo llama en un proceso aparte)"""
+    from src.base_template import new_document
+    from src.document_writer import create_word_document
+    from src.translations import get_language_config
+
+    lang_config = get_language_config('en')
+    methodology = scaled_methodology(**size)
+    # Documento base y plantilla fuera de la medición
+    new_document()
+    baseline_rss = _peak_rss_mb()
+
+    best = {}
+    for _ in range(repeat):
+        times, package = staged_render(methodology, lang_config)
+        for stage, seconds in times.items():
+            best[stage] = min(best.get(stage, seconds), seconds)
+        buffer = io.BytesIO()
+        started = time.perf_counter()
+        create_word_document(methodology, buffer, lang_config)
+        elapsed = time.perf_counter() - started
+        best['total'] = min(best.get('total', elapsed), elapsed)
+
+    tracemalloc.start()
+    create_word_document(methodology, io.BytesIO(), lang_config)
+    python_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    document = _document_xml(buffer.getvalue())
+    return {
+        'size': size,
+        'seconds': {stage: round(seconds, 4) for stage, seconds in best.items()},
+        'identical': _document_xml(package) == document,
+        'peak_rss_mb': _peak_rss_mb(),
+        'baseline_rss_mb': baseline_rss,
+        'python_peak_mb': round(python_peak / 2 ** 20, 1),
+        'docx_bytes': len(buffer.getvalue()),
+        'document_xml_bytes': len(document),
+    }
+
+
+def _git(*args):
+    try:
+        return subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _writer_digest() -> str:
+    return hashlib.sha256((ROOT / 'src' / 'document_writer.py').read_bytes()).hexdigest()[:12]
+
+
+def load_history(path: Path) -> list:
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compare(results: dict, history: list, threshold: float) -> dict:
+    """
+    Etapas de cada caso más lentas que en la última ejecución anterior con ese caso
+
+    Returns:
+        {caso: {'previous': entrada anterior, 'regressions': [etapa]}}
+    """
+    comparison = {}
+    for name, result in results.items():
+        previous = next((entry for entry in reversed(history)
+                         if name in entry['results']
+                         and entry['results'][name]['size'] == result['size']), None)
+        if previous is None:
+            continue
+        before = previous['results'][name]['seconds']
+        regressions = [stage for stage, seconds in result['seconds'].items()
+                       if stage in before
+                       and seconds > before[stage] * (1 + threshold)
+                       and seconds - before[stage] > MIN_REGRESSION_SECONDS]
+        comparison[name] = {'previous': previous, 'regressions': regressions}
+    return comparison
+
+
+def history_report(history: list):
+    """Total de cada caso a lo largo del historial ('*': cambió document_writer.py)"""
+    names = [name for name in CASES if any(name in entry['results'] for entry in history)]
+    print(f"{'fecha':<20} {'commit':<9} {'writer':<13}" + ''.join(f"{name:>9}" for name in names))
+    previous_digest = None
+    for entry in history:
+        mark = '*' if previous_digest and entry['writer_digest'] != previous_digest else ' '
+        previous_digest = entry['writer_digest']
+        totals = ''.join(f"{entry['results'][name]['seconds']['total']:>9.3f}"
+                         if name in entry['results'] else f"{'':>9}" for name in names)
+        print(f"{entry['date'][:19]:<20} {(entry['commit'] or '-')[:8]:<9} "
+              f"{entry['writer_digest']}{mark}{totals}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--cases', default=','.join(CASES), help='Casos a medir (ver CASES)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='Aumento relativo que cuenta como regresión')
+    parser.add_argument('--history', type=Path, default=HISTORY, help='Historial (JSON lines)')
+    parser.add_argument('--no-save', action='store_true', help='No agrega la ejecución al historial')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='Termina con código 1 si alguna etapa empeoró')
+    parser.add_argument('--history-report', action='store_true', help='Muestra el historial')
+    parser.add_argument('--json', action='store_true', help='Salida JSON')
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(json.loads(args.run_case), args.repeat)))
+        return
+    history = load_history(args.history)
+    if args.history_report:
+        history_report(history)
+        return
+
+    names = [name.strip() for name in args.cases.split(',') if name.strip()]
+    unknown = set(names) - set(CASES)
+    if unknown:
+        parser.error(f"Casos desconocidos: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in names:
+        # Un proceso por caso: el pico de RSS es el de ese caso
+        output = subprocess.run([sys.executable, __file__, '--run-case', json.dumps(CASES[name]),
+                                 '--repeat', str(args.repeat)],
+                                capture_output=True, text=True, check=True).stdout
+        results[name] = json.loads(output)
+
+    status = _git('status', '--porcelain', '--', 'src')
+    entry = {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': _git('rev-parse', 'HEAD'),
+        'dirty': bool(status),
+        'writer_digest': _writer_digest(),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+    comparison = compare(results, history, args.threshold)
+    if not args.no_save:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+
+    if args.json:
+        print(json.dumps({'entry': entry, 'regressions': {
+            name: c['regressions'] for name, c in comparison.items()}}, indent=2))
+    else:
+        print(f"{'caso':<4} {'fases':>5} {'tareas':>6} {'sem':>4} {'KB':>3} "
+              + ''.join(f"{stage[:9]:>10}" for stage in STAGES)
+              + f"{'total':>9} {'RSS MB':>7} {'py MB':>6} {'docx KB':>8}")
+        for name, r in results.items():
+            size = r['size']
+            before = comparison.get(name)
+            flagged = before['regressions'] if before else []
+            cells = ''.join(f"{r['seconds'][stage]:>9.3f}{'!' if stage in flagged else ' '}"
+                            for stage in STAGES)
+            rss = '-' if r['peak_rss_mb'] is None else r['peak_rss_mb']
+            print(f"{name:<4} {size['phases']:>5} {size['tasks']:>6} {size['weeks']:>4} "
+                  f"{size['text_kb']:>3} {cells}{r['seconds']['total']:>8.3f}"
+                  f"{'!' if 'total' in flagged else ' '}{rss:>7} {r['python_peak_mb']:>6} "
+                  f"{r['docx_bytes'] / 1024:>8.0f}" + ('' if r['identical'] else '  (distinto)'))
+        for name, c in comparison.items():
+            if c['regressions']:
+                print(f"{name}: más lento que {(c['previous']['commit'] or '-')[:8]} "
+                      f"({c['previous']['date'][:19]}) en {', '.join(c['regressions'])}")
+
+    if args.fail_on_regression and any(c['regressions'] for c in comparison.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Benchmark de extracción de respuestas: response_parser vs. los parsers anteriores
+
+Corpus (a partir de las metodologías de los proyectos registrados):
+- Formas fijas: JSON directo, bloque ```json, bloque sin lenguaje, prosa alrededor (con
+  llaves), truncado con y sin bloque, codificación doble (string JSON, comillas escapadas,
+  dentro de un bloque) y saltos de línea CRLF
+- Fuzz: combinaciones aleatorias (semilla fija) de bloque, prosa, codificación y corte
+- Opcionalmente, respuestas crudas guardadas (--corpus DIR, p. ej. LLM_RESPONSE_CACHE_DIR)
+
+Éxito: el objeto extraído es idéntico al original; en las respuestas truncadas basta con
+un objeto, y se mide además la parte del contenido recuperada.
+
+Uso:
+    python benchmarks/bench_response_parser.py [--fuzz N] [--seed S] [--corpus DIR] [--repeat N]
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from src.json_repair import repair_json
+from src.response_parser import extract_json
+from bench_json_repair import load_project_methodologies
+
+
+def legacy_parse(response_text: str):
+    """Parser anterior de la metodología (_parse_json_response), sin la estructura de reserva"""
+    json_block_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', response_text)
+    if json_block_match:
+        json_str = json_block_match.group(1).strip()
+    else:
+        start = response_text.find('{')
+        end = response_text.rfind('}') + 1
+        if start < 0:
+            return None
+        json_str = response_text[start:end] if end > start else response_text[start:]
+    try:
+        data = json.loads(json_str)
+        return data if isinstance(data, dict) else None
+    except json.JSONDecodeError:
+        start = response_text.find('{')
+        try:
+            data = json.loads(repair_json(response_text[start:]))
+            return data if isinstance(data, dict) else None
+        except json.JSONDecodeError:
+            return None
+
+
+def legacy_extract(response_text: str):
+    """Extractor anterior de objetos simples (_extract_json_object)"""
+    start = response_text.find('{')
+    if start < 0:
+        return None
+    end = response_text.rfind('}') + 1
+    try:
+        data = json.loads(response_text[start:end])
+    except json.JSONDecodeError:
+        try:
+            data = json.loads(repair_json(response_text[start:]))
+        except json.JSONDecodeError:
+            return None
+    return data if isinstance(data, dict) else None
+
+
+PROSE_BEFORE = [
+    "Here is the methodology in JSON format:\n\n",
+    "Voici la méthodologie demandée {format JSON} :\n",
+    "Based on the ToR, I propose the following approach (see {phases} below).\n",
+]
+PROSE_AFTER = [
+    "\n\nLet me know if you need any {adjustments}.",
+    "\n\nNote: weeks are indicative {subject to inception}.",
+    "\n\n*This approach follows the {ToR} requirements.*",
+]
+
+
+def _wrap(text: str, fence: str = None, before: str = '', after: str = '') -> str:
+    if fence is not None:
+        text = f"```{fence}\n{text}\n```"
+    return before + text + after
+
+
+def _fixed_cases(name: str, methodology: dict) -> list:
+    """[(categoría, nombre, texto, esperado, truncado)] con las formas típicas"""
+    text = json.dumps(methodology, ensure_ascii=False, indent=2)
+    compact = json.dumps(methodology, ensure_ascii=False)
+    cases = [
+        ('direct', text, False),
+        ('fenced', _wrap(text, 'json'), False),
+        ('fenced_nolang', _wrap(text, ''), False),
+        ('prose', _wrap(text, None, PROSE_BEFORE[2], PROSE_AFTER[0]), False),
+        ('fenced_prose', _wrap(text, 'json', PROSE_BEFORE[1], PROSE_AFTER[1]), False),
+        ('double_encoded', json.dumps(compact, ensure_ascii=False), False),
+        ('escaped_quotes', json.dumps(text, ensure_ascii=False)[1:-1], False),
+        ('double_fenced', _wrap(json.dumps(text, ensure_ascii=False), 'json'), False),
+        ('crlf', _wrap(text, 'json').replace('\n', '\r\n'), False),
+    ]
+    for k in (4, 8, 12, 16, 20):
+        cut = int(len(text) * k / 24)
+        cases.append((f'truncated', _wrap(text[:cut], None, PROSE_BEFORE[0]), True))
+        cases.append((f'truncated_fenced', '```json\n' + text[:cut], True))
+    return [(category, f'{name}/{category}', case, methodology, truncated)
+            for category, case, truncated in cases]
+
+
+def _fuzz_cases(methodologies: dict, count: int, seed: int) -> list:
+    """Combinaciones aleatorias de envoltorio, codificación y corte"""
+    rng = random.Random(seed)
+    names = sorted(methodologies)
+    cases = []
+    for i in range(count):
+        name = rng.choice(names)
+        methodology = methodologies[name]
+        text = json.dumps(methodology, ensure_ascii=False, indent=rng.choice([None, 2, 4]))
+        truncated = rng.random() < 0.3
+        if truncated:
+            text = text[:rng.randint(len(text) // 10, len(text) - 2)]
+        encoding = rng.choice(['plain'] * 4 + ['double', 'escaped'])
+        if encoding == 'double' and not truncated:
+            text = json.dumps(text, ensure_ascii=False)
+        elif encoding == 'escaped':
+            text = json.dumps(text, ensure_ascii=False)[1:-1]
+        fence = rng.choice([None, None, 'json', 'JSON', ''])
+        wrapped = _wrap(text, fence,
+                        rng.choice([''] + PROSE_BEFORE), rng.choice([''] + PROSE_AFTER))
+        if truncated and fence is not None:
+            wrapped = wrapped[:wrapped.rfind('\n```')]
+        if rng.random() < 0.2:
+            wrapped = wrapped.replace('\n', '\r\n')
+        cases.append(('fuzz', f'fuzz/{i:04d}-{name}', wrapped, methodology, truncated))
+    return cases
+
+
+def build_corpus(fuzz: int, seed: int, corpus_dir: str = None) -> list:
+    """Retorna [(categoría, nombre, texto, esperado, truncado)]"""
+    methodologies = load_project_methodologies()
+    corpus = []
+    for name, methodology in methodologies.items():
+        corpus.extend(_fixed_cases(name, methodology))
+    corpus.extend(_fuzz_cases(methodologies, fuzz, seed))
+    if corpus_dir:
+        # Respuestas reales: se desconoce el original, cuenta como éxito obtener un objeto
+        for path in sorted(Path(corpus_dir).glob('*.txt')):
+            corpus.append(('real', f'real/{path.stem}', path.read_text(encoding='utf-8'),
+                           None, True))
+    return corpus
+
+
+def run(parse, corpus: list, repeat: int) -> dict:
+    """Tasa de éxito (total y por categoría), contenido recuperado y velocidad"""
+    by_category = {}
+    ok = 0
+    recovered = 0.0
+    total_bytes = 0
+    elapsed = 0.0
+    for category, name, text, expected, truncated in corpus:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            try:
+                data = parse(text)
+            except RecursionError:
+                data = None
+        elapsed += time.perf_counter() - started
+        total_bytes += len(text) * repeat
+
+        if truncated:
+            success = isinstance(data, dict) and bool(data)
+            if success and expected is not None:
+                size = len(json.dumps(data, ensure_ascii=False))
+                recovered += min(1.0, size / len(json.dumps(expected, ensure_ascii=False)))
+            elif success:
+                recovered += 1.0
+        else:
+            success = data == expected
+            recovered += 1.0 if success else 0.0
+        ok += success
+        stats = by_category.setdefault(category, [0, 0])
+        stats[0] += success
+        stats[1] += 1
+
+    cases = len(corpus)
+    return {
+        'cases': cases,
+        'success_rate': round(ok / cases, 4),
+        'recovered_share': round(recovered / cases, 4),
+        'seconds': round(elapsed, 4),
+        'mb_per_s': round(total_bytes / 1e6 / elapsed, 2) if elapsed else None,
+        'categories': {category: round(success / total, 4)
+                       for category, (success, total) in by_category.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--fuzz', type=int, default=300, help='Casos aleatorios')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--corpus', default=os.getenv('LLM_RESPONSE_CACHE_DIR'),
+                        help='Directorio con respuestas crudas (*.txt)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='Salida JSON')
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.fuzz, args.seed, args.corpus)
+    results = {
+        'legacy_parse': run(legacy_parse, corpus, args.repeat),
+        'legacy_extract': run(legacy_extract, corpus, args.repeat),
+        'response_parser': run(extract_json, corpus, args.repeat),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Corpus: {len(corpus)} respuestas (fuzz: {args.fuzz}, semilla {args.seed})")
+    print(f"{'parser':<16} {'éxito':>8} {'recuperado':>11} {'segundos':>9} {'MB/s':>7}")
+    for engine, r in results.items():
+        print(f"{engine:<16} {r['success_rate']:>8.1%} {r['recovered_share']:>11.1%} "
+              f"{r['seconds']:>9.3f} {r['mb_per_s']:>7}")
+    print()
+    categories = list(results['response_parser']['categories'])
+    print(f"{'categoría':<18}" + ''.join(f"{engine:>17}" for engine in results))
+    for category in categories:
+        print(f"{category:<18}" + ''.join(f"{r['categories'][category]:>17.1%}"
+                                          for r in results.values()))
+
+
+if __name__ == '__main__':
+    main()
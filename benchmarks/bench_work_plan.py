@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Work Plan con barras combinadas (merge_bars) frente a una celda por período
+
+Corpus: metodologías sintéticas (ver bench_writer.synthetic_methodology), con --weeks las
+barras largas de un plan semanal (cada tarea dura todo ese número de semanas; un plan de
+hasta 24 semanas se dibuja por semanas), y opcionalmente los proyectos registrados.
+
+Para cada caso cuenta las celdas (w:tc) de la tabla del Work Plan, mide word/document.xml,
+el .docx y el tiempo de renderizado (mejor de --repeat) con y sin merge_bars.
+
+Uso:
+    python benchmarks/bench_work_plan.py [--tasks 10,40,200] [--weeks 24] [--writer ooxml]
+                                         [--repeat N] [--projects] [--json]
+"""
+
+import io
+import sys
+import json
+import time
+import zipfile
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from bench_writer import synthetic_methodology, build_corpus
+from src.document_writer import create_word_document, WRITERS
+from src.translations import get_language_config
+
+
+def long_bars_methodology(num_tasks: int, weeks: int) -> dict:
+    """Metodología sintética semanal cuyas tareas ocupan las semanas 1..weeks"""
+    methodology = synthetic_methodology(num_tasks)
+    for phase in methodology['phases']:
+        phase['start_week'], phase['end_week'] = 1, weeks
+        for task in phase['tasks']:
+            task['start_week'], task['end_week'] = 1, weeks
+            for key in ('deliverable_week', 'event_week'):
+                if key in task:
+                    task[key] = min(task[key], weeks)
+    return methodology
+
+
+def render(methodology: dict, writer: str, lang_config: dict, repeat: int, **options) -> dict:
+    """Mejor tiempo, celdas de la tabla del Work Plan y tamaños"""
+    best = None
+    for _ in range(repeat):
+        buffer = io.BytesIO()
+        started = time.perf_counter()
+        create_word_document(methodology, buffer, lang_config, writer=writer, **options)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    with zipfile.ZipFile(buffer) as package:
+        document = package.read('word/document.xml')
+    # El Work Plan es la última tabla del documento
+    work_plan = document[document.rfind(b'<w:tbl>'):]
+    return {'seconds': round(best, 4), 'cells': work_plan.count(b'<w:tc>'),
+            'document_bytes': len(document), 'bytes': len(buffer.getvalue())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--tasks', default='10,40,200', help='Tareas de las metodologías sintéticas')
+    parser.add_argument('--weeks', type=int, default=24,
+                        help='Semanas de las barras largas (0 para omitir esos casos)')
+    parser.add_argument('--writer', default='ooxml', choices=WRITERS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--projects', action='store_true', help='Incluye los proyectos registrados')
+    parser.add_argument('--json', action='store_true', help='Salida JSON')
+    args = parser.parse_args()
+
+    task_counts = [int(count) for count in args.tasks.split(',') if count.strip()]
+    corpus = build_corpus(task_counts, args.projects)
+    if args.weeks:
+        corpus += [(f"long_bars_{count}x{args.weeks}w", long_bars_methodology(count, args.weeks),
+                    'en', {}) for count in task_counts]
+    create_word_document(synthetic_methodology(1), io.BytesIO(), get_language_config('en'),
+                         writer=args.writer)
+
+    results = {}
+    for name, methodology, language, options in corpus:
+        lang_config = get_language_config(language)
+        cells, merged = (render(methodology, args.writer, lang_config, args.repeat,
+                                merge_bars=merge_bars, **options)
+                         for merge_bars in (False, True))
+        results[name] = {'cells': cells, 'merged': merged}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'metodología':<26} {'celdas':>7} {'comb.':>6} {'xml KB':>8} {'comb.':>8} "
+          f"{'docx KB':>8} {'comb.':>7} {'s':>7} {'comb.':>7}")
+    for name, r in results.items():
+        before, after = r['cells'], r['merged']
+        print(f"{name:<26} {before['cells']:>7} {after['cells']:>6} "
+              f"{before['document_bytes'] / 1024:>8.1f} {after['document_bytes'] / 1024:>8.1f} "
+              f"{before['bytes'] / 1024:>8.1f} {after['bytes'] / 1024:>7.1f} "
+              f"{before['seconds']:>7.3f} {after['seconds']:>7.3f}")
+
+
+if __name__ == '__main__':
+    main()
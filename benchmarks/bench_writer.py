@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escritura del Word: python-docx (writer='docx') vs. OOXML directo ('ooxml')
+
+Corpus: metodologías sintéticas de 10, 50 y 200 tareas (5 tareas por fase, textos con
+negritas, viñetas y listas numeradas, entregables y eventos; las de más de 24 semanas
+usan meses en el Work Plan), más opcionalmente los proyectos registrados (--projects).
+
+Mide el tiempo de create_word_document (mejor de --repeat), el tamaño del .docx y de
+word/document.xml (sin comprimir) y verifica que word/document.xml sea idéntico con
+ambos escritores.
+
+Uso:
+    python benchmarks/bench_writer.py [--tasks 10,50,200] [--repeat N] [--projects] [--json]
+"""
+
+import io
+import sys
+import json
+import time
+import random
+import zipfile
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / 'benchmarks'))
+
+from src.document_writer import create_word_document, WRITERS
+from src.translations import get_language_config
+
+TASKS_PER_PHASE = 5
+
+_WORDS = ('analysis stakeholder institutional framework capacity assessment strategy '
+          'regional market validation workshop report baseline indicator governance '
+          'financial sustainability roadmap training platform survey consultation '
+          'methodology review diagnostic tourism investment partners data').split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    chosen = [rng.choice(_WORDS) for _ in range(words)]
+    if rng.random() < 0.4:
+        i = rng.randrange(len(chosen))
+        chosen[i] = f"**{chosen[i]}**"
+    return ' '.join(chosen).capitalize() + '.'
+
+
+def _prose(rng: random.Random, sentences: int, lists: bool = True) -> str:
+    blocks = [' '.join(_sentence(rng, rng.randint(8, 20)) for _ in range(sentences))]
+    if lists and rng.random() < 0.6:
+        blocks.append('\n'.join(f"- {_sentence(rng, 6)}" for _ in range(rng.randint(2, 4))))
+    if lists and rng.random() < 0.3:
+        blocks.append('\n'.join(f"{i + 1}. {_sentence(rng, 6)}" for i in range(3)))
+    return '\n\n'.join(blocks)
+
+
+def synthetic_methodology(num_tasks: int, seed: int = 1) -> dict:
+    """Metodología sintética con num_tasks tareas en fases de TASKS_PER_PHASE"""
+    rng = random.Random(seed)
+    phases = []
+    week = 1
+    deliverable = 0
+    for p_idx in range((num_tasks + TASKS_PER_PHASE - 1) // TASKS_PER_PHASE):
+        count = min(TASKS_PER_PHASE, num_tasks - p_idx * TASKS_PER_PHASE)
+        phase_start, tasks, deliverables = week, [], []
+        for t_idx in range(count):
+            start = week + rng.randint(0, 2)
+            end = start + rng.randint(1, 6)
+            task = {'code': f"{p_idx + 1}{chr(ord('A') + t_idx)}",
+                    'title': _sentence(rng, 5)[:-1].replace('**', ''),
+                    'description': _prose(rng, rng.randint(3, 6)),
+                    'items': [_sentence(rng, 5) for _ in range(rng.randint(0, 3))],
+                    'start_week': start, 'end_week': end}
+            if rng.random() < 0.5:
+                deliverable += 1
+                task['deliverable_week'] = end
+                task['deliverable_code'] = f"D{deliverable}"
+                deliverables.append({'code': f"D{deliverable}", 'name': _sentence(rng, 8)})
+            elif rng.random() < 0.5:
+                task['event_week'] = start
+                task['event_code'] = f"E{p_idx + 1}"
+            tasks.append(task)
+            week = max(week, start)
+        phase_end = max(task['end_week'] for task in tasks)
+        phases.append({'title': f"Phase {p_idx + 1}: {_sentence(rng, 4)[:-1]}".replace('**', ''),
+                       'description': _prose(rng, 3, lists=False),
+                       'start_week': phase_start, 'end_week': phase_end,
+                       'tasks': tasks, 'deliverables': deliverables})
+        week = phase_end - rng.randint(0, 2)
+    return {
+        'introduction': _prose(rng, 5, lists=False),
+        'context': _prose(rng, 8),
+        'principles': [{'name': _sentence(rng, 3)[:-1].replace('**', ''),
+                        'description': _prose(rng, 3, lists=False)} for _ in range(6)],
+        'phases': phases,
+        'risks': _prose(rng, 5),
+        'quality': _prose(rng, 5),
+    }
+
+
+def render(methodology: dict, writer: str, lang_config: dict, repeat: int, **render_options) -> dict:
+    """Mejor tiempo de repeat renderizados, tamaño del .docx y su word/document.xml"""
+    best = None
+    for _ in range(repeat):
+        buffer = io.BytesIO()
+        started = time.perf_counter()
+        create_word_document(methodology, buffer, lang_config, writer=writer, **render_options)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    with zipfile.ZipFile(buffer) as package:
+        document = package.read('word/document.xml')
+    return {'seconds': round(best, 4), 'bytes': len(buffer.getvalue()), 'document': document}
+
+
+def build_corpus(task_counts: list, projects: bool) -> list:
+    """[(nombre, metodología, idioma, opciones de renderizado)]"""
+    corpus = [(f"synthetic_{count}", synthetic_methodology(count), 'en', {})
+              for count in task_counts]
+    if projects:
+        from src.project_registry import list_projects, load_project
+        for project_id, info in list_projects().items():
+            corpus.append((project_id, load_project(project_id), info['language'],
+                           info.get('render', {})))
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--tasks', default='10,50,200', help='Tareas de las metodologías sintéticas')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--projects', action='store_true', help='Incluye los proyectos registrados')
+    parser.add_argument('--json', action='store_true', help='Salida JSON')
+    args = parser.parse_args()
+
+    task_counts = [int(count) for count in args.tasks.split(',') if count.strip()]
+    # Primer renderizado fuera de la medición (importaciones y documento base)
+    warmup = synthetic_methodology(1)
+    for writer in WRITERS:
+        create_word_document(warmup, io.BytesIO(), get_language_config('en'), writer=writer)
+
+    results = {}
+    for name, methodology, language, options in build_corpus(task_counts, args.projects):
+        lang_config = get_language_config(language)
+        runs = {writer: render(methodology, writer, lang_config, args.repeat, **options)
+                for writer in WRITERS}
+        docx_run, ooxml_run = runs['docx'], runs['ooxml']
+        results[name] = {
+            'tasks': sum(len(phase['tasks']) for phase in methodology['phases']),
+            'docx': {key: docx_run[key] for key in ('seconds', 'bytes')},
+            'ooxml': {key: ooxml_run[key] for key in ('seconds', 'bytes')},
+            'document_bytes': len(ooxml_run['document']),
+            'speedup': round(docx_run['seconds'] / ooxml_run['seconds'], 1),
+            'identical': docx_run['document'] == ooxml_run['document'],
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'metodología':<26} {'tareas':>6} {'docx (s)':>9} {'ooxml (s)':>10} {'x':>6} "
+          f"{'docx KB':>8} {'ooxml KB':>9} {'xml KB':>7} {'idéntico':>9}")
+    for name, r in results.items():
+        print(f"{name:<26} {r['tasks']:>6} {r['docx']['seconds']:>9.3f} "
+              f"{r['ooxml']['seconds']:>10.4f} {r['speedup']:>6} "
+              f"{r['docx']['bytes'] / 1024:>8.1f} {r['ooxml']['bytes'] / 1024:>9.1f} "
+              f"{r['document_bytes'] / 1024:>7.1f} "
+              f"{'sí' if r['identical'] else 'NO':>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,21 +3,99 @@
 Metodologías RFPs - Generador de enfoques metodológicos para consultoría
 """
 
+import json
+import time
+import functools
+from contextlib import contextmanager
+
 import click
 from pathlib import Path
 from dotenv import load_dotenv
 
 from src.tdr_parser import parse_tdr
 from src.methodology_generator import generate_methodology, detect_methodology_type
-from src.document_writer import create_word_document
-from src.translations import get_language_config
+from src.document_writer import create_word_document, WRITERS
+from src.preview_writer import create_preview, PREVIEW_FORMATS
+from src.methodology_model import validate_methodology
+from src.translations import get_language_config, LANGUAGES
+from src.translator import generate_multilingual
+from src.llm_backends import get_backend
+from src.deadline import Deadline
+from src.artifacts import save_artifact, load_artifact, find_artifacts
+from src.project_registry import (
+    PROJECTS_DIR, list_projects, get_project_info, load_project, project_tdr, render_project,
+    render_projects
+)
+from src.methodology_lint import lint_artifacts, format_lint_report, count_findings
+from src.word_counts import analyze_artifacts, format_word_report
+from src.schedule import parse_start_date
+from src.schedule_analysis import analyze_schedule, format_analysis, DEFAULT_ROLE_CAPACITY
+from src import profiling
 
 load_dotenv()
 
+# Problemas de esquema que se muestran por idioma antes de resumir
+MAX_SCHEMA_WARNINGS = 10
+
+
+class DefaultCommandGroup(click.Group):
+    """Grupo que ejecuta 'generate' si no se indica subcomando (main.py --tdr ... sigue funcionando)"""
+
+    default_command = 'generate'
+
+    def parse_args(self, ctx, args):
+        if not args or (args[0] not in self.commands and args[0] not in ctx.help_option_names):
+            args = [self.default_command] + list(args)
+        return super().parse_args(ctx, args)
+
+
+@contextmanager
+def _profiled(profile: bool, profile_output: str):
+    """Con --profile o --profile-output, árbol de tiempos al terminar y volcado opcional"""
+    if not (profile or profile_output):
+        yield
+        return
+    use_cprofile = bool(profile_output) and Path(profile_output).suffix.lower() in profiling.PSTATS_SUFFIXES
+    profiler = profiling.start(cprofile=use_cprofile)
+    try:
+        yield
+    finally:
+        profiling.stop()
+        click.echo("\nPerfil de tiempos:")
+        click.echo(profiler.format_tree())
+        if profile_output:
+            profiler.dump(profile_output)
+            click.echo(f"Perfil guardado: {profile_output}")
+
 
-@click.command()
-@click.option('--tdr', required=True, type=click.Path(exists=True),
+def _profile_options(command):
+    """Opciones --profile y --profile-output de un comando"""
+    @click.option('--profile', is_flag=True,
+                  help='Muestra al terminar el árbol de tiempos de cada etapa')
+    @click.option('--profile-output', default=None,
+                  help='Guarda el perfil: .prof/.pstats (cProfile) u otro archivo con pilas '
+                       'plegadas para flamegraph (implica --profile)')
+    @functools.wraps(command)
+    def wrapper(*args, profile: bool, profile_output: str, **kwargs):
+        with _profiled(profile, profile_output):
+            return command(*args, **kwargs)
+    return wrapper
+
+
+@click.group(cls=DefaultCommandGroup)
+def main():
+    """
+    Metodologías RFPs: genera enfoques metodológicos en Word a partir de TdR.
+
+    Sin subcomando se ejecuta 'generate'.
+    """
+
+
+@main.command()
+@click.option('--tdr', default=None, type=click.Path(exists=True),
               help='Archivo de Términos de Referencia (PDF, DOCX, TXT)')
+@click.option('--project', '-p', 'project_id', default=None,
+              help='Proyecto registrado: regenera a partir de su TdR guardado en projects/')
 @click.option('--idioma', default='es', type=click.Choice(['es', 'en', 'fr', 'pt']),
               help='Idioma del documento de salida')
 @click.option('--tipo', default='auto',
@@ -25,7 +103,39 @@ load_dotenv()
               help='Tipo de metodología: auto (detectar), general, feasibility, info_systems')
 @click.option('--output', default='metodologia.docx',
               help='Nombre del archivo de salida')
-def main(tdr: str, idioma: str, tipo: str, output: str):
+@click.option('--backend', default=None, type=click.Choice(['perplexity', 'anthropic', 'stub']),
+              help='Backend de LLM (por defecto LLM_BACKEND o perplexity)')
+@click.option('--tiered', is_flag=True,
+              help='Generación en dos niveles: modelo rápido para el esqueleto, fuerte para la redacción')
+@click.option('--outline-model', default=None,
+              help='Modelo para el esqueleto en modo --tiered (por defecto, el modelo rápido del backend)')
+@click.option('--prose-model', default=None,
+              help='Modelo para la redacción en modo --tiered (por defecto, el modelo principal del backend)')
+@click.option('--deadline', default=None, type=float,
+              help='Presupuesto total en segundos: se recortan secciones para entregar a tiempo')
+@click.option('--idiomas', default=None,
+              help='Varios idiomas separados por comas (p. ej. fr,en): se genera una vez y se traduce')
+@click.option('--pivote', default=None, type=click.Choice(['es', 'en', 'fr', 'pt']),
+              help='Idioma en el que se genera con --idiomas (por defecto, el primero)')
+@click.option('--save-json', default=None,
+              help='Guarda la metodología generada (.json, o .jsonz compacto) para re-renderizar')
+@click.option('--from-json', default=None, type=click.Path(exists=True),
+              help='Renderiza un artefacto guardado (o todos los de un directorio) sin llamar al LLM')
+@click.option('--inicio', default=None,
+              help='Fecha de inicio del proyecto (AAAA-MM-DD): el Work Plan usa meses del calendario')
+@click.option('--writer', default='docx', type=click.Choice(WRITERS),
+              help='Escritor del Word: python-docx u OOXML directo (mismo resultado, más rápido)')
+@click.option('--merge-bars', is_flag=True,
+              help='Work Plan con cada barra en una sola celda combinada (menos celdas)')
+@click.option('--phase-workers', default=1, type=click.IntRange(min=1),
+              help='Procesos para dibujar las fases en paralelo (por defecto, en serie)')
+@click.option('--incremental', is_flag=True,
+              help='Reutiliza las secciones ya dibujadas que no cambiaron (caché de secciones)')
+@_profile_options
+def generate(tdr: str, project_id: str, idioma: str, tipo: str, output: str, backend: str,
+         tiered: bool, outline_model: str, prose_model: str, deadline: float, idiomas: str,
+         pivote: str, save_json: str, from_json: str, inicio: str, writer: str,
+         merge_bars: bool, phase_workers: int, incremental: bool):
     """
     Genera un documento Word con enfoque metodológico basado en TdR.
 
@@ -36,16 +146,52 @@ def main(tdr: str, idioma: str, tipo: str, output: str):
     - general: Metodología general para proyectos de estrategia, marketing, capacity building
     - feasibility: Estudios de factibilidad con análisis financiero y técnico
     - info_systems: Desarrollo de sistemas de información, websites, plataformas
+
+    Con --project se usa el TdR guardado del proyecto registrado. Con --from-json se
+    omiten el TdR y el LLM: solo se renderiza el Word.
     """
+    # El presupuesto empieza a contar desde el inicio de la ejecución
+    run_deadline = Deadline(deadline)
+    report = {}
+    try:
+        start_date = parse_start_date(inicio) if inicio else None
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--inicio')
+
+    if from_json:
+        _render_artifacts(from_json, output, idioma, run_deadline, report, start_date, writer,
+                          merge_bars, phase_workers, incremental)
+        return
+    if project_id:
+        if tdr:
+            raise click.UsageError("Indique --tdr o --project, no ambos")
+        try:
+            tdr = project_tdr(project_id)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint='--project')
+        if tdr is None:
+            raise click.BadParameter(f"El proyecto {project_id} no tiene TdR guardado",
+                                     param_hint='--project')
+    if not tdr:
+        raise click.UsageError("Indique --tdr, --project o --from-json")
+
     click.echo(f"Procesando TdR: {tdr}")
 
-    # Configurar idioma
-    lang_config = get_language_config(idioma)
-    click.echo(f"Idioma seleccionado: {lang_config['name']}")
+    # Configurar idioma(s)
+    languages = [idioma]
+    if idiomas:
+        languages = [code.strip() for code in idiomas.split(',') if code.strip()]
+        unknown = [code for code in languages if code not in LANGUAGES]
+        if unknown:
+            raise click.BadParameter(f"Idiomas no soportados: {', '.join(unknown)}",
+                                     param_hint='--idiomas')
+    pivot = pivote or languages[0]
+    lang_config = get_language_config(pivot)
+    click.echo(f"Idioma seleccionado: {', '.join(get_language_config(code)['name'] for code in languages)}")
 
     # Parsear TdR
     click.echo("Analizando Términos de Referencia...")
-    tdr_content = parse_tdr(Path(tdr))
+    tdr_content = parse_tdr(Path(tdr), deadline=run_deadline, report=report)
 
     # Detectar o usar tipo especificado
     if tipo == 'auto':
@@ -55,17 +201,338 @@ def main(tdr: str, idioma: str, tipo: str, output: str):
         methodology_type = tipo
         click.echo(f"Tipo de metodología seleccionado: {methodology_type}")
 
-    # Generar metodología con Claude
+    # Generar metodología con el backend de LLM
+    llm_backend = get_backend(backend)
+    click.echo(f"Backend de LLM: {llm_backend.name} ({llm_backend.model})")
     click.echo("Generando enfoque metodológico (esto puede tomar unos minutos)...")
-    methodology = generate_methodology(tdr_content, lang_config, methodology_type)
+    generation_kwargs = dict(tiered=tiered,
+                             tier_models={'outline': outline_model, 'prose': prose_model},
+                             report=report, deadline=run_deadline, on_event=_echo_progress)
+    if len(languages) > 1:
+        # Generar una vez en el idioma pivote y traducir en paralelo al resto
+        methodologies = generate_multilingual(tdr_content, languages, pivot, methodology_type,
+                                              backend=llm_backend, **generation_kwargs)
+    else:
+        methodologies = {pivot: generate_methodology(tdr_content, lang_config, methodology_type,
+                                                     backend=llm_backend, **generation_kwargs)}
+    for tier, info in report.get('tiers', {}).items():
+        click.echo(f"  Nivel {tier}: {info['model']} - {info['seconds']:.1f} s")
+    if 'translation_seconds' in report:
+        click.echo(f"  Traducción: {report['translation_seconds']:.1f} s")
+    for lang, paths in report.get('untranslated', {}).items():
+        click.echo(f"  Aviso: {len(paths)} textos sin traducir al {lang} (se mantiene el pivote)")
+    for error in report.get('errors', []):
+        click.echo(f"  Aviso: {error}")
+    for lang, methodology in methodologies.items():
+        schema_errors = validate_methodology(methodology)
+        for error in schema_errors[:MAX_SCHEMA_WARNINGS]:
+            click.echo(f"  Aviso ({lang}): {error}")
+        if len(schema_errors) > MAX_SCHEMA_WARNINGS:
+            click.echo(f"  Aviso ({lang}): {len(schema_errors) - MAX_SCHEMA_WARNINGS} problemas más de esquema")
+
+    # Guardar la metodología para poder re-renderizar sin el LLM
+    if save_json:
+        for lang, methodology in methodologies.items():
+            path = _output_for_language(save_json, lang) if len(methodologies) > 1 else save_json
+            save_artifact(methodology, path, lang, methodology_type, source=str(tdr))
+            click.echo(f"Metodología guardada: {path}")
 
-    # Crear documento Word
-    click.echo(f"Creando documento: {output}")
-    create_word_document(methodology, output, lang_config)
+    # Crear un documento Word por idioma
+    outputs = []
+    for lang, methodology in methodologies.items():
+        lang_output = _output_for_language(output, lang) if len(methodologies) > 1 else output
+        click.echo(f"Creando documento: {lang_output}")
+        create_word_document(methodology, lang_output, get_language_config(lang),
+                             deadline=run_deadline, report=report, start_date=start_date,
+                             writer=writer, merge_bars=merge_bars,
+                             phase_workers=phase_workers, incremental=incremental)
+        if not outputs:
+            # El cronograma es el mismo en todos los idiomas: se avisa una vez
+            _echo_schedule_issues(report, lang)
+        outputs.append(lang_output)
 
-    click.echo(f"\n✓ Documento generado exitosamente: {output}")
+    click.echo(f"\n✓ Documento generado exitosamente: {', '.join(outputs)}")
     click.echo(f"  Tipo de metodología: {methodology_type}")
-    click.echo(f"  Idioma: {lang_config['name']}")
+    click.echo(f"  Idioma: {', '.join(get_language_config(lang)['name'] for lang in methodologies)}")
+    if run_deadline.limited:
+        click.echo(f"  Tiempo: {run_deadline.elapsed():.1f} s de {deadline:.0f} s")
+        cuts = report.get('cuts', [])
+        click.echo(f"  Recortes aplicados: {len(cuts) or 'ninguno'}")
+        for cut in cuts:
+            click.echo(f"    - {cut}")
+
+
+@main.command()
+@click.option('--project', '-p', 'project_ids', multiple=True,
+              help='Proyecto del registro (repetible); ver "main.py projects"')
+@click.option('--all', 'render_all', is_flag=True, help='Renderiza todos los proyectos registrados')
+@click.option('--output-dir', default='output', help='Directorio de salida')
+@click.option('--workers', default=None, type=int,
+              help='Procesos en paralelo con varios proyectos (por defecto, los núcleos disponibles)')
+@click.option('--writer', default='docx', type=click.Choice(WRITERS),
+              help='Escritor del Word: python-docx u OOXML directo')
+@click.option('--merge-bars', is_flag=True,
+              help='Work Plan con cada barra en una sola celda combinada (menos celdas)')
+@click.option('--phase-workers', default=1, type=click.IntRange(min=1),
+              help='Procesos para dibujar las fases en paralelo (por defecto, en serie)')
+@click.option('--incremental', is_flag=True,
+              help='Reutiliza las secciones ya dibujadas que no cambiaron (caché de secciones)')
+@_profile_options
+def render(project_ids: tuple, render_all: bool, output_dir: str, workers: int, writer: str,
+           merge_bars: bool, phase_workers: int, incremental: bool):
+    """
+    Renderiza proyectos del registro (projects/) sin llamar al LLM.
+
+    Con --profile los proyectos se renderizan uno tras otro en este proceso, para que el
+    árbol de tiempos los incluya.
+    """
+    if not project_ids and not render_all:
+        raise click.UsageError("Indique --project o --all")
+
+    started = time.perf_counter()
+    try:
+        if (len(project_ids) == 1 and not render_all) or profiling.active():
+            results = {}
+            for project_id in list(list_projects()) if render_all else project_ids:
+                project_started = time.perf_counter()
+                results[project_id] = (render_project(project_id, output_dir, writer=writer,
+                                                      merge_bars=merge_bars,
+                                                      phase_workers=phase_workers,
+                                                      incremental=incremental),
+                                       time.perf_counter() - project_started)
+        else:
+            results = render_projects(None if render_all else project_ids, output_dir, workers,
+                                      writer, merge_bars, phase_workers, incremental)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--project')
+
+    failed = 0
+    for project_id, result in results.items():
+        if isinstance(result, Exception):
+            failed += 1
+            click.echo(f"✗ {project_id}: {result}")
+        else:
+            path, seconds = result
+            click.echo(f"✓ {project_id} -> {path} ({seconds:.2f} s)")
+    click.echo(f"\n{len(results) - failed} documentos en {time.perf_counter() - started:.1f} s")
+    if failed:
+        raise SystemExit(1)
+
+
+@main.command()
+def projects():
+    """Lista los proyectos del registro (TdR: tiene el TdR guardado, ver generate --project)."""
+    for project_id, info in list_projects().items():
+        variant = f"  (variante de {info['variant_of']})" if info.get('variant_of') else ''
+        tdr = 'TdR' if info.get('tdr') else ''
+        click.echo(f"{project_id:<28} {info['language']}  {tdr:<3}  {info['title']}{variant}")
+
+
+@main.command()
+@click.option('--project', '-p', 'project_id', default=None,
+              help='Proyecto del registro a analizar')
+@click.option('--from-json', default=None, type=click.Path(exists=True, dir_okay=False),
+              help='Artefacto de metodología a analizar')
+@click.option('--granularidad', default='auto',
+              type=click.Choice(['auto', 'week', 'month', 'calendar']),
+              help='Períodos de la carga por rol (calendar requiere --inicio)')
+@click.option('--inicio', default=None, help='Fecha de inicio del proyecto (AAAA-MM-DD)')
+@click.option('--capacidad', multiple=True,
+              help='Tareas simultáneas por rol: N para todos o ROL=N (repetible)')
+@click.option('--json', 'as_json', is_flag=True, help='Salida en JSON')
+def schedule(project_id: str, from_json: str, granularidad: str, inicio: str,
+             capacidad: tuple, as_json: bool):
+    """Ruta crítica, holgura y carga por rol del cronograma de una metodología."""
+    if bool(project_id) == bool(from_json):
+        raise click.UsageError("Indique --project o --from-json")
+    try:
+        methodology = (load_project(project_id) if project_id
+                       else load_artifact(from_json)['methodology'])
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--project' if project_id else '--from-json')
+    try:
+        start_date = parse_start_date(inicio) if inicio else None
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--inicio')
+
+    capacity, default_capacity = {}, DEFAULT_ROLE_CAPACITY
+    for value in capacidad:
+        role, _, limit = value.rpartition('=')
+        if not limit.strip().isdigit():
+            raise click.BadParameter(f"Se esperaba N o ROL=N: {value}", param_hint='--capacidad')
+        if role.strip():
+            capacity[role.strip()] = int(limit)
+        else:
+            default_capacity = int(limit)
+
+    try:
+        analysis = analyze_schedule(methodology, granularidad, start_date, capacity,
+                                    default_capacity)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    if as_json:
+        click.echo(json.dumps(analysis, ensure_ascii=False, indent=2))
+    else:
+        click.echo(format_analysis(analysis))
+
+
+@main.command()
+@click.option('--project', '-p', 'project_id', default=None,
+              help='Proyecto del registro a previsualizar')
+@click.option('--from-json', default=None, type=click.Path(exists=True, dir_okay=False),
+              help='Artefacto de metodología a previsualizar')
+@click.option('--format', 'fmt', default='html', type=click.Choice(PREVIEW_FORMATS),
+              help='HTML para el navegador o Markdown')
+@click.option('--output', default='-', help='Archivo de salida (por defecto, la consola)')
+@click.option('--idioma', default=None, type=click.Choice(['es', 'en', 'fr', 'pt']),
+              help='Idioma de títulos y etiquetas (por defecto, el del proyecto o artefacto)')
+@click.option('--inicio', default=None, help='Fecha de inicio: Work Plan en meses del calendario')
+@click.option('--merge-bars', is_flag=True, help='Work Plan con cada barra en una sola celda')
+def preview(project_id: str, from_json: str, fmt: str, output: str, idioma: str, inicio: str,
+            merge_bars: bool):
+    """Vista previa HTML o Markdown de una metodología, sin generar el Word."""
+    if bool(project_id) == bool(from_json):
+        raise click.UsageError("Indique --project o --from-json")
+    try:
+        if project_id:
+            methodology, language = load_project(project_id), get_project_info(project_id)['language']
+        else:
+            artifact = load_artifact(from_json)
+            methodology, language = artifact['methodology'], artifact.get('language')
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--project' if project_id else '--from-json')
+    try:
+        start_date = parse_start_date(inicio) if inicio else None
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint='--inicio')
+
+    text = create_preview(methodology, get_language_config(idioma or language or 'es'), fmt,
+                          start_date=start_date, merge_bars=merge_bars)
+    if output == '-':
+        click.echo(text, nl=False)
+    else:
+        Path(output).write_text(text, encoding='utf-8')
+        click.echo(f"✓ Vista previa -> {output}")
+
+
+@main.command()
+@click.argument('paths', nargs=-1, type=click.Path(exists=True))
+@click.option('--json', 'as_json', is_flag=True, help='Salida en JSON')
+@click.option('--quiet', '-q', is_flag=True, help='Solo el resumen por metodología')
+@click.option('--strict', is_flag=True, help='Los avisos también hacen fallar la revisión')
+def lint(paths: tuple, as_json: bool, quiet: bool, strict: bool):
+    """
+    Revisa la consistencia de metodologías guardadas (por defecto, projects/).
+
+    Acepta artefactos y directorios; termina con código 1 si hay errores.
+    """
+    batch = lint_artifacts(list(paths) or [PROJECTS_DIR])
+    if as_json:
+        click.echo(json.dumps(batch, ensure_ascii=False, indent=2))
+    else:
+        click.echo(format_lint_report(batch, verbose=not quiet))
+
+    errors = warnings = 0
+    for findings in batch['results'].values():
+        file_errors, file_warnings = count_findings(findings)
+        errors += file_errors
+        warnings += file_warnings
+    if errors or (strict and warnings):
+        raise SystemExit(1)
+
+
+@main.command()
+@click.argument('paths', nargs=-1, type=click.Path(exists=True))
+@click.option('--scale', default=1.0, type=float,
+              help='Escala de los objetivos (la de la generación con --deadline; por defecto 1)')
+@click.option('--tolerance', default=0.0, type=float,
+              help='Margen relativo antes de marcar una sección (p. ej. 0.1 = ±10 %)')
+@click.option('--empty', 'show_empty', is_flag=True, help='Lista también las secciones vacías')
+@click.option('--json', 'as_json', is_flag=True, help='Salida en JSON (un registro por sección)')
+def words(paths: tuple, scale: float, tolerance: float, show_empty: bool, as_json: bool):
+    """
+    Palabras por sección frente a los objetivos de los prompts (por defecto, projects/).
+    """
+    batch = analyze_artifacts(list(paths) or [PROJECTS_DIR], scale, tolerance)
+    if as_json:
+        click.echo(json.dumps(batch, ensure_ascii=False, indent=2))
+        return
+
+    show = ('under', 'over', 'empty') if show_empty else ('under', 'over')
+    for source, analysis in batch['results'].items():
+        in_range = sum(1 for record in analysis['sections'] if record['status'] == 'ok')
+        click.echo(f"{Path(source).name}: {in_range} de {len(analysis['sections'])} "
+                   f"secciones en rango")
+        click.echo(format_word_report(analysis, show))
+        click.echo("")
+    for reason in batch['skipped'].values():
+        click.echo(f"Omitido: {reason}")
+
+
+def _echo_progress(event):
+    """Muestra cada parte de la metodología a medida que el modelo la termina"""
+    if event.kind == 'phase':
+        title = event.value.get('title', '') if isinstance(event.value, dict) else ''
+        click.echo(f"  ✓ {title or f'Fase {event.index + 1}'}")
+    elif event.kind == 'principles':
+        click.echo(f"  ✓ {event.value} principios")
+    elif event.kind == 'end':
+        if not event.value:
+            click.echo("  Aviso: respuesta incompleta, se repara lo recibido")
+    elif event.kind not in ('principle', 'phases'):
+        click.echo(f"  ✓ {event.kind}")
+
+
+def _echo_schedule_issues(report: dict, label: str):
+    """Avisos del cronograma (tareas fuera de su fase, entregables solapados)"""
+    for issue in report.get('schedule_issues', []):
+        click.echo(f"  Aviso de cronograma ({label}): {issue}")
+
+
+def _output_for_language(output: str, lang: str) -> str:
+    """Agrega el código de idioma al nombre de archivo: metodologia.docx -> metodologia_fr.docx"""
+    path = Path(output)
+    return str(path.with_name(f"{path.stem}_{lang}{path.suffix or '.docx'}"))
+
+
+def _render_artifacts(source: str, output: str, idioma: str, run_deadline: Deadline,
+                      report: dict, start_date=None, writer: str = 'docx',
+                      merge_bars: bool = False, phase_workers: int = 1,
+                      incremental: bool = False):
+    """
+    Renderiza artefactos guardados con --save-json
+
+    Con un directorio, cada artefacto se escribe como <nombre>.docx en --output si es un
+    directorio (o no tiene extensión), y si no junto al artefacto.
+    """
+    artifacts = find_artifacts(source)
+    if not artifacts:
+        raise click.BadParameter(f"No hay artefactos .json/.jsonz en {source}",
+                                 param_hint='--from-json')
+    bulk = Path(source).is_dir()
+    output_dir = Path(output) if bulk and (Path(output).is_dir() or not Path(output).suffix) else None
+
+    for path in artifacts:
+        started = time.perf_counter()
+        artifact = load_artifact(path)
+        lang = artifact.get('language') or idioma
+        if not bulk:
+            target = output
+        else:
+            target = str((output_dir or path.parent) / f"{path.stem}.docx")
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+
+        for error in validate_methodology(artifact['methodology'])[:MAX_SCHEMA_WARNINGS]:
+            click.echo(f"  Aviso ({path.name}): {error}")
+        create_word_document(artifact['methodology'], target, get_language_config(lang),
+                             deadline=run_deadline, report=report, start_date=start_date,
+                             writer=writer, merge_bars=merge_bars,
+                             phase_workers=phase_workers, incremental=incremental)
+        _echo_schedule_issues(report, path.name)
+        click.echo(f"✓ {path.name} -> {target} ({time.perf_counter() - started:.2f} s)")
+
+    for cut in report.get('cuts', []):
+        click.echo(f"  Recorte: {cut}")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,128 @@
+"""
+Artefactos de metodología guardados en disco, para volver a renderizar sin llamar al LLM
+
+Formato versionado: un sobre con metadatos (versión, idioma, tipo, origen) y la metodología.
+Se guarda como JSON legible o, con la extensión .jsonz, en una codificación binaria
+compacta: cabecera mágica + versión + JSON comprimido con zlib.
+"""
+
+import json
+import zlib
+import struct
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .methodology_model import Methodology
+from .profiling import timed
+
+
+FORMAT_NAME = 'metodologias-rfps/methodology'
+FORMAT_VERSION = 1
+
+# Codificación binaria: b'MRFP' + versión (uint16 big-endian) + JSON comprimido
+BINARY_MAGIC = b'MRFP'
+BINARY_HEADER = struct.Struct('>4sH')
+BINARY_SUFFIX = '.jsonz'
+ARTIFACT_SUFFIXES = ('.json', BINARY_SUFFIX)
+# Índice de proyectos de projects/ (ver project_registry): no es un artefacto
+REGISTRY_FILE = 'registry.json'
+
+# Migraciones de versiones anteriores: {versión: función(sobre) -> sobre de versión + 1}
+_MIGRATIONS = {}
+
+
+@timed
+def save_artifact(methodology, path, language: str, methodology_type: str = None,
+                  source: str = None, compact: bool = None) -> Path:
+    """
+    Guarda una metodología como artefacto versionado
+
+    Args:
+        methodology: Diccionario o Methodology
+        path: Archivo de destino (.json o .jsonz)
+        language: Código del idioma de la metodología
+        methodology_type: Tipo de metodología ('general', 'feasibility', 'info_systems')
+        source: Origen (p. ej. el archivo de TdR)
+        compact: Codificación binaria; por defecto según la extensión (.jsonz)
+
+    Returns:
+        Ruta del archivo guardado
+    """
+    path = Path(path)
+    if isinstance(methodology, Methodology):
+        methodology = methodology.to_dict()
+    if compact is None:
+        compact = path.suffix == BINARY_SUFFIX
+
+    envelope = {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'language': language,
+        'methodology_type': methodology_type,
+        'source': source,
+        'methodology': methodology,
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compact:
+        payload = json.dumps(envelope, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        path.write_bytes(BINARY_HEADER.pack(BINARY_MAGIC, FORMAT_VERSION) + zlib.compress(payload, 9))
+    else:
+        path.write_text(json.dumps(envelope, ensure_ascii=False, indent=2), encoding='utf-8')
+    return path
+
+
+@timed
+def load_artifact(path) -> dict:
+    """
+    Lee un artefacto (JSON o binario, detectado por la cabecera) y lo migra a la versión actual
+
+    Returns:
+        Sobre con 'version', 'language', 'methodology_type', 'source' y 'methodology'
+    """
+    path = Path(path)
+    data = path.read_bytes()
+
+    if data[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+        _, version = BINARY_HEADER.unpack_from(data)
+        try:
+            envelope = json.loads(zlib.decompress(data[BINARY_HEADER.size:]).decode('utf-8'))
+        except zlib.error as e:
+            raise ValueError(f"{path}: contenido binario dañado ({e})")
+        if envelope.get('version') != version:
+            raise ValueError(f"{path}: la versión de la cabecera ({version}) no coincide "
+                             f"con la del contenido ({envelope.get('version')})")
+    else:
+        envelope = json.loads(data.decode('utf-8'))
+
+    if not isinstance(envelope, dict):
+        raise ValueError(f"{path}: no es un artefacto de metodología")
+    if envelope.get('format') != FORMAT_NAME:
+        # Metodología sin sobre (p. ej. un JSON exportado a mano): se envuelve
+        if 'phases' in envelope:
+            return {'format': FORMAT_NAME, 'version': FORMAT_VERSION, 'language': None,
+                    'methodology_type': None, 'source': str(path), 'methodology': envelope}
+        raise ValueError(f"{path}: no es un artefacto de metodología")
+
+    version = envelope.get('version')
+    if not isinstance(version, int) or version > FORMAT_VERSION:
+        raise ValueError(f"{path}: versión de formato no soportada: {version} "
+                         f"(máxima {FORMAT_VERSION})")
+    while version < FORMAT_VERSION:
+        envelope = _MIGRATIONS[version](envelope)
+        version = envelope['version']
+    return envelope
+
+
+def find_artifacts(path) -> list:
+    """
+    Artefactos de una ruta: el propio archivo, o los .json/.jsonz de un directorio (ordenados,
+    sin el registro de proyectos)
+    """
+    path = Path(path)
+    if path.is_dir():
+        return sorted(p for p in path.iterdir()
+                      if p.suffix in ARTIFACT_SUFFIXES and p.name != REGISTRY_FILE
+                      and p.is_file())
+    return [path]
@@ -0,0 +1,309 @@
+"""
+Plantilla base Aninver: documento vacío con los estilos y márgenes del formato
+
+Los estilos (valores por defecto del documento, Section Heading, Title 1-3, Body Text,
+Bullet List y los estilos de tabla), la numeración y los márgenes se construyen una sola
+vez y se guardan como paquete .docx en disco, indexado por STYLE_VERSION y la versión de
+python-docx (su plantilla por defecto es el punto de partida). Cada documento clona la
+plantilla en memoria en lugar de rehacer los estilos; en un proceso nuevo basta con leer
+el archivo.
+
+Al cambiar _setup_aninver_styles o los márgenes hay que subir STYLE_VERSION. El
+directorio de la caché es DOCX_TEMPLATE_CACHE_DIR (por defecto ~/.cache/metodologias_rfp);
+si no se puede escribir, la plantilla se mantiene solo en memoria.
+"""
+
+import io
+import os
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+
+import docx
+from docx import Document
+from docx.shared import Pt, Inches, RGBColor
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn, nsdecls
+
+from .profiling import timed
+
+
+# Versión de los estilos y márgenes de la plantilla (subirla al cambiarlos)
+STYLE_VERSION = 2
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'metodologias_rfp'
+
+
+# Colores Aninver
+COLORS = {
+    'principle_header': 'BDD6EE',      # Azul claro - header de principios
+    'principle_title': '2E74B5',        # Azul oscuro - título de principio
+    'activities_header': '5B83DF',      # Azul - header "Activities"
+    'activities_body': 'F2F2F2',        # Gris claro - lista de actividades
+    'timeline': '00A798',               # Verde/Teal - "Timeline"
+    'gantt_active': 'FFC000',           # Amarillo/Naranja - celdas activas del Gantt
+    'experience_box': 'FFF2CC',         # Amarillo claro - cajas de experiencia
+    'deliverable_header': 'FFC000',     # Amarillo - header de entregable
+    'deliverable_body': 'FFF2CC',       # Amarillo claro - cuerpo de entregable
+}
+
+
+_TABLE_BORDERS = ('top', 'left', 'bottom', 'right', 'insideH', 'insideV')
+
+# Estilos de tabla: formato de toda la tabla y por zona (tblStylePr). Las zonas son
+# firstRow, lastRow, firstCol, nwCell (celda superior izquierda) y band1Horz/band2Horz
+# (filas alternas tras el encabezado). Lo que depende de los datos (celdas activas del
+# Gantt, fases del Work Plan, principios presentes) se sombrea por celda.
+TABLE_STYLES = {
+    'Aninver Principles Table': {
+        'space': Pt(3), 'borders': False, 'row_bands': True,
+        'conditional': {'firstRow': {'bold': True},
+                        'band1Horz': {'bold': True, 'color': 'FFFFFF'}},
+    },
+    'Aninver Activities Table': {
+        'fill': COLORS['activities_body'],
+        'conditional': {'firstRow': {'bold': True, 'color': 'FFFFFF',
+                                     'fill': COLORS['activities_header']},
+                        'lastRow': {'bold': True, 'color': 'FFFFFF', 'fill': COLORS['timeline']}},
+    },
+    'Aninver Gantt Table': {
+        'borders': True,
+        'conditional': {'nwCell': {'italic': True}},
+    },
+    'Aninver Deliverable Table': {
+        'fill': COLORS['deliverable_body'],
+        'conditional': {'firstCol': {'bold': True, 'fill': COLORS['deliverable_header']}},
+    },
+    'Aninver Work Plan Table': {
+        'font_size': Pt(9), 'borders': True,
+        'conditional': {'firstRow': {'bold': True, 'color': 'FFFFFF',
+                                     'fill': COLORS['activities_header'], 'align': 'center'}},
+    },
+}
+
+
+def cache_dir() -> Path:
+    """Directorio de la caché de disco (DOCX_TEMPLATE_CACHE_DIR o DEFAULT_CACHE_DIR)"""
+    return Path(os.getenv('DOCX_TEMPLATE_CACHE_DIR') or DEFAULT_CACHE_DIR)
+
+
+def template_path() -> Path:
+    """Archivo de la plantilla en la caché de disco para la versión actual"""
+    return cache_dir() / f"aninver_base_v{STYLE_VERSION}_docx{docx.__version__}.docx"
+
+
+def build_template() -> bytes:
+    """Construye la plantilla (sin caché): documento vacío con estilos y márgenes"""
+    doc = Document()
+
+    # Configurar estilos Aninver
+    _setup_aninver_styles(doc)
+
+    # Configurar márgenes
+    for section in doc.sections:
+        section.top_margin = Inches(1)
+        section.bottom_margin = Inches(1)
+        section.left_margin = Inches(1.25)
+        section.right_margin = Inches(1.25)
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _is_template(data: bytes) -> bool:
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as package:
+            return 'word/styles.xml' in package.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+@lru_cache(maxsize=1)
+def base_template() -> bytes:
+    """
+    Paquete .docx de la plantilla: de la caché de disco o, si no está (o está dañada),
+    construido y guardado en ella
+    """
+    path = template_path()
+    try:
+        data = path.read_bytes()
+        if _is_template(data):
+            return data
+    except OSError:
+        pass
+
+    data = build_template()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Escritura atómica: varios procesos de render pueden construirla a la vez
+        partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        partial.write_bytes(data)
+        os.replace(partial, path)
+    except OSError:
+        pass
+    return data
+
+
+@timed
+def new_document() -> Document:
+    """Documento vacío con los estilos y márgenes Aninver (clon en memoria de la plantilla)"""
+    return Document(io.BytesIO(base_template()))
+
+
+def _setup_aninver_styles(doc: Document):
+    """Configura los estilos Aninver del documento"""
+    styles = doc.styles
+
+    # Configuración base del documento: Arial 10, interlineado Múltiple 1.3, anterior 0, posterior 6
+    FONT_NAME = 'Arial'
+    FONT_SIZE = Pt(10)
+    LINE_SPACING = 1.3  # Múltiple 1.3
+    SPACE_BEFORE = Pt(0)
+    SPACE_AFTER = Pt(6)
+
+    # Valores por defecto del documento (los hereda Normal, y con él las listas y las
+    # celdas): en Normal tendrían prioridad sobre los estilos de tabla
+    _set_document_defaults(styles, FONT_NAME, FONT_SIZE, LINE_SPACING, SPACE_BEFORE, SPACE_AFTER)
+
+    # Aninver Section Heading (título principal de sección)
+    try:
+        style = styles.add_style('Aninver Section Heading', WD_STYLE_TYPE.PARAGRAPH)
+    except ValueError:
+        style = styles['Aninver Section Heading']
+    style.font.name = FONT_NAME
+    style.font.size = Pt(14)
+    style.font.bold = True
+    style.font.color.rgb = RGBColor(0x2E, 0x74, 0xB5)
+    style.paragraph_format.space_before = Pt(12)
+    style.paragraph_format.space_after = SPACE_AFTER
+    style.paragraph_format.line_spacing = LINE_SPACING
+
+    # Aninver Title 1 (títulos principales)
+    try:
+        style = styles.add_style('Aninver Title 1', WD_STYLE_TYPE.PARAGRAPH)
+    except ValueError:
+        style = styles['Aninver Title 1']
+    style.font.name = FONT_NAME
+    style.font.size = Pt(12)
+    style.font.bold = True
+    style.font.color.rgb = RGBColor(0x2E, 0x74, 0xB5)
+    style.paragraph_format.space_before = Pt(12)
+    style.paragraph_format.space_after = SPACE_AFTER
+    style.paragraph_format.line_spacing = LINE_SPACING
+
+    # Aninver Title 2 (subtítulos de fase)
+    try:
+        style = styles.add_style('Aninver Title 2', WD_STYLE_TYPE.PARAGRAPH)
+    except ValueError:
+        style = styles['Aninver Title 2']
+    style.font.name = FONT_NAME
+    style.font.size = Pt(11)
+    style.font.bold = True
+    style.font.color.rgb = RGBColor(0x2E, 0x74, 0xB5)
+    style.paragraph_format.space_before = Pt(6)
+    style.paragraph_format.space_after = SPACE_AFTER
+    style.paragraph_format.line_spacing = LINE_SPACING
+
+    # Aninver Title 3 (subtítulos de actividad)
+    try:
+        style = styles.add_style('Aninver Title 3', WD_STYLE_TYPE.PARAGRAPH)
+    except ValueError:
+        style = styles['Aninver Title 3']
+    style.font.name = FONT_NAME
+    style.font.size = FONT_SIZE
+    style.font.bold = True
+    style.font.italic = True
+    style.paragraph_format.space_before = SPACE_BEFORE
+    style.paragraph_format.space_after = SPACE_AFTER
+    style.paragraph_format.line_spacing = LINE_SPACING
+
+    # Aninver Body Text
+    try:
+        style = styles.add_style('Aninver Body Text', WD_STYLE_TYPE.PARAGRAPH)
+    except ValueError:
+        style = styles['Aninver Body Text']
+    style.font.name = FONT_NAME
+    style.font.size = FONT_SIZE
+    style.paragraph_format.space_before = SPACE_BEFORE
+    style.paragraph_format.space_after = SPACE_AFTER
+    style.paragraph_format.line_spacing = LINE_SPACING
+    style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+
+    # Aninver Bullet List
+    try:
+        style = styles.add_style('Aninver Bullet List', WD_STYLE_TYPE.PARAGRAPH)
+    except ValueError:
+        style = styles['Aninver Bullet List']
+    style.font.name = FONT_NAME
+    style.font.size = FONT_SIZE
+    style.paragraph_format.left_indent = Inches(0.5)
+    style.paragraph_format.space_before = SPACE_BEFORE
+    style.paragraph_format.space_after = SPACE_AFTER
+    style.paragraph_format.line_spacing = LINE_SPACING
+    style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+
+    # Estilos de tabla (Aptos; formato condicional para el encabezado y la primera columna)
+    for name, definition in TABLE_STYLES.items():
+        _add_table_style(styles, name, **definition)
+
+
+def _set_document_defaults(styles, font_name: str, font_size, line_spacing: float,
+                           space_before, space_after):
+    """Fuente, tamaño, interlineado y alineación por defecto (w:docDefaults)"""
+    defaults = styles.element.find(qn('w:docDefaults'))
+    run = defaults.find(f"{qn('w:rPrDefault')}/{qn('w:rPr')}")
+    fonts = run.find(qn('w:rFonts'))
+    for theme in ('w:asciiTheme', 'w:hAnsiTheme'):
+        fonts.attrib.pop(qn(theme), None)
+    fonts.set(qn('w:ascii'), font_name)
+    fonts.set(qn('w:hAnsi'), font_name)
+    run.find(qn('w:sz')).set(qn('w:val'), str(round(font_size.pt * 2)))
+
+    paragraph = defaults.find(f"{qn('w:pPrDefault')}/{qn('w:pPr')}")
+    for child in list(paragraph):
+        paragraph.remove(child)
+    paragraph.append(parse_xml(
+        f'<w:spacing {nsdecls("w")} w:before="{space_before.twips}" w:after="{space_after.twips}" '
+        f'w:line="{round(line_spacing * 240)}" w:lineRule="auto"/>'))
+    paragraph.append(parse_xml(f'<w:jc {nsdecls("w")} w:val="both"/>'))
+
+
+def _zone_xml(bold: bool = False, italic: bool = False, color: str = None, fill: str = None,
+              align: str = None) -> str:
+    """pPr, rPr y tcPr de una zona de un estilo de tabla"""
+    xml = f'<w:pPr><w:jc w:val="{align}"/></w:pPr>' if align else ''
+    run = ('<w:b/>' if bold else '') + ('<w:i/>' if italic else '')
+    run += f'<w:color w:val="{color}"/>' if color else ''
+    xml += f'<w:rPr>{run}</w:rPr>' if run else ''
+    xml += f'<w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{fill}"/></w:tcPr>' if fill else ''
+    return xml
+
+
+def _add_table_style(styles, name: str, font_size=Pt(10), space=Pt(0), borders: bool = False,
+                     row_bands: bool = False, fill: str = None, conditional: dict = None):
+    """Estilo de tabla con texto Aptos a interlineado sencillo y formato por zonas"""
+    try:
+        style = styles.add_style(name, WD_STYLE_TYPE.TABLE)
+    except ValueError:
+        style = styles[name]
+    style.base_style = styles['Normal Table']
+    style.font.name = 'Aptos'
+    style.font.size = font_size
+    style.paragraph_format.space_before = space
+    style.paragraph_format.space_after = space
+    style.paragraph_format.line_spacing = 1.0
+
+    border = ('<w:{} w:val="single" w:sz="4" w:space="0" w:color="000000"/>' if borders
+              else '<w:{} w:val="none" w:sz="0" w:space="0" w:color="auto"/>')
+    table = '<w:tblStyleRowBandSize w:val="1"/>' if row_bands else ''
+    table += f"<w:tblBorders>{''.join(border.format(side) for side in _TABLE_BORDERS)}</w:tblBorders>"
+    xml = f'<w:tblPr>{table}</w:tblPr>'
+    if fill:
+        xml += f'<w:tcPr><w:shd w:val="clear" w:color="auto" w:fill="{fill}"/></w:tcPr>'
+    for zone, formatting in (conditional or {}).items():
+        xml += f'<w:tblStylePr w:type="{zone}">{_zone_xml(**formatting)}</w:tblStylePr>'
+    for element in parse_xml(f'<w:style {nsdecls("w")}>{xml}</w:style>'):
+        style.element.append(element)
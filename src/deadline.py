@@ -0,0 +1,59 @@
+"""
+Presupuesto de tiempo de extremo a extremo (parseo, generación y renderizado)
+"""
+
+import time
+
+
+class Deadline:
+    """
+    Instante límite de una ejecución, medido con reloj monotónico
+
+    Deadline(None) no impone límite: remaining() es infinito y expired() siempre False,
+    de modo que las etapas pueden recibir siempre un Deadline sin comprobar None.
+    """
+
+    def __init__(self, seconds: float = None):
+        self.seconds = seconds
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + seconds if seconds is not None else None
+
+    def remaining(self) -> float:
+        """Segundos restantes (infinito si no hay límite)"""
+        if self.expires_at is None:
+            return float('inf')
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def elapsed(self) -> float:
+        """Segundos transcurridos desde el inicio"""
+        return time.monotonic() - self.started_at
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def budget(self, reserve: float = 0.0, share: float = 1.0) -> float:
+        """
+        Tiempo disponible para una etapa
+
+        Args:
+            reserve: Segundos que deben quedar libres para las etapas posteriores
+            share: Fracción del tiempo restante (tras la reserva) que puede usar la etapa
+
+        Returns:
+            Segundos disponibles (infinito si no hay límite, 0 si ya no queda tiempo)
+        """
+        remaining = self.remaining()
+        if remaining == float('inf'):
+            return remaining
+        return max(0.0, (remaining - reserve) * share)
+
+    @property
+    def limited(self) -> bool:
+        return self.expires_at is not None
+
+
+def as_deadline(deadline) -> Deadline:
+    """Convierte None, segundos o un Deadline en un Deadline"""
+    if isinstance(deadline, Deadline):
+        return deadline
+    return Deadline(deadline)
@@ -0,0 +1,232 @@
+"""
+Representación intermedia del documento (IR), independiente del formato de salida
+
+Aquí se decide el contenido: qué títulos y párrafos lleva cada sección, qué filas tienen
+las tablas, qué celdas del Gantt y del Work Plan están activas y qué código va en cada
+una. Los escritores (document_writer y ooxml_writer para el Word, preview_writer para
+HTML y Markdown) solo deciden el aspecto de cada bloque.
+
+El documento es una lista de bloques: diccionarios con 'type' y los campos del tipo.
+    heading      level (0: título del documento, 1-3: niveles de sección), text
+    paragraph    runs [(texto, negrita, itálica)] (ver markup.inline_runs)
+    subheading   text (línea completa en negrita o "# ..." dentro de un bloque de texto)
+    bullet       level (anidamiento, 0 a markup.MAX_LIST_LEVEL), runs
+    numbered     level, runs
+    spacer       (párrafo vacío)
+    principles   label, principles [{'name', 'description'}]
+    activities   header, items (a., b., ...), footer
+    gantt        header, labels, rows [{'label', 'bars'}], legend
+    deliverable  code, name
+    work_plan    title, months, labels, rows [{'phase', 'code', 'title', 'bars'}], legend
+
+Las barras ('bars') son tramos [(primera columna, columnas, marcador o None)]: una
+columna por tramo salvo en el Work Plan con merge_bars.
+
+Cada sección tiene su constructor (text_blocks, principles_blocks, phase_blocks,
+work_plan_blocks) para que los escritores puedan dibujarlas por separado (fases en
+paralelo, caché de secciones); build_document arma el documento completo.
+"""
+
+import numpy as np
+
+from .markup import inline_runs, parse_content
+from .methodology_model import Methodology, as_methodology
+from .profiling import timed
+from .schedule import NO_COLUMN, bar_runs, build_schedule
+
+
+PRINCIPLES_INTRO = ('The following key principles underpin our proposed strategy, and stem from '
+                    'our analysis of the local context as well as the specific needs expressed '
+                    'in the ToR.')
+
+# Columnas de semanas del Gantt de cada fase
+GANTT_COLUMNS = 11
+
+
+def heading(level: int, text: str) -> dict:
+    return {'type': 'heading', 'level': level, 'text': text}
+
+
+def paragraph_blocks(text: str) -> list:
+    """Párrafo de texto (ninguno si está vacío)"""
+    return [{'type': 'paragraph', 'runs': inline_runs(text)}] if text else []
+
+
+def content_blocks(content: str) -> list:
+    """Bloque de texto: párrafos, listas y encabezados (markup.parse_content)"""
+    blocks = []
+    for kind, level, value in parse_content(content):
+        if kind == 'heading':
+            blocks.append({'type': 'subheading', 'text': value})
+        elif kind == 'paragraph':
+            blocks.append({'type': 'paragraph', 'runs': value})
+        else:
+            blocks.append({'type': kind, 'level': level, 'runs': value})
+    return blocks
+
+
+@timed
+def text_blocks(title: str, level: int, content: str) -> list:
+    """Sección de texto con título (contexto, riesgos, calidad)"""
+    return [heading(level, title)] + content_blocks(content)
+
+
+@timed
+def principles_blocks(principles: list, lang_config: dict) -> list:
+    """Título, introducción y tabla de los principios rectores"""
+    labels = lang_config.get('table_labels', {})
+    return ([heading(2, lang_config['sections'].get('principles', 'Our guiding principles'))]
+            + paragraph_blocks(lang_config.get('principles_intro', PRINCIPLES_INTRO))
+            + [{'type': 'principles', 'label': labels.get('principle', 'Principle'),
+                'principles': [{'name': p.name, 'description': p.description}
+                               for p in principles]}])
+
+
+def _gantt(phase, lang_config: dict, schedule, phase_index: int) -> dict:
+    """Gantt de GANTT_COLUMNS semanas desde la primera semana de las tareas de la fase"""
+    labels = lang_config.get('table_labels', {})
+    event_prefix = labels.get('event_prefix', 'E')
+    deliverable_prefix = labels.get('deliverable_prefix', 'D')
+
+    rows_index = schedule.task_rows[phase_index]
+    display_start = int(schedule.starts[rows_index].min()) if rows_index else 1
+    occupancy, deliverable_cols, event_cols = schedule.window(rows_index, display_start,
+                                                              GANTT_COLUMNS)
+    rows = []
+    event_counter = 0
+    for t_idx, task in enumerate(phase.tasks):
+        bars = []
+        for col in np.flatnonzero(occupancy[t_idx]).tolist():
+            marker = None
+            # Los eventos se numeran por fase; el entregable tiene prioridad en la celda
+            if event_cols[t_idx] == col:
+                event_counter += 1
+                marker = f"{event_prefix}{event_counter}"
+            if deliverable_cols[t_idx] == col:
+                marker = task.deliverable_code or f"{deliverable_prefix}"
+            bars.append((col, 1, marker))
+        rows.append({'label': f"{chr(ord('a') + t_idx)}.", 'bars': bars})
+    return {'type': 'gantt', 'header': labels.get('weeks', 'Weeks'),
+            'labels': [str(display_start + i) for i in range(GANTT_COLUMNS)], 'rows': rows,
+            'legend': labels.get('legend', 'E: Event, D: Deliverable')}
+
+
+def phase_outline_blocks(phase) -> list:
+    """Fase sin tablas: título y descripción (cuando se agota el tiempo)"""
+    return [heading(2, phase.title)] + paragraph_blocks(phase.description)
+
+
+@timed
+def phase_blocks(phase, lang_config: dict, schedule=None, phase_index: int = 0) -> list:
+    """
+    Fase con tablas de actividades y Gantt, detalle de tareas y entregables
+
+    schedule es el cronograma de la metodología y phase_index la posición de la fase en
+    ella; sin cronograma se construye uno solo para esta fase (mismas columnas).
+    """
+    labels = lang_config.get('table_labels', {})
+    blocks = phase_outline_blocks(phase)
+    tasks = phase.tasks
+    if tasks:
+        blocks.append({'type': 'activities', 'header': labels.get('activities', 'Activities'),
+                       'items': [f"{chr(ord('a') + t_idx)}.  {task.title}"
+                                 for t_idx, task in enumerate(tasks)],
+                       'footer': labels.get('timeline', 'Timeline')})
+        if schedule is None:
+            schedule, phase_index = build_schedule(Methodology(phases=[phase])), 0
+        blocks.append(_gantt(phase, lang_config, schedule, phase_index))
+        for task in tasks:
+            blocks.append(heading(3, f"{task.code}. {task.title}"))
+            blocks += content_blocks(task.description)
+            # Los ítems de las tareas se escriben tal cual, sin marcado
+            blocks += [{'type': 'bullet', 'level': 0, 'runs': [(item, False, False)]}
+                       for item in task.items]
+
+    blocks += [{'type': 'deliverable', 'code': deliverable.code or 'Deliverable',
+                'name': deliverable.name} for deliverable in phase.deliverables]
+    blocks.append({'type': 'spacer'})
+    return blocks
+
+
+def _bars(active, markers: dict, merge_bars: bool) -> list:
+    if merge_bars:
+        runs = bar_runs(active, markers)
+    else:
+        runs = [(col, 1) for col in np.flatnonzero(active).tolist()]
+    return [(start, length, markers.get(start) if length == 1 else None)
+            for start, length in runs]
+
+
+@timed
+def work_plan_blocks(methodology: Methodology, lang_config: dict, schedule=None,
+                     start_date=None, merge_bars: bool = False) -> list:
+    """
+    Título y Work Plan consolidado: semanas, o meses si el proyecto supera
+    AUTO_MONTH_THRESHOLD semanas (meses del calendario, MM/AA, con start_date)
+
+    En meses solo se marcan los entregables; en semanas también los eventos. Con
+    merge_bars los períodos activos contiguos de cada fila forman un solo tramo.
+    """
+    phases = methodology.phases
+    if not phases:
+        return []
+    labels = lang_config.get('table_labels', {})
+    if schedule is None:
+        schedule = build_schedule(methodology)
+    plan = schedule.aggregate('calendar' if start_date else 'auto', start_date)
+    use_months = plan.granularity != 'week'
+
+    rows = []
+    for p_idx, phase in enumerate(phases):
+        rows.append({'phase': True, 'code': '', 'title': phase.title,
+                     'bars': _bars(plan.occupancy[plan.phase_rows[p_idx]], {}, merge_bars)})
+        for task, row in zip(phase.tasks, plan.task_rows[p_idx]):
+            markers = {}
+            if task.deliverable_code and plan.deliverable_col[row] != NO_COLUMN:
+                markers[int(plan.deliverable_col[row])] = task.deliverable_code
+            if not use_months and plan.event_col[row] != NO_COLUMN:
+                markers[int(plan.event_col[row])] = task.event_code or 'E'
+            rows.append({'phase': False, 'code': task.code, 'title': task.title,
+                         'bars': _bars(plan.occupancy[row], markers, merge_bars)})
+
+    return [heading(1, lang_config['sections'].get('workplan', 'Work Plan')),
+            {'type': 'work_plan', 'title': 'WORK PLAN', 'months': use_months,
+             'labels': plan.labels, 'rows': rows,
+             'legend': labels.get('legend', 'E: Event, P: Product')}]
+
+
+@timed
+def build_document(methodology, lang_config: dict, work_plan: bool = True, start_date=None,
+                   merge_bars: bool = False) -> list:
+    """
+    Bloques del documento completo, en el orden de create_word_document
+
+    Args:
+        methodology: Diccionario o Methodology
+        lang_config: Configuración del idioma (títulos y etiquetas)
+        work_plan: Incluye el Work Plan consolidado
+        start_date: Work Plan en meses del calendario a partir de esta fecha
+        merge_bars: Barras del Work Plan como tramos combinados
+
+    Returns:
+        Lista de bloques (ver el docstring del módulo)
+    """
+    methodology = as_methodology(methodology)
+    sections = lang_config['sections']
+    schedule = build_schedule(methodology)
+
+    blocks = [heading(0, sections['title'])] + paragraph_blocks(methodology.introduction)
+    if methodology.context:
+        blocks += text_blocks(sections['context'], 2, methodology.context)
+    if methodology.principles:
+        blocks += principles_blocks(methodology.principles, lang_config)
+    blocks.append(heading(1, sections['approach']))
+    for p_idx, phase in enumerate(methodology.phases):
+        blocks += phase_blocks(phase, lang_config, schedule, p_idx)
+    if methodology.risks:
+        blocks += text_blocks(sections['risks'], 1, methodology.risks)
+    if methodology.quality:
+        blocks += text_blocks(sections['quality'], 1, methodology.quality)
+    if work_plan:
+        blocks += work_plan_blocks(methodology, lang_config, schedule, start_date, merge_bars)
+    return blocks
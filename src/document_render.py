@@ -0,0 +1,135 @@
+"""
+Renderizado del documento Word: orden de las secciones, caché, fases en paralelo y recortes
+
+Un solo recorrido de las secciones del IR (document_ir) para los dos escritores del
+Word. El escritor solo decide cómo se emiten los bloques; aquí se decide todo lo demás:
+el orden de las secciones (el de build_document), qué sección sale de la caché de
+secciones (incremental), si las fases se dibujan en un pool de procesos, qué fases se
+quedan sin tablas y si se omite el Work Plan cuando se agota el tiempo, y lo que se anota
+en report.
+
+Interfaz del escritor (document_writer.DocxWriter, ooxml_writer.OoxmlWriter):
+    name                          'docx' u 'ooxml' (parte de la clave de la caché)
+    write_blocks(blocks)          emite bloques del IR al final del documento
+    append_fragment(fragment)     agrega un fragmento ya dibujado (caché o pool de fases)
+    section_fragment(build, *a)   fragmento con solo los bloques build(*a)
+    phase_fragment(phase, lang)   fragmento de una fase; función de módulo (se envía al
+                                  pool de procesos)
+    save(output_path)             escribe el .docx
+"""
+
+from .deadline import as_deadline
+from .document_ir import (
+    heading, paragraph_blocks, text_blocks, principles_blocks, phase_outline_blocks,
+    phase_blocks, work_plan_blocks
+)
+from .methodology_model import as_methodology
+from .phase_pool import render_phase_fragments
+from .profiling import span
+from .section_cache import SectionCache, cached_phase_fragments, work_plan_data
+from .schedule import build_schedule
+
+
+# Segundos mínimos restantes para dibujar el Work Plan consolidado
+WORK_PLAN_MIN_SECONDS = 1.0
+
+
+def render_document(writer, methodology, output_path, lang_config: dict, deadline=None,
+                    report: dict = None, work_plan: bool = True, start_date=None,
+                    merge_bars: bool = False, phase_workers: int = 1,
+                    incremental: bool = False):
+    """
+    Dibuja la metodología con el escritor y guarda el documento
+
+    Mismos argumentos que document_writer.create_word_document, que elige el escritor
+    y delega aquí.
+    """
+    methodology = as_methodology(methodology)
+    deadline = as_deadline(deadline)
+    cuts = report.setdefault('cuts', []) if report is not None else []
+    # Cronograma calculado una vez para los Gantt de las fases y el Work Plan
+    schedule = build_schedule(methodology)
+    if report is not None:
+        report['schedule_issues'] = schedule.issues
+    cache = SectionCache(writer.name, lang_config) if incremental else None
+    sections = lang_config['sections']
+
+    # Título principal de sección e introducción si existe
+    writer.write_blocks([heading(0, sections['title'])]
+                        + paragraph_blocks(methodology.introduction))
+
+    # Comprensión del contexto
+    if methodology.context:
+        _section(writer, cache, 'context', methodology.context, text_blocks,
+                 sections['context'], 2, methodology.context)
+
+    # Principios rectores
+    if methodology.principles:
+        _section(writer, cache, 'principles', [p.to_dict() for p in methodology.principles],
+                 principles_blocks, methodology.principles, lang_config)
+
+    # Enfoque técnico y metodología
+    writer.write_blocks([heading(1, sections['approach'])])
+
+    # Fases del proyecto (en paralelo: fragmentos ya dibujados, hasta donde alcanzó el tiempo)
+    with span('phases'):
+        fragments = None
+        if cache is not None:
+            fragments = cached_phase_fragments(cache, writer.phase_fragment, methodology.phases,
+                                               lang_config, methodology.period, phase_workers,
+                                               deadline)
+        elif phase_workers > 1 and len(methodology.phases) > 1:
+            fragments = render_phase_fragments(writer.phase_fragment, methodology.phases,
+                                               lang_config, phase_workers, deadline)
+        for p_idx, phase in enumerate(methodology.phases):
+            out_of_time = (p_idx >= len(fragments)) if fragments is not None else deadline.expired()
+            if out_of_time:
+                for remaining in methodology.phases[p_idx:]:
+                    writer.write_blocks(phase_outline_blocks(remaining))
+                cuts.append(f"Fases sin tablas por falta de tiempo: "
+                            f"{len(methodology.phases) - p_idx}")
+                break
+            if fragments is None:
+                writer.write_blocks(phase_blocks(phase, lang_config, schedule, p_idx))
+            else:
+                writer.append_fragment(fragments[p_idx])
+
+    # Gestión de riesgos
+    if methodology.risks:
+        _section(writer, cache, 'risks', methodology.risks, text_blocks,
+                 sections['risks'], 1, methodology.risks)
+
+    # Aseguramiento de calidad
+    if methodology.quality:
+        _section(writer, cache, 'quality', methodology.quality, text_blocks,
+                 sections['quality'], 1, methodology.quality)
+
+    # Work Plan consolidado al final
+    if work_plan and methodology.phases:
+        if deadline.remaining() < WORK_PLAN_MIN_SECONDS:
+            cuts.append("Work Plan omitido por falta de tiempo")
+        else:
+            _section(writer, cache, 'work_plan',
+                     work_plan_data(methodology, start_date, merge_bars),
+                     work_plan_blocks, methodology, lang_config, schedule,
+                     start_date, merge_bars)
+
+    if cache is not None and report is not None:
+        report['section_cache'] = cache.stats()
+
+    # Guardar documento
+    with span('save'):
+        writer.save(output_path)
+
+
+def _section(writer, cache, kind: str, data, build, *args):
+    """
+    Agrega la sección de bloques build(*args); con caché de secciones, el fragmento
+    guardado para (kind, data) o, si no existe, el que dibuja el escritor aparte
+    """
+    with span(kind):
+        if cache is None:
+            writer.write_blocks(build(*args))
+        else:
+            writer.append_fragment(cache.fragment(
+                kind, data, lambda: writer.section_fragment(build, *args)))
@@ -1,371 +1,184 @@
 """
 Generador de documentos Word con formato Aninver
+
+El contenido de cada sección sale de la representación intermedia (document_ir); aquí
+se dibuja cada bloque con python-docx.
 """
 
+from copy import deepcopy
+
 from docx import Document
-from docx.shared import Pt, Inches, RGBColor, Cm, Twips
+from docx.shared import Pt, RGBColor, Cm, Emu, Twips
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.enum.style import WD_STYLE_TYPE
-from docx.oxml.ns import qn, nsdecls
-from docx.oxml import parse_xml
-
-
-# Colores Aninver
-COLORS = {
-    'principle_header': 'BDD6EE',      # Azul claro - header de principios
-    'principle_title': '2E74B5',        # Azul oscuro - título de principio
-    'activities_header': '5B83DF',      # Azul - header "Activities"
-    'activities_body': 'F2F2F2',        # Gris claro - lista de actividades
-    'timeline': '00A798',               # Verde/Teal - "Timeline"
-    'gantt_active': 'FFC000',           # Amarillo/Naranja - celdas activas del Gantt
-    'experience_box': 'FFF2CC',         # Amarillo claro - cajas de experiencia
-    'deliverable_header': 'FFC000',     # Amarillo - header de entregable
-    'deliverable_body': 'FFF2CC',       # Amarillo claro - cuerpo de entregable
-}
+from docx.oxml.ns import qn
+from docx.oxml import OxmlElement, parse_xml
+from lxml import etree
+
+from .base_template import COLORS, new_document
+from .document_ir import phase_blocks
+from .document_render import render_document
+from .methodology_model import Phase
+from .profiling import timed
+
+# Escritores de create_word_document
+WRITERS = ('docx', 'ooxml')
+
+# Estilo de párrafo de cada nivel de título del IR
+HEADING_STYLES = ('Aninver Section Heading', 'Aninver Title 1', 'Aninver Title 2',
+                  'Aninver Title 3')
 
+# Estilo de párrafo de cada nivel de anidamiento de las listas del IR
+LIST_STYLES = {'bullet': ('List Bullet', 'List Bullet 2', 'List Bullet 3'),
+               'numbered': ('List Number', 'List Number 2', 'List Number 3')}
 
-def create_word_document(methodology: dict, output_path: str, lang_config: dict):
+
+@timed
+def create_word_document(methodology, output_path: str, lang_config: dict,
+                         deadline=None, report: dict = None, work_plan: bool = True,
+                         start_date=None, writer: str = 'docx', merge_bars: bool = False,
+                         phase_workers: int = 1, incremental: bool = False):
     """
     Crea un documento Word con el enfoque metodológico en formato Aninver
+
+    La metodología puede ser un diccionario o un Methodology; se normaliza una vez aquí.
+    Con deadline, si el tiempo se agota las fases restantes se escriben solo con
+    título y descripción y se omite el Work Plan; el documento siempre se guarda.
+    Los recortes se anotan en report['cuts']. Con work_plan=False no se agrega el
+    Work Plan consolidado; con start_date (datetime.date) el Work Plan usa meses del
+    calendario; con merge_bars, cada barra del Work Plan es una sola celda combinada
+    (gridSpan) en lugar de una celda por período. Los problemas del cronograma se anotan
+    en report['schedule_issues']. Con phase_workers > 1 las fases se dibujan en paralelo
+    en un pool de procesos (phase_pool) y se insertan en orden; el documento es el mismo.
+    Con incremental, cada sección se guarda ya dibujada en la caché de secciones
+    (section_cache) y solo se dibujan las que cambiaron desde el último renderizado; los
+    aciertos y fallos se anotan en report['section_cache'].
+
+    writer elige el escritor: 'docx' (python-docx, DocxWriter) u 'ooxml' (ooxml_writer:
+    emite word/document.xml directamente, con el mismo resultado y más rápido). Ambos
+    pasan por el mismo recorrido de las secciones (document_render.render_document).
     """
-    doc = Document()
-    sections = lang_config['sections']
-
-    # Configurar estilos Aninver
-    _setup_aninver_styles(doc)
-
-    # Configurar márgenes
-    for section in doc.sections:
-        section.top_margin = Inches(1)
-        section.bottom_margin = Inches(1)
-        section.left_margin = Inches(1.25)
-        section.right_margin = Inches(1.25)
-
-    # Título principal de sección
-    title = doc.add_paragraph(sections['title'], style='Aninver Section Heading')
-
-    # Introducción si existe
-    if methodology.get('introduction'):
-        _add_paragraph(doc, methodology['introduction'])
-
-    # Comprensión del contexto
-    if methodology.get('context'):
-        doc.add_paragraph(sections['context'], style='Aninver Title 2')
-        _add_content_block(doc, methodology['context'])
-
-    # Principios rectores
-    if methodology.get('principles'):
-        doc.add_paragraph(sections.get('principles', 'Our guiding principles'), style='Aninver Title 2')
-        intro_text = lang_config.get('principles_intro',
-            'The following key principles underpin our proposed strategy, and stem from our analysis of the local context as well as the specific needs expressed in the ToR.')
-        _add_paragraph(doc, intro_text)
-        _add_principles_table(doc, methodology['principles'], lang_config)
-
-    # Enfoque técnico y metodología
-    doc.add_paragraph(sections['approach'], style='Aninver Title 1')
-
-    # Fases del proyecto
-    if methodology.get('phases'):
-        for phase in methodology['phases']:
-            _add_phase_improved(doc, phase, lang_config)
-
-    # Gestión de riesgos
-    if methodology.get('risks'):
-        doc.add_paragraph(sections['risks'], style='Aninver Title 1')
-        _add_content_block(doc, methodology['risks'])
-
-    # Aseguramiento de calidad
-    if methodology.get('quality'):
-        doc.add_paragraph(sections['quality'], style='Aninver Title 1')
-        _add_content_block(doc, methodology['quality'])
-
-    # Work Plan consolidado al final
-    if methodology.get('phases'):
-        doc.add_paragraph(sections.get('workplan', 'Work Plan'), style='Aninver Title 1')
-        _add_work_plan(doc, methodology, lang_config)
-
-    # Guardar documento
-    doc.save(output_path)
-
-
-def _setup_aninver_styles(doc: Document):
-    """Configura los estilos Aninver del documento"""
-    styles = doc.styles
-
-    # Configuración base del documento: Arial 10, interlineado Múltiple 1.3, anterior 0, posterior 6
-    FONT_NAME = 'Arial'
-    FONT_SIZE = Pt(10)
-    LINE_SPACING = 1.3  # Múltiple 1.3
-    SPACE_BEFORE = Pt(0)
-    SPACE_AFTER = Pt(6)
-
-    # Estilo base Normal
-    style_normal = styles['Normal']
-    style_normal.font.name = FONT_NAME
-    style_normal.font.size = FONT_SIZE
-    style_normal.paragraph_format.line_spacing = LINE_SPACING
-    style_normal.paragraph_format.space_before = SPACE_BEFORE
-    style_normal.paragraph_format.space_after = SPACE_AFTER
-    style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-
-    # Aninver Section Heading (título principal de sección)
-    try:
-        style = styles.add_style('Aninver Section Heading', WD_STYLE_TYPE.PARAGRAPH)
-    except ValueError:
-        style = styles['Aninver Section Heading']
-    style.font.name = FONT_NAME
-    style.font.size = Pt(14)
-    style.font.bold = True
-    style.font.color.rgb = RGBColor(0x2E, 0x74, 0xB5)
-    style.paragraph_format.space_before = Pt(12)
-    style.paragraph_format.space_after = SPACE_AFTER
-    style.paragraph_format.line_spacing = LINE_SPACING
-
-    # Aninver Title 1 (títulos principales)
-    try:
-        style = styles.add_style('Aninver Title 1', WD_STYLE_TYPE.PARAGRAPH)
-    except ValueError:
-        style = styles['Aninver Title 1']
-    style.font.name = FONT_NAME
-    style.font.size = Pt(12)
-    style.font.bold = True
-    style.font.color.rgb = RGBColor(0x2E, 0x74, 0xB5)
-    style.paragraph_format.space_before = Pt(12)
-    style.paragraph_format.space_after = SPACE_AFTER
-    style.paragraph_format.line_spacing = LINE_SPACING
-
-    # Aninver Title 2 (subtítulos de fase)
-    try:
-        style = styles.add_style('Aninver Title 2', WD_STYLE_TYPE.PARAGRAPH)
-    except ValueError:
-        style = styles['Aninver Title 2']
-    style.font.name = FONT_NAME
-    style.font.size = Pt(11)
-    style.font.bold = True
-    style.font.color.rgb = RGBColor(0x2E, 0x74, 0xB5)
-    style.paragraph_format.space_before = Pt(6)
-    style.paragraph_format.space_after = SPACE_AFTER
-    style.paragraph_format.line_spacing = LINE_SPACING
-
-    # Aninver Title 3 (subtítulos de actividad)
-    try:
-        style = styles.add_style('Aninver Title 3', WD_STYLE_TYPE.PARAGRAPH)
-    except ValueError:
-        style = styles['Aninver Title 3']
-    style.font.name = FONT_NAME
-    style.font.size = FONT_SIZE
-    style.font.bold = True
-    style.font.italic = True
-    style.paragraph_format.space_before = SPACE_BEFORE
-    style.paragraph_format.space_after = SPACE_AFTER
-    style.paragraph_format.line_spacing = LINE_SPACING
-
-    # Aninver Body Text
-    try:
-        style = styles.add_style('Aninver Body Text', WD_STYLE_TYPE.PARAGRAPH)
-    except ValueError:
-        style = styles['Aninver Body Text']
-    style.font.name = FONT_NAME
-    style.font.size = FONT_SIZE
-    style.paragraph_format.space_before = SPACE_BEFORE
-    style.paragraph_format.space_after = SPACE_AFTER
-    style.paragraph_format.line_spacing = LINE_SPACING
-    style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-
-    # Aninver Bullet List
-    try:
-        style = styles.add_style('Aninver Bullet List', WD_STYLE_TYPE.PARAGRAPH)
-    except ValueError:
-        style = styles['Aninver Bullet List']
-    style.font.name = FONT_NAME
-    style.font.size = FONT_SIZE
-    style.paragraph_format.left_indent = Inches(0.5)
-    style.paragraph_format.space_before = SPACE_BEFORE
-    style.paragraph_format.space_after = SPACE_AFTER
-    style.paragraph_format.line_spacing = LINE_SPACING
-    style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-
-
-def _add_paragraph(doc: Document, text: str):
-    """Agrega un párrafo con estilo Aninver Body Text, procesando negritas **texto**"""
-    if not text:
-        return None
-
-    p = doc.add_paragraph(style='Aninver Body Text')
-
-    # Procesar negritas marcadas con **texto**
-    import re
-    parts = re.split(r'(\*\*[^*]+\*\*)', text)
-
-    for part in parts:
-        if part.startswith('**') and part.endswith('**'):
-            # Texto en negrita
-            run = p.add_run(part[2:-2])
-            run.bold = True
-        else:
-            # Texto normal
-            if part:
-                p.add_run(part)
+    if writer not in WRITERS:
+        raise ValueError(f"Escritor no soportado: {writer}. Use {', '.join(WRITERS)}.")
+    if writer == 'ooxml':
+        # Importación diferida: ooxml_writer usa la base de este módulo
+        from .ooxml_writer import OoxmlWriter
+        target = OoxmlWriter()
+    else:
+        target = DocxWriter()
+    render_document(target, methodology, output_path, lang_config, deadline, report,
+                    work_plan, start_date, merge_bars, phase_workers, incremental)
 
-    return p
 
+class DocxWriter:
+    """Escritor python-docx del documento (interfaz en document_render)"""
 
-def _add_content_block(doc: Document, content: str):
-    """Agrega un bloque de contenido, detectando listas y párrafos, procesando negritas"""
-    import re
+    name = 'docx'
 
-    if not content:
-        return
+    def __init__(self):
+        self.doc = new_document()
+
+    def write_blocks(self, blocks: list):
+        _add_blocks(self.doc, blocks)
+
+    def append_fragment(self, fragment: str):
+        _append_fragment(self.doc, fragment)
+
+    @staticmethod
+    def section_fragment(build, *args) -> str:
+        return _section_fragment(build, *args)
+
+    @staticmethod
+    def phase_fragment(phase: Phase, lang_config: dict) -> str:
+        return _phase_fragment(phase, lang_config)
+
+    def save(self, output_path):
+        self.doc.save(output_path)
+
+
+def _add_blocks(doc: Document, blocks: list):
+    """Dibuja los bloques del IR (ver document_ir)"""
+    for block in blocks:
+        _BLOCK_WRITERS[block['type']](doc, block)
+
+
+def _section_fragment(build, *args) -> str:
+    """Cuerpo (w:body) de un documento con solo los bloques build(*args)"""
+    doc = new_document()
+    _add_blocks(doc, build(*args))
+    return etree.tostring(doc.element.body, encoding='unicode')
 
-    paragraphs = content.split('\n\n')
-    for para_text in paragraphs:
-        if not para_text.strip():
-            continue
 
-        lines = para_text.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Detectar headers con **texto** (línea completa en negrita)
-            if line.startswith('**') and line.endswith('**') and line.count('**') == 2:
-                p = doc.add_paragraph()
-                run = p.add_run(line[2:-2])
-                run.bold = True
-                p.paragraph_format.space_before = Pt(8)
-                continue
-
-            if line.startswith('- ') or line.startswith('• ') or line.startswith('* '):
-                p = doc.add_paragraph(style='List Bullet')
-                text = line[2:]
-                _add_text_with_bold(p, text)
-            elif line.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')):
-                text = line.split('.', 1)[1].strip() if '.' in line else line
-                p = doc.add_paragraph(style='List Number')
-                _add_text_with_bold(p, text)
-            else:
-                _add_paragraph(doc, line)
-
-
-def _add_text_with_bold(paragraph, text: str):
-    """Agrega texto a un párrafo procesando negritas **texto**"""
-    import re
-    parts = re.split(r'(\*\*[^*]+\*\*)', text)
-
-    for part in parts:
-        if part.startswith('**') and part.endswith('**'):
-            run = paragraph.add_run(part[2:-2])
+@timed
+def _add_heading(doc: Document, block: dict):
+    doc.add_paragraph(block['text'], style=HEADING_STYLES[block['level']])
+
+
+@timed
+def _add_runs(paragraph, runs: list):
+    """Runs (texto, negrita, itálica) de markup.inline_runs"""
+    for text, bold, italic in runs:
+        run = paragraph.add_run(text)
+        if bold:
             run.bold = True
-        else:
-            if part:
-                paragraph.add_run(part)
+        if italic:
+            run.italic = True
 
 
-def _set_cell_shading(cell, color_hex: str):
-    """Establece el color de fondo de una celda"""
-    shading_elm = parse_xml(
-        f'<w:shd {nsdecls("w")} w:fill="{color_hex}" w:val="clear"/>'
-    )
-    cell._tc.get_or_add_tcPr().append(shading_elm)
+@timed
+def _add_paragraph(doc: Document, block: dict):
+    """Párrafo con estilo Aninver Body Text"""
+    _add_runs(doc.add_paragraph(style='Aninver Body Text'), block['runs'])
 
 
-def _format_table_cell(cell, font_name: str = 'Aptos', font_size: int = 10):
-    """Aplica formato Aptos 10 e interlineado sencillo a una celda de tabla"""
-    for paragraph in cell.paragraphs:
-        paragraph.paragraph_format.line_spacing = 1.0
-        paragraph.paragraph_format.space_before = Pt(0)
-        paragraph.paragraph_format.space_after = Pt(0)
-        for run in paragraph.runs:
-            run.font.name = font_name
-            run.font.size = Pt(font_size)
+@timed
+def _add_subheading(doc: Document, block: dict):
+    """Línea completa en negrita de un bloque de texto, como encabezado"""
+    p = doc.add_paragraph()
+    run = p.add_run(block['text'])
+    run.bold = True
+    p.paragraph_format.space_before = Pt(8)
 
 
-def _format_all_table_cells(table, font_name: str = 'Aptos', font_size: int = 10):
-    """Aplica formato a todas las celdas de una tabla"""
-    for row in table.rows:
-        for cell in row.cells:
-            _format_table_cell(cell, font_name, font_size)
+@timed
+def _add_list_item(doc: Document, block: dict):
+    """Ítem de lista con viñeta o numerado, en el estilo de su nivel de anidamiento"""
+    _add_runs(doc.add_paragraph(style=LIST_STYLES[block['type']][block['level']]),
+              block['runs'])
 
 
-def _set_table_borders(table, color_hex: str = "000000", size: int = 4):
-    """
-    Establece bordes negros en todas las celdas de la tabla
-    size: tamaño del borde en eighths of a point (4 = 0.5pt, 8 = 1pt)
-    """
-    tbl = table._tbl
-    tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {nsdecls("w")}/>')
-
-    # Crear bordes de tabla
-    tblBorders = parse_xml(
-        f'<w:tblBorders {nsdecls("w")}>'
-        f'<w:top w:val="single" w:sz="{size}" w:color="{color_hex}"/>'
-        f'<w:left w:val="single" w:sz="{size}" w:color="{color_hex}"/>'
-        f'<w:bottom w:val="single" w:sz="{size}" w:color="{color_hex}"/>'
-        f'<w:right w:val="single" w:sz="{size}" w:color="{color_hex}"/>'
-        f'<w:insideH w:val="single" w:sz="{size}" w:color="{color_hex}"/>'
-        f'<w:insideV w:val="single" w:sz="{size}" w:color="{color_hex}"/>'
-        f'</w:tblBorders>'
-    )
-
-    # Eliminar bordes existentes si los hay
-    existing_borders = tblPr.find(qn('w:tblBorders'))
-    if existing_borders is not None:
-        tblPr.remove(existing_borders)
-
-    tblPr.append(tblBorders)
-
-    if tbl.tblPr is None:
-        tbl.insert(0, tblPr)
-
-
-def _remove_table_borders(table):
-    """Elimina todos los bordes de una tabla"""
-    tbl = table._tbl
-    tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(f'<w:tblPr {nsdecls("w")}/>')
-
-    # Crear bordes invisibles
-    tblBorders = parse_xml(
-        f'<w:tblBorders {nsdecls("w")}>'
-        f'<w:top w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'<w:left w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'<w:bottom w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'<w:right w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'<w:insideH w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'<w:insideV w:val="none" w:sz="0" w:space="0" w:color="auto"/>'
-        f'</w:tblBorders>'
-    )
-
-    # Eliminar bordes existentes si los hay
-    existing_borders = tblPr.find(qn('w:tblBorders'))
-    if existing_borders is not None:
-        tblPr.remove(existing_borders)
-
-    tblPr.append(tblBorders)
-
-    if tbl.tblPr is None:
-        tbl.insert(0, tblPr)
-
-
-def _add_principles_table(doc: Document, principles: list, lang_config: dict = None):
+def _set_cell_shading(cell, color_hex: str):
+    """Establece el color de fondo de una celda"""
+    cell._tc.get_or_add_tcPr().append(OxmlElement('w:shd', {qn('w:fill'): color_hex,
+                                                            qn('w:val'): 'clear'}))
+
+
+def _enable_last_row(table):
+    """Activa el formato de última fila del estilo de la tabla (w:tblLook)"""
+    look = table._tbl.tblPr.find(qn('w:tblLook'))
+    look.set(qn('w:lastRow'), '1')
+    look.set(qn('w:val'), '04E0')
+
+
+@timed
+def _add_principles_table(doc: Document, block: dict):
     """
     Agrega una tabla de principios con 5 columnas:
     - Columnas 0, 2, 4: Contenido (5.2 cm cada una)
     - Columnas 1, 3: Separadores de 1 cm
-    - Sin bordes
+    - Sin bordes (estilo Aninver Principles Table)
     - Fila 0: Headers "Principle 1/2/3" en azul claro (BDD6EE) - traducido según idioma
     - Fila 1: Nombres de principios 1-3 en azul oscuro (2E74B5), texto blanco
     - Fila 2: Descripciones 1-3
     - Fila 3: Nombres de principios 4-6 en azul oscuro (sin header)
     - Fila 4: Descripciones 4-6
     """
+    principles = block['principles']
     if not principles:
         return
 
-    # Obtener etiqueta traducida para "Principle"
-    labels = lang_config.get('table_labels', {}) if lang_config else {}
-    principle_label = labels.get('principle', 'Principle')
+    # Etiqueta traducida para "Principle"
+    principle_label = block['label']
 
     num_principles = len(principles)
 
@@ -373,13 +186,12 @@ def _add_principles_table(doc: Document, principles: list, lang_config: dict = N
     num_rows = 3 if num_principles <= 3 else 5
 
     # Crear tabla con 5 columnas (3 contenido + 2 separadores)
-    table = doc.add_table(rows=num_rows, cols=5)
+    # El estilo quita los bordes, aplica Aptos 10 con 3 pt de espaciado y pone en negrita
+    # el encabezado y en negrita blanca las filas de nombres (filas alternas)
+    table = doc.add_table(rows=num_rows, cols=5, style='Aninver Principles Table')
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
     table.autofit = False  # Desactivar autofit para controlar anchos
 
-    # IMPORTANTE: Eliminar bordes de la tabla
-    _remove_table_borders(table)
-
     # Anchos de columna
     separator_width = Cm(1)   # 1 cm para separadores
     content_width = Cm(5.2)   # 5.2 cm cada columna de contenido
@@ -401,37 +213,21 @@ def _add_principles_table(doc: Document, principles: list, lang_config: dict = N
         cell = row0.cells[col_idx]
         cell.text = f"{principle_label} {i + 1}"
         _set_cell_shading(cell, COLORS['principle_header'])
-        for para in cell.paragraphs:
-            for run in para.runs:
-                run.font.bold = True
-                run.font.name = 'Aptos'
-                run.font.size = Pt(10)
 
     # === FILA 1: Nombres de principios 1-3 ===
     row1 = table.rows[1]
     for i, principle in enumerate(principles[:3]):
         col_idx = content_cols[i]
         cell = row1.cells[col_idx]
-        cell.text = principle.get('name', '')
+        cell.text = principle['name']
         _set_cell_shading(cell, COLORS['principle_title'])
-        for para in cell.paragraphs:
-            for run in para.runs:
-                run.font.color.rgb = RGBColor(255, 255, 255)
-                run.font.bold = True
-                run.font.name = 'Aptos'
-                run.font.size = Pt(10)
 
     # === FILA 2: Descripciones de principios 1-3 ===
     row2 = table.rows[2]
     for i, principle in enumerate(principles[:3]):
         col_idx = content_cols[i]
         cell = row2.cells[col_idx]
-        cell.text = principle.get('description', '')
-        for para in cell.paragraphs:
-            para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-            for run in para.runs:
-                run.font.name = 'Aptos'
-                run.font.size = Pt(10)
+        cell.text = principle['description']
 
     # === Si hay más de 3 principios ===
     if num_principles > 3:
@@ -440,82 +236,38 @@ def _add_principles_table(doc: Document, principles: list, lang_config: dict = N
         for i, principle in enumerate(principles[3:6]):
             col_idx = content_cols[i]
             cell = row3.cells[col_idx]
-            cell.text = principle.get('name', '')
+            cell.text = principle['name']
             _set_cell_shading(cell, COLORS['principle_title'])
-            for para in cell.paragraphs:
-                for run in para.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-                    run.font.bold = True
-                    run.font.name = 'Aptos'
-                    run.font.size = Pt(10)
 
         # FILA 4: Descripciones de principios 4-6
         row4 = table.rows[4]
         for i, principle in enumerate(principles[3:6]):
             col_idx = content_cols[i]
             cell = row4.cells[col_idx]
-            cell.text = principle.get('description', '')
-            for para in cell.paragraphs:
-                para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                for run in para.runs:
-                    run.font.name = 'Aptos'
-                    run.font.size = Pt(10)
-
-    # Aplicar interlineado sencillo a todas las celdas
-    for row in table.rows:
-        for cell in row.cells:
-            for para in cell.paragraphs:
-                para.paragraph_format.line_spacing = 1.0
-                para.paragraph_format.space_before = Pt(3)
-                para.paragraph_format.space_after = Pt(3)
+            cell.text = principle['description']
 
     doc.add_paragraph()
 
 
-def _add_phase_improved(doc: Document, phase: dict, lang_config: dict):
-    """
-    Agrega una fase con el formato mejorado de tablas de actividades
-    """
-    # Título de la fase
-    doc.add_paragraph(phase.get('title', ''), style='Aninver Title 2')
-
-    # Descripción de la fase
-    if phase.get('description'):
-        _add_paragraph(doc, phase['description'])
-
-    tasks = phase.get('tasks', [])
-    if tasks:
-        # 1. Tabla de Activities/Timeline (vertical)
-        _add_activities_timeline_table_improved(doc, tasks, phase, lang_config)
-
-        # 2. Tabla Gantt con semanas/meses
-        _add_gantt_table_improved(doc, tasks, phase, lang_config)
-
-        # 3. Detalle de cada tarea
-        for task in tasks:
-            task_code = task.get('code', '')
-            task_title = task.get('title', '')
-            doc.add_paragraph(f"{task_code}. {task_title}", style='Aninver Title 3')
-
-            # Descripción de la tarea (sin forzar bullets)
-            if task.get('description'):
-                _add_content_block(doc, task['description'])
-
-            # Items solo si existen y son relevantes
-            if task.get('items'):
-                for item in task['items']:
-                    p = doc.add_paragraph(style='List Bullet')
-                    p.add_run(item)
-
-    # Entregables de la fase
-    if phase.get('deliverables'):
-        for deliverable in phase['deliverables']:
-            _add_deliverable_box(doc, deliverable)
+def _phase_fragment(phase: Phase, lang_config: dict) -> str:
+    """Cuerpo (w:body) de un documento con solo la fase, para render_phase_fragments"""
+    return _section_fragment(phase_blocks, phase, lang_config)
 
-    doc.add_paragraph()
+
+@timed
+def _append_fragment(doc: Document, fragment: str):
+    """Inserta al final del documento los elementos de un cuerpo de _section_fragment"""
+    body = doc.element.body
+    section = body.find(qn('w:sectPr'))
+    # Se insertan copias: mover los elementos entre árboles de lxml es mucho más lento
+    # (segundos en un Work Plan de cientos de filas)
+    for element in parse_xml(fragment):
+        if element.tag != qn('w:sectPr'):
+            section.addprevious(deepcopy(element))
 
 
-def _add_activities_timeline_table_improved(doc: Document, tasks: list, phase: dict, lang_config: dict = None):
+@timed
+def _add_activities_timeline_table_improved(doc: Document, block: dict):
     """
     Agrega la tabla vertical de Activities/Timeline con formato mejorado
     - Header "Activities" en azul (traducido según idioma)
@@ -524,171 +276,93 @@ def _add_activities_timeline_table_improved(doc: Document, tasks: list, phase: d
     - SIN bordes (los bordes solo van en la tabla Gantt)
     - SIN párrafo vacío después (para que Gantt quede pegado)
     """
-    # Obtener etiquetas traducidas
-    labels = lang_config.get('table_labels', {}) if lang_config else {}
-    activities_label = labels.get('activities', 'Activities')
-    timeline_label = labels.get('timeline', 'Timeline')
+    items = block['items']
+    num_tasks = len(items)
 
-    num_tasks = len(tasks)
-
-    # Crear tabla: 1 header + n tareas (para Activities) + 1 timeline
-    table = doc.add_table(rows=num_tasks + 2, cols=1)
+    # Crear tabla: 1 header + n tareas (para Activities) + 1 timeline. El estilo sombrea
+    # el cuerpo en gris, la primera fila en azul y la última (Timeline) en verde
+    table = doc.add_table(rows=num_tasks + 2, cols=1, style='Aninver Activities Table')
     table.alignment = WD_TABLE_ALIGNMENT.LEFT
+    _enable_last_row(table)
 
     # NO aplicar bordes a esta tabla - solo la tabla Gantt lleva bordes
 
     # Fila 0: Activities header
-    cell = table.cell(0, 0)
-    cell.text = activities_label
-    _set_cell_shading(cell, COLORS['activities_header'])
-    for run in cell.paragraphs[0].runs:
-        run.font.color.rgb = RGBColor(255, 255, 255)
-        run.font.bold = True
+    table.cell(0, 0).text = block['header']
 
     # Filas 1 a n: Lista de actividades como a., b., c.
-    for t_idx, task in enumerate(tasks):
-        task_letter = chr(ord('a') + t_idx)
-        task_title = task.get('title', '')
-        cell = table.cell(t_idx + 1, 0)
-        cell.text = f"{task_letter}.  {task_title}"
-        _set_cell_shading(cell, COLORS['activities_body'])
+    for t_idx, item in enumerate(items):
+        table.cell(t_idx + 1, 0).text = item
 
     # Última fila: Timeline
-    start = phase.get('start_week', phase.get('start_month', ''))
-    end = phase.get('end_week', phase.get('end_month', ''))
-
-    cell = table.cell(num_tasks + 1, 0)
-    cell.text = timeline_label
-    _set_cell_shading(cell, COLORS['timeline'])
-    for run in cell.paragraphs[0].runs:
-        run.font.color.rgb = RGBColor(255, 255, 255)
-        run.font.bold = True
-
-    # Aplicar formato Aptos 10 e interlineado sencillo a todas las celdas
-    _format_all_table_cells(table)
+    table.cell(num_tasks + 1, 0).text = block['footer']
 
     # NO añadir párrafo aquí - la tabla Gantt debe quedar pegada
 
 
-def _add_gantt_table_improved(doc: Document, tasks: list, phase: dict, lang_config: dict = None):
+@timed
+def _add_gantt_table_improved(doc: Document, block: dict):
     """
     Agrega la tabla Gantt mejorada con:
     - "Weeks/Semanas" en itálica como header (traducido según idioma)
     - SIEMPRE 12 columnas: 1 para código de tarea + 11 para semanas
-    - El rango de semanas se ajusta para cubrir las tareas de la fase
+    - El rango de semanas empieza en la primera semana de las tareas de la fase
     - Códigos a., b., c. para las tareas
     - Celdas coloreadas (#FFC000) cuando hay actividad
     - E1, E2... para eventos dentro de la celda amarilla
     - D1, D2... para deliverables dentro de la celda amarilla
-    - Bordes negros en todas las celdas
+    - Bordes negros en todas las celdas (estilo Aninver Gantt Table)
     - Leyenda al final alineada a la derecha (traducida según idioma)
-    """
-    # Obtener etiquetas traducidas
-    labels = lang_config.get('table_labels', {}) if lang_config else {}
-    weeks_label = labels.get('weeks', 'Weeks')
-    legend_text = labels.get('legend', 'E: Event, D: Deliverable')
-    event_prefix = labels.get('event_prefix', 'E')
-    deliverable_prefix = labels.get('deliverable_prefix', 'D')
 
-    NUM_WEEK_COLUMNS = 11  # Siempre 11 columnas de semanas
-
-    # Determinar el rango de semanas que necesitamos mostrar
-    # Buscamos la semana mínima y máxima de todas las tareas
-    all_starts = [task.get('start_week', task.get('start_month', 1)) for task in tasks]
-    all_ends = [task.get('end_week', task.get('end_month', 1)) for task in tasks]
-
-    min_week = min(all_starts) if all_starts else 1
-    max_week = max(all_ends) if all_ends else min_week + 10
-
-    # Calcular el rango de semanas a mostrar (centrado en las tareas si es posible)
-    task_span = max_week - min_week + 1
-
-    if task_span <= NUM_WEEK_COLUMNS:
-        # Las tareas caben en 11 columnas, empezamos desde min_week
-        display_start = min_week
-    else:
-        # Las tareas no caben, ajustamos para mostrar el rango relevante
-        display_start = min_week
-
-    num_tasks = len(tasks)
+    Las celdas activas y los marcadores vienen del IR (document_ir._gantt).
+    """
+    labels = block['labels']
+    rows = block['rows']
 
     # Crear tabla: SIEMPRE 12 columnas (1 tarea + 11 semanas)
-    table = doc.add_table(rows=num_tasks + 1, cols=NUM_WEEK_COLUMNS + 1)
+    table = doc.add_table(rows=len(rows) + 1, cols=len(labels) + 1,
+                          style='Aninver Gantt Table')
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
 
-    # Aplicar bordes negros a la tabla
-    _set_table_borders(table)
+    # Fila header con "Weeks/Semanas" (el estilo la pone en itálica) y números de semana
+    header_cells = table.rows[0].cells
+    header_cells[0].text = block['header']
+    for i, label in enumerate(labels):
+        header_cells[i + 1].text = label
+
+    # Filas de tareas: código (a., b., c.) y celdas activas, con el evento o entregable
+    for t_idx, row in enumerate(rows):
+        row_cells = table.rows[t_idx + 1].cells
+        row_cells[0].text = row['label']
+        for col, _, marker in row['bars']:
+            cell = row_cells[col + 1]
+            _set_cell_shading(cell, COLORS['gantt_active'])
+            if marker is not None:
+                cell.text = marker
+
+    _add_legend(doc, block['legend'])
 
-    # Fila header con "Weeks/Semanas" en itálica
-    header_row = table.rows[0]
-    weeks_cell = header_row.cells[0]
-    weeks_cell.text = ""
-    p = weeks_cell.paragraphs[0]
-    run = p.add_run(weeks_label)
-    run.italic = True
 
-    # Números de semana (11 columnas)
-    for i in range(NUM_WEEK_COLUMNS):
-        week_num = display_start + i
-        header_row.cells[i + 1].text = str(week_num)
-
-    # Contador de eventos para esta fase
-    event_counter = 0
-
-    # Filas de tareas
-    for t_idx, task in enumerate(tasks):
-        row = table.rows[t_idx + 1]
-
-        # Código de tarea (a., b., c., etc.)
-        task_letter = chr(ord('a') + t_idx)
-        row.cells[0].text = f"{task_letter}."
-
-        # Determinar período de inicio y fin de la tarea
-        task_start = task.get('start_week', task.get('start_month', display_start))
-        task_end = task.get('end_week', task.get('end_month', task_start))
-
-        # Colorear celdas activas (relativas al display_start)
-        for week in range(task_start, task_end + 1):
-            col_idx = week - display_start + 1
-            if 1 <= col_idx <= NUM_WEEK_COLUMNS:
-                cell = row.cells[col_idx]
-                _set_cell_shading(cell, COLORS['gantt_active'])
-
-                # Marcar eventos en la celda
-                event_week = task.get('event_week', task.get('event_month'))
-                if event_week == week:
-                    event_counter += 1
-                    cell.text = f"{event_prefix}{event_counter}"
-
-                # Marcar deliverables en la celda - usar código explícito si existe
-                deliverable_week = task.get('deliverable_week', task.get('deliverable_month'))
-                if deliverable_week == week:
-                    deliverable_code = task.get('deliverable_code')
-                    if deliverable_code:
-                        cell.text = deliverable_code
-                    else:
-                        # Fallback: usar prefijo genérico (no recomendado)
-                        cell.text = f"{deliverable_prefix}"
-
-    # Aplicar formato Aptos 10 e interlineado sencillo a todas las celdas
-    _format_all_table_cells(table)
-
-    # Agregar leyenda como párrafo alineado a la derecha
+@timed
+def _add_legend(doc: Document, text: str):
+    """Leyenda de una tabla: párrafo alineado a la derecha, en itálica de 9 pt"""
     legend_para = doc.add_paragraph()
     legend_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    run = legend_para.add_run(legend_text)
+    run = legend_para.add_run(text)
     run.italic = True
     run.font.size = Pt(9)
 
 
-def _add_deliverable_box(doc: Document, deliverable: dict):
+@timed
+def _add_deliverable_box(doc: Document, block: dict):
     """
     Agrega una caja de entregable con formato del sample:
     - 2 columnas: código (1.73") + nombre (4.17")
     - Colores amarillos
     - Formato Aptos 10
+    (estilo Aninver Deliverable Table: la primera columna va en negrita sobre FFC000)
     """
-    table = doc.add_table(rows=1, cols=2)
+    table = doc.add_table(rows=1, cols=2, style='Aninver Deliverable Table')
 
     # Establecer anchos de columnas (en twips: 1 inch = 1440 twips)
     table.columns[0].width = Twips(2494)  # ~1.73 inches
@@ -697,23 +371,17 @@ def _add_deliverable_box(doc: Document, deliverable: dict):
     # Primera celda: código del deliverable
     cell = table.cell(0, 0)
     cell.width = Twips(2494)
-    cell.text = deliverable.get('code', 'Deliverable')
-    _set_cell_shading(cell, COLORS['deliverable_header'])
-    for run in cell.paragraphs[0].runs:
-        run.font.bold = True
+    cell.text = block['code']
 
     # Segunda celda: nombre del deliverable
     cell = table.cell(0, 1)
     cell.width = Twips(6000)
-    cell.text = deliverable.get('name', '')
-    _set_cell_shading(cell, COLORS['deliverable_body'])
-
-    # Aplicar formato Aptos 10 a las celdas
-    _format_all_table_cells(table)
+    cell.text = block['name']
 
     doc.add_paragraph()
 
 
+@timed
 def _add_experience_box(doc: Document, text: str):
     """Agrega una caja de experiencia previa"""
     table = doc.add_table(rows=1, cols=1)
@@ -723,201 +391,111 @@ def _add_experience_box(doc: Document, text: str):
     doc.add_paragraph()
 
 
-def _add_work_plan(doc: Document, methodology: dict, lang_config: dict):
+def _bar_cells(row_cells: list, bars: list) -> list:
     """
-    Agrega una tabla consolidada de Work Plan con todas las actividades,
-    semanas/meses y entregables/eventos marcados en las celdas correspondientes.
-    Si el proyecto tiene mas de 24 semanas, usa meses en lugar de semanas.
+    Celdas de las barras de una fila del Work Plan: [(celda, texto del marcador o None)]
+
+    Los tramos de más de una columna (merge_bars) se combinan en una celda.
     """
-    phases = methodology.get('phases', [])
-    if not phases:
-        return
+    cells = []
+    for start, length, marker in bars:
+        cell = row_cells[2 + start]
+        if length > 1:
+            cell = cell.merge(row_cells[1 + start + length])
+        cells.append((cell, marker))
+    return cells
 
-    labels = lang_config.get('table_labels', {})
-
-    # Determinar rango de semanas
-    all_weeks = []
-    for phase in phases:
-        all_weeks.append(phase.get('start_week', 1))
-        all_weeks.append(phase.get('end_week', 1))
-        for task in phase.get('tasks', []):
-            all_weeks.append(task.get('start_week', 1))
-            all_weeks.append(task.get('end_week', 1))
-
-    min_week = min(all_weeks) if all_weeks else 1
-    max_week = max(all_weeks) if all_weeks else 12
-    num_weeks = max_week - min_week + 1
-
-    # Si hay mas de 24 semanas, convertir a meses
-    use_months = num_weeks > 24
-    if use_months:
-        # Convertir semanas a meses (4 semanas = 1 mes aproximadamente)
-        min_month = (min_week - 1) // 4 + 1
-        max_month = (max_week - 1) // 4 + 1
-        num_periods = max_month - min_month + 1
-        period_label = labels.get('months', 'M')
-    else:
-        num_periods = num_weeks
-        period_label = labels.get('weeks', 'W')
 
-    # Contar total de filas: titulo + header semanas + (fase + tareas) por cada fase
-    total_rows = 2  # Titulo WORK PLAN + header con numeros de semana/mes
-    for phase in phases:
-        total_rows += 1  # Fila de fase
-        total_rows += len(phase.get('tasks', []))  # Filas de tareas
+@timed
+def _add_work_plan(doc: Document, block: dict):
+    """
+    Agrega una tabla consolidada de Work Plan con todas las actividades,
+    semanas/meses y entregables/eventos marcados en las celdas correspondientes.
+    Las filas, los períodos (semanas, meses o MM/AA) y los tramos de cada barra vienen
+    del IR (document_ir.work_plan_blocks).
+    """
+    rows = block['rows']
+    use_months = block['months']
+    num_periods = len(block['labels'])
 
+    # Filas: titulo WORK PLAN + header con numeros de semana/mes + fases y tareas
+    total_rows = 2 + len(rows)
     # Columnas: Codigo + Actividad + periodos (semanas o meses)
     num_cols = 2 + num_periods
 
-    table = doc.add_table(rows=total_rows, cols=num_cols)
+    # El estilo aplica Aptos 9 con bordes y el título en negrita blanca, centrado, sobre azul
+    table = doc.add_table(rows=total_rows, cols=num_cols, style='Aninver Work Plan Table')
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    _set_table_borders(table)
 
     # === Fila 0: Titulo "WORK PLAN" que abarca todas las columnas ===
     # Merge todas las celdas de la primera fila
     first_cell = table.cell(0, 0)
     last_cell = table.cell(0, num_cols - 1)
     first_cell.merge(last_cell)
-    first_cell.text = "WORK PLAN"
-    _set_cell_shading(first_cell, COLORS['activities_header'])
-    for para in first_cell.paragraphs:
-        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        for run in para.runs:
-            run.font.bold = True
-            run.font.color.rgb = RGBColor(255, 255, 255)
-            run.font.size = Pt(12)
+    first_cell.paragraphs[0].add_run(block['title']).font.size = Pt(12)
 
     # === Fila 1: Headers (vacio, vacio, periodo 1, periodo 2, ...) ===
-    header_row = table.rows[1]
-    header_row.cells[0].text = ""
-    header_row.cells[1].text = ""
-    for i in range(num_periods):
-        if use_months:
-            period_num = min_month + i
-        else:
-            period_num = min_week + i
-        cell = header_row.cells[2 + i]
-        cell.text = str(period_num)
+    header_cells = table.rows[1].cells
+    for i, label in enumerate(block['labels']):
+        cell = header_cells[2 + i]
+        cell.text = label
         for para in cell.paragraphs:
             para.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
     # === Filas de fases y tareas ===
-    current_row = 2
-
-    for phase in phases:
-        phase_title = phase.get('title', '')
-
-        # Fila de fase (merge codigo + actividad)
-        phase_code_cell = table.cell(current_row, 0)
-        phase_name_cell = table.cell(current_row, 1)
-        phase_code_cell.merge(phase_name_cell)
-        phase_code_cell.text = phase_title
-        _set_cell_shading(phase_code_cell, COLORS['timeline'])
-        for para in phase_code_cell.paragraphs:
-            for run in para.runs:
-                run.font.bold = True
-                run.font.color.rgb = RGBColor(255, 255, 255)
-
-        # Colorear celdas de periodos para la fase
-        phase_start = phase.get('start_week', min_week)
-        phase_end = phase.get('end_week', phase_start)
-
-        if use_months:
-            phase_start_period = (phase_start - 1) // 4 + 1
-            phase_end_period = (phase_end - 1) // 4 + 1
-            for period in range(phase_start_period, phase_end_period + 1):
-                col_idx = 2 + (period - min_month)
-                if 0 <= col_idx - 2 < num_periods:
-                    cell = table.cell(current_row, col_idx)
-                    _set_cell_shading(cell, COLORS['timeline'])
-        else:
-            for week in range(phase_start, phase_end + 1):
-                col_idx = 2 + (week - min_week)
-                if 0 <= col_idx - 2 < num_periods:
-                    cell = table.cell(current_row, col_idx)
-                    _set_cell_shading(cell, COLORS['timeline'])
-
-        current_row += 1
-
-        # Filas de tareas
-        for task in phase.get('tasks', []):
-            task_code = task.get('code', '')
-            task_title = task.get('title', '')
-
-            # Codigo de tarea
-            table.cell(current_row, 0).text = task_code
-            # Titulo de tarea
-            table.cell(current_row, 1).text = task_title
-
-            # Colorear celdas activas y marcar deliverables
-            task_start = task.get('start_week', min_week)
-            task_end = task.get('end_week', task_start)
-            deliverable_week = task.get('deliverable_week')
-
-            if use_months:
-                task_start_period = (task_start - 1) // 4 + 1
-                task_end_period = (task_end - 1) // 4 + 1
-                deliverable_period = (deliverable_week - 1) // 4 + 1 if deliverable_week else None
-
-                for period in range(task_start_period, task_end_period + 1):
-                    col_idx = 2 + (period - min_month)
-                    if 0 <= col_idx - 2 < num_periods:
-                        cell = table.cell(current_row, col_idx)
-                        _set_cell_shading(cell, COLORS['gantt_active'])
-
-                        # Marcar deliverable si corresponde
-                        if deliverable_period == period:
-                            deliverable_code = task.get('deliverable_code', '')
-                            if deliverable_code:
-                                cell.text = deliverable_code
-                                for para in cell.paragraphs:
-                                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                                    for run in para.runs:
-                                        run.font.bold = True
-            else:
-                for week in range(task_start, task_end + 1):
-                    col_idx = 2 + (week - min_week)
-                    if 0 <= col_idx - 2 < num_periods:
-                        cell = table.cell(current_row, col_idx)
-                        _set_cell_shading(cell, COLORS['gantt_active'])
-
-                        # Marcar deliverable si corresponde
-                        if deliverable_week == week:
-                            deliverable_code = task.get('deliverable_code', '')
-                            if deliverable_code:
-                                cell.text = deliverable_code
-                                for para in cell.paragraphs:
-                                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                                    for run in para.runs:
-                                        run.font.bold = True
-
-                        # Marcar evento si corresponde
-                        event_week = task.get('event_week')
-                        if event_week == week:
-                            event_code = task.get('event_code', 'E')
-                            cell.text = event_code
-                            for para in cell.paragraphs:
-                                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                                for run in para.runs:
-                                    run.font.bold = True
-
-            current_row += 1
-
-    # Aplicar formato a todas las celdas
-    _format_all_table_cells(table, font_size=9)
+    # Las celdas se leen una vez por fila: table.cell() recorre toda la tabla en cada llamada
+    for row, table_row in zip(rows, table.rows[2:]):
+        row_cells = table_row.cells
+        if row['phase']:
+            # Fila de fase (merge codigo + actividad) y sus periodos en el color de la fase
+            phase_code_cell = row_cells[0]
+            phase_code_cell.merge(row_cells[1])
+            phase_code_cell.text = row['title']
+            _set_cell_shading(phase_code_cell, COLORS['timeline'])
+            for para in phase_code_cell.paragraphs:
+                for run in para.runs:
+                    run.font.bold = True
+                    run.font.color.rgb = RGBColor(255, 255, 255)
+            for cell, _ in _bar_cells(row_cells, row['bars']):
+                _set_cell_shading(cell, COLORS['timeline'])
+            continue
+
+        # Fila de tarea: codigo, titulo, celdas activas y deliverables (y eventos, en semanas)
+        row_cells[0].text = row['code']
+        row_cells[1].text = row['title']
+        for cell, marker in _bar_cells(row_cells, row['bars']):
+            _set_cell_shading(cell, COLORS['gantt_active'])
+            if marker:
+                cell.text = marker
+                for para in cell.paragraphs:
+                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                    for run in para.runs:
+                        run.font.bold = True
 
     # Ajustar ancho de columnas
     # Columna codigo: estrecha, columna actividad: mas ancha, periodos: estrechas
+    # Las celdas combinadas llevan la suma de las columnas que abarcan
+    col_widths = [Cm(1.2), Cm(6)] + [Cm(0.8 if use_months else 1.0)] * num_periods
     for row in table.rows:
-        row.cells[0].width = Cm(1.2)
-        row.cells[1].width = Cm(6)
-        for i in range(2, num_cols):
-            row.cells[i].width = Cm(0.8 if use_months else 1.0)
-
-    # Leyenda
-    legend_text = labels.get('legend', 'E: Event, P: Product')
-    legend_para = doc.add_paragraph()
-    legend_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    run = legend_para.add_run(legend_text)
-    run.italic = True
-    run.font.size = Pt(9)
+        col = 0
+        for tc in row._tr.tc_lst:
+            tc.width = Emu(sum(col_widths[col:col + tc.grid_span]))
+            col += tc.grid_span
+
+    _add_legend(doc, block['legend'])
+
+
+# Dibujo de cada tipo de bloque del IR
+_BLOCK_WRITERS = {
+    'heading': _add_heading,
+    'paragraph': _add_paragraph,
+    'subheading': _add_subheading,
+    'bullet': _add_list_item,
+    'numbered': _add_list_item,
+    'spacer': lambda doc, block: doc.add_paragraph(),
+    'principles': _add_principles_table,
+    'activities': _add_activities_timeline_table_improved,
+    'gantt': _add_gantt_table_improved,
+    'deliverable': _add_deliverable_box,
+    'work_plan': _add_work_plan,
+}
@@ -1,433 +0,0 @@
-"""
-Metodología específica para el proyecto FLFP Creative Sector Nigeria (GIZ SKYE II)
-"""
-
-def get_flfp_methodology():
-    """
-    Retorna la metodología completa para el proyecto:
-    "Enhancing Employment Opportunities and Female Labour Force Participation (FLFP)
-    in the Creative Sector in Nigeria"
-
-    GIZ SKYE II - Output 3.2
-    Duration: 45 weeks (Feb 2026 - Oct 2026)
-    States: Edo, Enugu, Plateau
-    """
-
-    return {
-        "introduction": """The team at Aninver Partners presents this comprehensive methodology for the implementation of consultancy services aimed at **strengthening women's participation and employability in Nigeria's technical filmmaking sector** under the GIZ SKYE II programme. Our approach is specifically designed to address the critical gender gap in technical filmmaking, where only **4% of cinematographers are women** and less than **30%** participate in sound production, post-production, and editing roles. The consultants will employ an integrated methodology that combines rigorous **Employment and Labour Market Analysis (ELMA)**, capacity development through **Training of Trainers (ToT)**, hands-on skills transfer to **120 women beneficiaries** across Edo, Enugu, and Plateau States, and institutional strengthening of the **Victor Uwaifo Creative Hub (VUCH)**. Our strategy ensures alignment with GIZ SKYE II's overarching objective of improving employment and income opportunities for Nigerian youth, with particular emphasis on **Female Labour Force Participation (FLFP)** in high-income generating technical skills within the creative sector.""",
-
-        "context": """**Understanding the Project Context**
-
-The **Skills Development for Youth Employment (SKYE II)** programme represents a strategic intervention by GIZ, BMZ, and SDC to address Nigeria's persistent employment challenges, particularly the significant gender disparities in technical vocational education and training. Nigeria faces profound inequalities between women and men across most human development indices, with the gap widening notably in education, employment, and economic participation. Men earn approximately **five times more** than women, who have limited ownership of assets and face multiple intersecting forms of discrimination that reduce their chances of accessing the formal labour market.
-
-**The Creative Sector Opportunity**
-
-Nigeria's creative sector, particularly the film industry commonly known as **Nollywood**, presents a unique opportunity to address gender imbalances in TVET and increase Female Labour Force Participation. As the world's second-largest film industry by volume, Nollywood generates significant employment and economic value. However, technical roles remain overwhelmingly male-dominated, with women comprising only 4% of cinematographers and less than 30% in sound production, post-production, and editing. This underrepresentation reflects broader societal barriers including cultural stigma, limited access to technical training, and discriminatory social norms that discourage women from pursuing technical careers.
-
-**Geographic Focus: Edo, Enugu, and Plateau States**
-
-The intervention targets three strategically selected states that represent diverse aspects of Nigeria's creative ecosystem. **Edo State** hosts the Victor Uwaifo Creative Hub (VUCH), a key infrastructure asset that will serve as the anchor institution for sustainable training delivery. **Enugu State** represents the southeastern creative industry hub with a growing film production cluster. **Plateau State** offers opportunities to expand technical filmmaking skills development in the north-central region, promoting geographic diversity in the creative sector's development.
-
-**Institutional Framework and Stakeholders**
-
-The project operates within a complex institutional landscape involving multiple stakeholders at federal and state levels. The **National Board for Technical Education (NBTE)** provides the regulatory framework for TVET standards, while state-level TVET institutions and job centres serve as implementation partners. The **Victor Uwaifo Creative Hub** in Edo State represents a critical partner facility requiring capacity strengthening to function as a sustainable training academy. Private sector actors, including film production companies, Nollywood guilds, and industry associations, are essential partners for internship placements and employment pathways for trained beneficiaries.
-
-**SKYE II Programme Alignment**
-
-This consultancy directly supports **SKYE II Output 3.2**, contributing to the quantitative and qualitative expansion of active labour market measures offered by job placement and counselling institutions. The intervention aligns with the programme's integrated approach combining supply-side measures (technical skills training), demand-side interventions (private sector engagement for internships), and employment services (job matching and career counselling). Gender equality serves as an integral cross-cutting objective, with specific targets including **50% female participation** across all activities and prioritisation of partnerships with institutions demonstrating commitment to gender-responsive practices.""",
-
-        "principles": [
-            {
-                "name": "Gender-Responsive Design",
-                "description": "All interventions will be designed with explicit attention to the barriers women face in accessing technical filmmaking training and employment. The consultants will ensure that training schedules accommodate women's care responsibilities, locations are accessible and safe, and curricula address gender-specific challenges including workplace harassment and mobility constraints. We will actively promote women's inclusion in male-dominated technical roles through targeted outreach, female role models, and mentorship structures."
-            },
-            {
-                "name": "Market-Driven Skills Development",
-                "description": "The ELMA will provide evidence-based insights into labour market demands, ensuring that the five technical filmmaking skills selected for training reflect actual industry needs and employment opportunities. The team at Aninver will engage extensively with private sector employers, production companies, and industry associations to validate skills requirements and secure internship placements, ensuring that trained beneficiaries have clear pathways to employment."
-            },
-            {
-                "name": "Sustainability and Local Ownership",
-                "description": "The consultants will prioritise building sustainable institutional capacity that continues beyond the project period. This includes developing a self-sustaining trainer engagement model for VUCH that does not depend on government or donor funding, creating partnerships with local industry players for ongoing training delivery, and ensuring that curricula and training materials are owned and maintained by local institutions."
-            },
-            {
-                "name": "Inclusive Participation",
-                "description": "We will ensure that training opportunities reach the most vulnerable groups, including women with disabilities who face compounded barriers to economic participation. The selection of beneficiaries will apply transparent criteria that prioritise disadvantaged women while ensuring representation across all ethnic and religious communities in the target states. All measures will be equally accessible regardless of background."
-            },
-            {
-                "name": "Quality and Accountability",
-                "description": "The team will implement robust quality assurance mechanisms including clear KPIs, regular monitoring and evaluation, and systematic documentation of outcomes. We will maintain close coordination with GIZ's M&E team to ensure alignment with SKYE II's results-based monitoring system. All deliverables will meet professional standards and be validated through stakeholder engagement processes."
-            },
-            {
-                "name": "Do-No-Harm and Conflict Sensitivity",
-                "description": "Given Nigeria's diverse socio-political context and potential for conflict escalation, the consultants will apply the do-no-harm principle throughout implementation. All interventions will be designed to avoid conflict-aggravating effects, ensure equitable access across ethnic and religious groups, and follow security recommendations from GIZ's Risk Management Office. Prior RMO consultation will inform all field activities."
-            }
-        ],
-
-        "phases": [
-            {
-                "title": "Phase 1: Project Inception and Planning",
-                "description": """The inception phase establishes the foundation for successful project implementation through comprehensive planning, stakeholder alignment, and methodology refinement. The consultants will conduct onboarding meetings with GIZ SKYE II staff and state partners in Edo, Enugu, and Plateau to establish clear communication channels, agree on collaboration modalities, and confirm implementation timelines. This phase includes preliminary stakeholder mapping to identify key actors in the technical filmmaking ecosystem across the three states, including TVET institutions, film production companies, industry guilds, women's organisations, and potential internship providers. The team will develop detailed work plans, refine data collection methodologies for the ELMA, and establish coordination mechanisms with GIZ's M&E team to ensure alignment with the programme's results-based monitoring system.""",
-                "start_week": 1,
-                "end_week": 4,
-                "tasks": [
-                    {
-                        "code": "1A",
-                        "title": "Onboarding and Alignment with GIZ SKYE II",
-                        "description": """The consultants will conduct two onboarding and planning meetings as specified in the ToR: one virtual session and one in-person meeting with SKYE partners from Edo, Enugu, and Plateau States. These sessions will establish shared understanding of project objectives, confirm roles and responsibilities, and agree on communication protocols. We will present our detailed work plan, discuss coordination with GIZ's M&E team on data collection methodologies, and clarify reporting requirements. The virtual meeting will focus on administrative arrangements and document review, while the in-person meeting will enable deeper discussion of local context, stakeholder dynamics, and potential implementation challenges in each state.""",
-                        "items": [
-                            "Conduct virtual onboarding meeting with GIZ project manager and state partners",
-                            "Facilitate in-person planning meeting with SKYE partners from all three states",
-                            "Present and refine detailed work plan and implementation timeline",
-                            "Establish communication protocols and coordination mechanisms",
-                            "Agree on data collection methodologies with M&E team"
-                        ],
-                        "start_week": 1,
-                        "end_week": 2,
-                        "deliverable_week": 2
-                    },
-                    {
-                        "code": "1B",
-                        "title": "Preliminary Stakeholder Mapping and Context Analysis",
-                        "description": """The team at Aninver will conduct comprehensive stakeholder mapping across Edo, Enugu, and Plateau States to identify all relevant actors in the technical filmmaking ecosystem. This includes TVET institutions offering relevant programmes, film production companies and studios, Nollywood guilds and industry associations, women's organisations and gender-focused CSOs, potential internship providers, and government agencies responsible for creative industry development. We will assess each stakeholder's role, influence, and potential contribution to project objectives, developing engagement strategies tailored to different stakeholder categories. The mapping will pay particular attention to identifying female-led organisations and women in leadership positions who can serve as role models and mentors.""",
-                        "items": [
-                            "Identify TVET institutions and creative hubs in target states",
-                            "Map film production companies and potential internship providers",
-                            "Identify Nollywood guilds, industry associations, and professional networks",
-                            "Assess women's organisations and gender-focused CSOs",
-                            "Develop stakeholder engagement matrix with influence and interest analysis",
-                            "Identify female role models and potential mentors in the industry"
-                        ],
-                        "start_week": 2,
-                        "end_week": 4
-                    },
-                    {
-                        "code": "1C",
-                        "title": "ELMA Methodology Development",
-                        "description": """The consultants will develop a robust methodology for the Employment and Labour Market Analysis, ensuring it captures the specific barriers, opportunities, and skills gaps for women in Nigeria's technical filmmaking sector. We will design mixed-method data collection instruments including surveys, key informant interviews, and focus group discussion guides. The methodology will incorporate gender-sensitive indicators and questions that probe the specific challenges women face in accessing training and employment in technical filmmaking roles. We will coordinate with GIZ's M&E team to ensure data collection methods are clear, appropriate, and aligned with programme monitoring requirements.""",
-                        "items": [
-                            "Design quantitative survey instruments for labour market data collection",
-                            "Develop key informant interview guides for industry stakeholders",
-                            "Create focus group discussion guides with gender-sensitive questions",
-                            "Establish sampling framework ensuring representation across states",
-                            "Coordinate methodology with GIZ M&E team for alignment"
-                        ],
-                        "start_week": 3,
-                        "end_week": 4
-                    }
-                ],
-                "deliverables": []
-            },
-            {
-                "title": "Phase 2: Employment and Labour Market Analysis (ELMA)",
-                "description": """This phase focuses on conducting the comprehensive ELMA on women's participation in technical filmmaking across Edo, Enugu, and Plateau States. The consultants will implement the data collection methodology developed in Phase 1, conducting field visits of minimum two days per state, engaging up to 20 participants in each location through interviews and focus groups. The analysis will identify key trends in women's participation, specific barriers preventing entry and advancement, skills gaps between current training offerings and industry requirements, and actionable recommendations for addressing the gender gap. The ELMA will provide the evidence base for designing targeted training curricula and informing the selection of the five high-demand technical filmmaking skills for the Training of Trainers programme.""",
-                "start_week": 5,
-                "end_week": 15,
-                "tasks": [
-                    {
-                        "code": "2A",
-                        "title": "Desk Research and Secondary Data Analysis",
-                        "description": """The team will conduct comprehensive desk research to establish baseline understanding of women's participation in Nigeria's technical filmmaking sector. We will analyse existing studies on gender in Nollywood, TVET enrolment data disaggregated by gender, employment statistics in the creative sector, and relevant policy documents. The desk research will examine international best practices in gender-responsive technical training for the creative industries, identifying models that could be adapted for the Nigerian context. We will compile a synthesis of secondary data sources that will inform the primary research design and provide context for interpreting field findings.""",
-                        "items": [
-                            "Review existing studies on gender participation in Nollywood",
-                            "Analyse TVET enrolment data disaggregated by gender",
-                            "Examine creative sector employment statistics from national sources",
-                            "Review relevant policy documents on gender and creative industries",
-                            "Identify international best practices in gender-responsive technical training"
-                        ],
-                        "start_week": 5,
-                        "end_week": 8
-                    },
-                    {
-                        "code": "2B",
-                        "title": "Field Data Collection Across Three States",
-                        "description": """The consultants will conduct field visits to Edo, Enugu, and Plateau States, spending minimum two days in each location as specified in the ToR. We will engage up to 20 participants per state through key informant interviews with industry leaders, film producers, TVET institution heads, and government officials. Focus group discussions will be conducted with women working in or aspiring to enter technical filmmaking roles, including both successful practitioners who can share their experiences and young women facing barriers to entry. We will also interview employers to understand hiring practices, skills requirements, and openness to female technical staff.""",
-                        "items": [
-                            "Conduct field visits to Edo State including VUCH assessment",
-                            "Conduct field visits to Enugu State engaging local film industry actors",
-                            "Conduct field visits to Plateau State covering north-central perspective",
-                            "Interview key informants including industry leaders and TVET heads",
-                            "Facilitate focus group discussions with women in technical filmmaking",
-                            "Document findings with photos and video as appropriate"
-                        ],
-                        "start_week": 8,
-                        "end_week": 11,
-                        "deliverable_week": 12
-                    },
-                    {
-                        "code": "2C",
-                        "title": "ELMA Analysis and Report Development",
-                        "description": """The team at Aninver will analyse all collected data to identify patterns, barriers, and opportunities for increasing women's participation in technical filmmaking. We will develop the 10-page inception report summarising preliminary findings and the 30-page final ELMA report as specified in the ToR. The analysis will identify the five high-demand technical filmmaking skills with greatest potential for women's employment, recommend training approaches addressing identified barriers, and propose strategies for internship placement and industry engagement. We will prepare PowerPoint presentations summarising key findings for stakeholder engagement.""",
-                        "items": [
-                            "Analyse quantitative and qualitative data using appropriate methods",
-                            "Identify key trends, barriers, and skills gaps for women",
-                            "Develop actionable recommendations for training and placement",
-                            "Prepare 10-page inception report with preliminary findings",
-                            "Develop comprehensive 30-page ELMA final report",
-                            "Create PowerPoint presentations for validation and dissemination"
-                        ],
-                        "start_week": 11,
-                        "end_week": 14,
-                        "deliverable_week": 15
-                    },
-                    {
-                        "code": "2D",
-                        "title": "ELMA Validation and Presentation Workshops",
-                        "description": """The consultants will organise validation workshops in each state to present ELMA findings to key stakeholders, gather feedback, and build ownership for subsequent interventions. Each workshop will engage up to 40 participants including government officials, TVET institution representatives, industry stakeholders, and women's organisations. The validation process ensures that findings accurately reflect local realities and that recommendations are feasible and accepted by key implementation partners. Following validation, we will organise final presentation workshops to formally hand over the ELMA to partners and launch the training design phase.""",
-                        "items": [
-                            "Organise ELMA validation workshop in Edo State (up to 40 participants)",
-                            "Organise ELMA validation workshop in Enugu State",
-                            "Organise ELMA validation workshop in Plateau State",
-                            "Incorporate stakeholder feedback into final ELMA report",
-                            "Conduct final ELMA presentation and handover workshops",
-                            "Document workshop proceedings and participant feedback"
-                        ],
-                        "start_week": 14,
-                        "end_week": 15,
-                        "deliverable_week": 15
-                    }
-                ],
-                "deliverables": [
-                    {"code": "D1", "name": "Inception Report (10 pages) with ELMA preliminary findings"},
-                    {"code": "D2", "name": "PowerPoint summary of research findings"},
-                    {"code": "D3", "name": "Finalised ELMA Report (30 pages) with PPT summary"}
-                ]
-            },
-            {
-                "title": "Phase 3: Curriculum Development and Training of Trainers",
-                "description": """Building on ELMA findings, this phase focuses on developing gender-sensitive curricula for technical filmmaking skills and building capacity of Master Trainers who will deliver training to end beneficiaries. The consultants will design five short-term training courses in high-demand technical skills identified through the ELMA, ensuring curricula address barriers specific to women and incorporate practical, hands-on learning approaches. We will conduct capacity development workshops for 5 Master Trainers per state (15 total), equipping them with both technical expertise and pedagogical skills to effectively transfer knowledge to women beneficiaries. For VUCH specifically, we will develop or adapt 10 gender-sensitive curricula as part of the hub's strengthening.""",
-                "start_week": 16,
-                "end_week": 24,
-                "tasks": [
-                    {
-                        "code": "3A",
-                        "title": "Design of Five Technical Filmmaking Curricula",
-                        "description": """The team will design five short-term training courses in high-demand technical filmmaking skills based on ELMA findings. Potential skills include cinematography/videography, sound design and production, video editing and post-production, visual effects (VFX), and lighting techniques. Each curriculum will incorporate gender-responsive elements including flexible scheduling options, safety considerations for women, examples featuring female practitioners, and discussion of workplace challenges women may face. Curricula will emphasise practical, hands-on learning with clear competency standards and assessment criteria. We will validate curriculum designs with industry stakeholders to ensure market relevance.""",
-                        "items": [
-                            "Develop curriculum for Cinematography/Videography training",
-                            "Develop curriculum for Sound Design and Production",
-                            "Develop curriculum for Video Editing and Post-Production",
-                            "Develop curriculum for Visual Effects (VFX) fundamentals",
-                            "Develop curriculum for Lighting Techniques",
-                            "Validate curricula with industry stakeholders for market relevance"
-                        ],
-                        "start_week": 16,
-                        "end_week": 18
-                    },
-                    {
-                        "code": "3B",
-                        "title": "Development of 10 Gender-Sensitive Curricula for VUCH",
-                        "description": """For the Victor Uwaifo Creative Hub, the consultants will develop or adapt 10 gender-sensitive curricula for technical skills training as specified in the ToR. Five of these curricula will be used for the Master Trainer programme, while the additional five will expand VUCH's training portfolio for sustainable operations. Each curriculum will include learning objectives, competency standards, training materials, practical exercises, and assessment methods. We will ensure all curricula incorporate gender-responsive pedagogical approaches and address barriers women face in accessing and completing technical training.""",
-                        "items": [
-                            "Adapt five core curricula for VUCH context and equipment",
-                            "Develop five additional technical skills curricula for VUCH portfolio",
-                            "Create trainer guides with gender-responsive facilitation techniques",
-                            "Develop participant workbooks and reference materials",
-                            "Design practical assessment tools and competency checklists",
-                            "Integrate digital learning elements compatible with Edugate Box"
-                        ],
-                        "start_week": 18,
-                        "end_week": 22
-                    },
-                    {
-                        "code": "3C",
-                        "title": "Capacity Development Workshops for Master Trainers",
-                        "description": """The team at Aninver will conduct three Capacity Development workshops to train 5 Master Trainers per state (15 total) in the five technical filmmaking skills. Workshops will cover both technical content and pedagogical approaches for adult learning, with particular emphasis on gender-responsive training delivery. Master Trainers will be selected based on technical expertise, teaching aptitude, and commitment to women's empowerment. The training will include practical teaching exercises where trainees practice delivering curriculum content and receive feedback. We will assess Master Trainers' readiness to independently deliver training to beneficiaries.""",
-                        "items": [
-                            "Select Master Trainer candidates through rigorous assessment process",
-                            "Conduct Capacity Development workshop in Edo State (5 trainers)",
-                            "Conduct Capacity Development workshop in Enugu State (5 trainers)",
-                            "Conduct Capacity Development workshop in Plateau State (5 trainers)",
-                            "Assess Master Trainers' technical and pedagogical competencies",
-                            "Provide feedback and additional support as needed"
-                        ],
-                        "start_week": 18,
-                        "end_week": 20,
-                        "deliverable_week": 20
-                    }
-                ],
-                "deliverables": [
-                    {"code": "D4", "name": "Five technical filmmaking training curricula"},
-                    {"code": "D5", "name": "Ten gender-sensitive curricula for VUCH"},
-                    {"code": "D6", "name": "Master Trainer certification and assessment reports"}
-                ]
-            },
-            {
-                "title": "Phase 4: Beneficiary Training, Mentorship and Internship Placement",
-                "description": """This phase delivers hands-on training to 120 women beneficiaries (40 per state) through the trained Master Trainers, implements structured mentorship programmes, and secures internship placements for at least 50% of participants. The consultants will provide handholding support to Master Trainers during the pilot training delivery, ensuring quality and addressing challenges as they arise. Training will include women with disabilities, ensuring inclusive participation. Beneficiaries will receive certificates of participation, be matched with industry mentors, and be supported in securing internship placements with film production companies and studios. This phase demonstrates the effectiveness of the training model and generates evidence for sustainability.""",
-                "start_week": 21,
-                "end_week": 42,
-                "tasks": [
-                    {
-                        "code": "4A",
-                        "title": "Beneficiary Selection and Training Delivery",
-                        "description": """The consultants will support the selection of 120 women beneficiaries across the three states, ensuring transparent criteria that prioritise disadvantaged women including those with disabilities. We will provide handholding support to Master Trainers as they deliver 10-day hands-on training programmes to 40 beneficiaries per state. Training will take place in suitable facilities with necessary equipment, coordinated with GIZ who will mobilise trainees and provide venues. We will monitor training quality, provide real-time feedback to Master Trainers, and document the learning process through photos, videos, and participant feedback.""",
-                        "items": [
-                            "Develop beneficiary selection criteria ensuring inclusion of women with disabilities",
-                            "Support Master Trainers in delivering training to 40 beneficiaries in Edo State",
-                            "Support training delivery to 40 beneficiaries in Enugu State",
-                            "Support training delivery to 40 beneficiaries in Plateau State",
-                            "Monitor training quality and provide feedback to Master Trainers",
-                            "Document training through photos, videos, and participant testimonials"
-                        ],
-                        "start_week": 21,
-                        "end_week": 30,
-                        "deliverable_week": 30
-                    },
-                    {
-                        "code": "4B",
-                        "title": "Certification and Mentorship Programme Implementation",
-                        "description": """The team will develop and implement structured mentorship programmes connecting trained beneficiaries with experienced professionals in the technical filmmaking industry. We will identify and recruit mentors from among successful women in the industry and supportive male allies who can provide guidance, career advice, and professional networks. Mentorship relationships will be structured with clear expectations, regular check-ins, and specific goals. All trained beneficiaries will receive certificates of participation recognising their completed training and acquired competencies. Certificate ceremonies will be organised to celebrate achievements and build visibility for women in technical filmmaking.""",
-                        "items": [
-                            "Identify and recruit mentors from the technical filmmaking industry",
-                            "Design mentorship programme structure with clear expectations",
-                            "Match beneficiaries with appropriate mentors based on skills and interests",
-                            "Develop certificates of participation with competency recognition",
-                            "Organise certificate presentation ceremonies in each state",
-                            "Establish monitoring mechanisms for mentorship relationships"
-                        ],
-                        "start_week": 28,
-                        "end_week": 35
-                    },
-                    {
-                        "code": "4C",
-                        "title": "Internship Placement and Industry Linkages",
-                        "description": """The consultants will leverage industry relationships developed through the ELMA and stakeholder engagement to secure internship placements for at least 50% of trained beneficiaries (60 women). We will work with GIZ who will engage with the private sector for placement opportunities, while the consultants facilitate matching beneficiaries with appropriate employers based on skills, location, and interests. Internship terms will be negotiated to ensure meaningful learning experiences with potential for employment conversion. We will monitor internship progress, address any challenges, and document placement outcomes including employment conversions.""",
-                        "items": [
-                            "Develop database of potential internship providers across three states",
-                            "Negotiate internship terms ensuring quality learning experiences",
-                            "Match beneficiaries with appropriate internship opportunities",
-                            "Coordinate logistics including transport support for interns",
-                            "Monitor internship progress and address emerging challenges",
-                            "Document placement outcomes and employment conversions"
-                        ],
-                        "start_week": 32,
-                        "end_week": 42,
-                        "deliverable_week": 42
-                    }
-                ],
-                "deliverables": [
-                    {"code": "D7", "name": "Training completion report with beneficiary documentation"},
-                    {"code": "D8", "name": "Mentorship and Internship Report (3 pages per state)"},
-                    {"code": "D9", "name": "Certificates of participation for all trained beneficiaries"}
-                ]
-            },
-            {
-                "title": "Phase 5: VUCH Strengthening and Sustainability",
-                "description": """The final phase focuses on strengthening the Victor Uwaifo Creative Hub to operate as a sustainable training academy and ensuring project sustainability beyond the consultancy period. The consultants will develop operational and training management structures for VUCH, install the Edugate Box for digital learning support, and create a sustainable instructor/trainer engagement model that does not depend on government or donor funding. We will develop partnership and communication strategies to expand VUCH's reach and establish ongoing relationships with industry partners. The phase concludes with comprehensive documentation and handover to ensure continuity.""",
-                "start_week": 36,
-                "end_week": 45,
-                "tasks": [
-                    {
-                        "code": "5A",
-                        "title": "VUCH Operational and Training Management Restructuring",
-                        "description": """The team at Aninver will work with VUCH management to develop improved operational and training management structures that enhance training delivery efficiency and sustainability. We will assess current operations, identify gaps and inefficiencies, and recommend restructuring based on best practices from successful creative hubs. The new structure will clarify roles and responsibilities, establish quality assurance processes, and create systems for continuous improvement. We will develop actionable training strategies with work plans clearly showing responsibilities and timelines for sustainable operations.""",
-                        "items": [
-                            "Assess current VUCH operational and management structure",
-                            "Identify gaps and opportunities for improvement",
-                            "Develop restructured operational framework with clear roles",
-                            "Create training management systems and quality assurance processes",
-                            "Develop actionable training strategies with detailed work plans",
-                            "Build capacity of VUCH staff in new operational procedures"
-                        ],
-                        "start_week": 36,
-                        "end_week": 40,
-                        "deliverable_week": 40
-                    },
-                    {
-                        "code": "5B",
-                        "title": "Sustainable Trainer Engagement Model Development",
-                        "description": """The consultants will develop a model for sustainable trainer and instructor engagement that ensures VUCH can continue delivering quality training independent of government or donor funding. This includes exploring low-cost and pro-bono trainer engagement strategies, revenue-generating models such as fee-based advanced courses, and partnerships with industry that provide trainers in exchange for talent pipeline access. The model will address trainer recruitment, compensation, professional development, and retention, creating a self-sustaining ecosystem for technical filmmaking training.""",
-                        "items": [
-                            "Analyse sustainable trainer engagement models from comparable institutions",
-                            "Develop low-cost and pro-bono trainer recruitment strategies",
-                            "Design revenue-generating training models for VUCH sustainability",
-                            "Create industry partnership frameworks for trainer provision",
-                            "Develop trainer professional development and retention approaches",
-                            "Document trainer engagement model with implementation guidelines"
-                        ],
-                        "start_week": 38,
-                        "end_week": 40
-                    },
-                    {
-                        "code": "5C",
-                        "title": "Digital Learning Integration and Edugate Box Installation",
-                        "description": """The team will procure and install the Edugate Box in VUCH's Job Centre to support e-learning and expand access to training materials. We will ensure curricula developed for VUCH are compatible with the Edugate Box platform, enabling blended learning approaches that combine digital content with practical hands-on training. Staff will be trained on system operation, content management, and troubleshooting. The digital learning integration will enhance VUCH's capacity to reach more beneficiaries and provide flexible learning options that accommodate women's schedules and responsibilities.""",
-                        "items": [
-                            "Procure Edugate Box system according to specifications",
-                            "Install and configure Edugate Box in VUCH Job Centre",
-                            "Load curricula and training materials onto the platform",
-                            "Train VUCH staff on system operation and content management",
-                            "Test digital learning functionality with sample user groups",
-                            "Develop maintenance and support protocols"
-                        ],
-                        "start_week": 38,
-                        "end_week": 42
-                    },
-                    {
-                        "code": "5D",
-                        "title": "Partnership Strategy and Project Close-out",
-                        "description": """The consultants will develop a concise and actionable strategy to strengthen VUCH's partnerships and communication efforts, ensuring continued growth and visibility. We will identify potential partners across industry, academia, and development sectors, developing tailored engagement approaches for each category. The communication strategy will build VUCH's brand as a centre of excellence for gender-inclusive technical filmmaking training. Finally, we will prepare the comprehensive final implementation report documenting all project activities, outcomes, lessons learned, and recommendations for future programming.""",
-                        "items": [
-                            "Develop partnership strategy with identified potential partners",
-                            "Create communication strategy for VUCH visibility and outreach",
-                            "Organise stakeholder engagement workshop for VUCH restructuring presentation",
-                            "Compile comprehensive final implementation report",
-                            "Conduct formal project handover to GIZ and partners",
-                            "Document lessons learned and recommendations for scaling"
-                        ],
-                        "start_week": 40,
-                        "end_week": 45,
-                        "deliverable_week": 45
-                    }
-                ],
-                "deliverables": [
-                    {"code": "D10", "name": "VUCH Training Management Strategy Document"},
-                    {"code": "D11", "name": "Sustainable Trainer Engagement Model"},
-                    {"code": "D12", "name": "Edugate Box installed and operational"},
-                    {"code": "D13", "name": "Partnership and Communication Strategy"},
-                    {"code": "D14", "name": "Final Implementation Report"}
-                ]
-            }
-        ],
-
-        "risks": """**Risk Management Framework**
-
-The consultants have identified key risks that could affect project implementation and developed corresponding mitigation strategies aligned with GIZ's risk management requirements.
-
-**Security and Conflict Risks**
-Given Nigeria's complex security environment, particularly in certain areas of the target states, security risks must be carefully managed. The team will consult with GIZ's Risk Management Office (RMO) prior to all field activities and follow RMO recommendations regarding travel, venue selection, and timing of activities. We will apply the do-no-harm principle, ensuring all interventions are designed to avoid conflict-aggravating effects and remain accessible to all ethnic and religious communities. Contingency plans will be developed for scenarios requiring activity postponement or relocation.
-
-**Gender-Based Barriers and Cultural Resistance**
-Resistance to women's participation in male-dominated technical roles represents a significant implementation risk. Mitigation strategies include engaging male allies and community leaders as champions, involving families in orientation sessions, selecting training venues and times that address safety and accessibility concerns, and showcasing successful female role models. We will monitor participation rates and dropout patterns, adjusting approaches as needed to address emerging barriers.
-
-**Quality of Training Delivery**
-Risk exists that Master Trainers may not effectively transfer skills to beneficiaries. We mitigate this through rigorous trainer selection, comprehensive ToT programmes, and handholding support during initial training delivery. Quality monitoring will identify issues early, allowing for corrective action and additional trainer support. Assessment mechanisms will verify beneficiary competency acquisition.
-
-**Internship Placement Challenges**
-Securing 50% internship placement for beneficiaries depends on private sector willingness to host female technical interns. Mitigation includes early engagement with industry partners during the ELMA phase, developing value propositions demonstrating benefits of hosting interns, and leveraging GIZ relationships with private sector actors. We will develop a larger pool of potential placements than required to ensure sufficient options.
-
-**VUCH Institutional Capacity**
-The sustainability of VUCH strengthening depends on institutional buy-in and capacity to maintain new systems. We will engage VUCH leadership from project inception, ensure participatory development of all systems and strategies, and build staff capacity through training and mentoring. Sustainability models will be realistic given VUCH's context and resources.
-
-**Data Protection and Privacy**
-Collection of personal data from beneficiaries and stakeholders requires compliance with applicable data protection requirements. We will implement appropriate data protection measures, collect only necessary data in anonymised form where possible, and ensure secure storage and processing. All data shared with GIZ will be provided anonymously unless explicitly required otherwise.""",
-
-        "quality": """**Quality Assurance Framework**
-
-The consultants will implement a comprehensive quality assurance system ensuring all deliverables meet professional standards and project objectives are achieved.
-
-**Key Performance Indicators**
-We will track specific KPIs aligned with ToR requirements including: completion of ELMA within 60 days of contract commencement; training of 15 Master Trainers (5 per state) in five technical skills; delivery of training to 120 women beneficiaries (40 per state) including women with disabilities; achievement of minimum 50% internship placement rate (60 beneficiaries); development of 10 gender-sensitive curricula for VUCH; and installation and operationalisation of Edugate Box.
-
-**Monitoring Mechanisms**
-Regular progress monitoring will track implementation against work plan timelines, identifying delays early and enabling corrective action. We will maintain close coordination with GIZ's M&E team, ensuring data collection methods are agreed and monitoring data is provided in required formats. Monthly progress reports will update GIZ on status, challenges, and upcoming activities.
-
-**Quality Control for Deliverables**
-All written deliverables will undergo internal quality review before submission, ensuring accuracy, completeness, and professional presentation. The ELMA report will be validated through stakeholder workshops before finalisation. Curricula will be reviewed by technical experts and validated with industry stakeholders. Training quality will be assessed through participant feedback, competency assessments, and Master Trainer evaluations.
-
-**Stakeholder Feedback Integration**
-Validation workshops and stakeholder consultations provide mechanisms for feedback integration throughout implementation. We will systematically document stakeholder inputs, demonstrate how feedback has been incorporated, and maintain transparent communication about decisions where feedback could not be accommodated.
-
-**Documentation and Reporting**
-Comprehensive documentation will be maintained for all project activities, enabling accountability and learning. The final implementation report will provide complete documentation of activities, outcomes, challenges, lessons learned, and recommendations. All reports will be submitted according to agreed timelines and formats."""
-    }
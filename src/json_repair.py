@@ -0,0 +1,249 @@
+"""
+Reparación de JSON generado por LLM en una sola pasada
+
+Tokenizador con pila que sigue el estado de strings y escapes, de modo que las llaves
+y corchetes dentro de textos no cuentan. Corrige los fallos habituales de los modelos:
+
+- Respuesta truncada: cierra el string abierto y los contenedores en orden de anidamiento
+- Claves colgantes al final ("key" o "key": sin valor): se eliminan
+- Comas faltantes entre valores y comas finales antes de } o ]
+- Cierres cruzados (} donde toca ]): se cierran los contenedores intermedios
+- Saltos de línea y tabuladores literales dentro de strings, escapes inválidos
+- Comillas sin escapar dentro de un texto
+- Literales de Python (True, False, None), claves sin comillas y comentarios // o /* */
+- Texto sobrante después del objeto raíz
+"""
+
+import re
+
+
+_WHITESPACE = re.compile(r'[ \t\r\n]+')
+_STRING_CHUNK = re.compile(r'[^"\\\x00-\x1f]+')
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?')
+_LITERAL = re.compile(r'(?:true|false|null|True|False|None)\b')
+_BARE_KEY = re.compile(r'[A-Za-z_][\w\-]*')
+_HEX4 = re.compile(r'[0-9a-fA-F]{4}')
+
+_PYTHON_LITERALS = {'True': 'true', 'False': 'false', 'None': 'null'}
+_LITERAL_NAMES = ('true', 'false', 'null', 'True', 'False', 'None')
+_CONTROL_ESCAPES = {'\n': '\\n', '\r': '\\r', '\t': '\\t'}
+_VALID_ESCAPES = set('"\\/bfnrt')
+_STRING_END_FOLLOWERS = set(',:}]')
+
+# Estados de un contenedor
+_KEY, _COLON, _VALUE, _COMMA = 'key', 'colon', 'value', 'comma'
+
+
+def _scan_string(text: str, i: int, n: int) -> tuple:
+    """
+    Lee un string JSON que empieza en text[i] == '"'
+
+    Returns:
+        (token con comillas, índice siguiente, completo)
+    """
+    parts = ['"']
+    i += 1
+    while i < n:
+        match = _STRING_CHUNK.match(text, i)
+        if match:
+            parts.append(match.group())
+            i = match.end()
+            if i >= n:
+                break
+
+        c = text[i]
+        if c == '"':
+            # Solo cierra si lo que sigue tiene sentido tras un string; si no, es una
+            # comilla interna sin escapar. Un salto de línea antes de otro string
+            # indica una coma faltante, no una comilla interna.
+            j = i + 1
+            ws = _WHITESPACE.match(text, j)
+            if ws:
+                j = ws.end()
+            if (j >= n or text[j] in _STRING_END_FOLLOWERS
+                    or (text[j] == '"' and ws and '\n' in ws.group())):
+                parts.append('"')
+                return ''.join(parts), i + 1, True
+            parts.append('\\"')
+            i += 1
+        elif c == '\\':
+            if i + 1 >= n:
+                i += 1  # escape truncado: se descarta
+                break
+            nxt = text[i + 1]
+            if nxt in _VALID_ESCAPES:
+                parts.append(text[i:i + 2])
+                i += 2
+            elif nxt == 'u' and _HEX4.match(text, i + 2):
+                parts.append(text[i:i + 6])
+                i += 6
+            else:
+                parts.append('\\\\')
+                i += 1
+        else:
+            # Carácter de control literal dentro del string
+            parts.append(_CONTROL_ESCAPES.get(c, '\\u%04x' % ord(c)))
+            i += 1
+
+    parts.append('"')
+    return ''.join(parts), i, False
+
+
+def _trim_trailing_comma(out: list):
+    """Elimina la última coma emitida si solo le siguen espacios"""
+    j = len(out) - 1
+    while j >= 0 and out[j].isspace():
+        j -= 1
+    if j >= 0 and out[j] == ',':
+        del out[j]
+
+
+def _close_frame(out: list, frame: list):
+    """Cierra un contenedor, descartando un miembro colgante o una coma final"""
+    kind, state, mark = frame
+    if kind == '{' and state in (_COLON, _VALUE):
+        del out[mark:]
+    _trim_trailing_comma(out)
+    out.append('}' if kind == '{' else ']')
+
+
+def repair_json(text: str) -> str:
+    """
+    Repara un JSON malformado o truncado en una sola pasada (O(n))
+
+    Args:
+        text: Texto que contiene el JSON (se ignora lo anterior al primer { o [)
+
+    Returns:
+        JSON corregido; si no hay ningún objeto ni lista, el texto original
+    """
+    starts = [pos for pos in (text.find('{'), text.find('[')) if pos >= 0]
+    if not starts:
+        return text
+
+    i = min(starts)
+    n = len(text)
+    out = []
+    stack = []   # frames: [tipo '{' o '[', estado, índice de inicio del miembro actual]
+    root_done = False
+
+    while i < n and not root_done:
+        c = text[i]
+
+        if c in ' \t\r\n':
+            match = _WHITESPACE.match(text, i)
+            out.append(match.group())
+            i = match.end()
+            continue
+
+        # Comentarios fuera de strings
+        if c == '/' and i + 1 < n and text[i + 1] in '/*':
+            if text[i + 1] == '/':
+                end = text.find('\n', i)
+                i = n if end < 0 else end
+            else:
+                end = text.find('*/', i + 2)
+                i = n if end < 0 else end + 2
+            continue
+
+        frame = stack[-1] if stack else None
+
+        if c == ',':
+            if frame and frame[1] == _COMMA:
+                out.append(',')
+                frame[1] = _KEY if frame[0] == '{' else _VALUE
+            i += 1
+            continue
+
+        if c == ':':
+            if frame and frame[0] == '{' and frame[1] == _COLON:
+                out.append(':')
+                frame[1] = _VALUE
+            i += 1
+            continue
+
+        if c in '}]':
+            i += 1
+            if not frame:
+                continue
+            wanted = '{' if c == '}' else '['
+            if not any(f[0] == wanted for f in stack):
+                continue  # cierre sin apertura: se descarta
+            # Cierres cruzados: se cierran primero los contenedores internos
+            while stack[-1][0] != wanted:
+                _close_frame(out, stack.pop())
+            _close_frame(out, stack.pop())
+            if stack:
+                stack[-1][1] = _COMMA
+            else:
+                root_done = True
+            continue
+
+        # Inicio de un token: clave o valor
+        if frame:
+            if frame[1] == _COMMA:
+                out.append(',')  # coma faltante
+                frame[1] = _KEY if frame[0] == '{' else _VALUE
+            elif frame[1] == _COLON:
+                out.append(':')  # dos puntos faltantes
+                frame[1] = _VALUE
+
+        if frame and frame[0] == '{' and frame[1] == _KEY:
+            frame[2] = len(out)
+            if c == '"':
+                token, i, complete = _scan_string(text, i, n)
+                if not complete:
+                    break  # clave truncada: se descarta al cerrar
+                out.append(token)
+            else:
+                match = _BARE_KEY.match(text, i)
+                if not match:
+                    i += 1
+                    continue
+                out.append('"' + match.group() + '"')
+                i = match.end()
+            frame[1] = _COLON
+            continue
+
+        # Valores
+        if c in '{[':
+            # El miembro del padre queda completo en cuanto se abre el contenedor hijo:
+            # si se trunca, el hijo se cierra en lugar de descartarse
+            if stack:
+                stack[-1][1] = _COMMA
+            out.append(c)
+            stack.append([c, _KEY if c == '{' else _VALUE, len(out)])
+            i += 1
+            continue
+
+        if c == '"':
+            token, i, complete = _scan_string(text, i, n)
+            out.append(token)
+        elif c == '-' or c.isdigit():
+            match = _NUMBER.match(text, i)
+            if not match:
+                i += 1
+                continue
+            out.append(match.group())
+            i = match.end()
+        else:
+            match = _LITERAL.match(text, i)
+            if not match:
+                rest = text[i:].rstrip()
+                if any(literal.startswith(rest) for literal in _LITERAL_NAMES):
+                    break  # literal truncado al final
+                i += 1
+                continue
+            out.append(_PYTHON_LITERALS.get(match.group(), match.group()))
+            i = match.end()
+
+        if stack:
+            stack[-1][1] = _COMMA
+        else:
+            root_done = True
+
+    # Fin del texto: cerrar en orden inverso de anidamiento
+    while stack:
+        _close_frame(out, stack.pop())
+
+    return ''.join(out).strip()
@@ -0,0 +1,284 @@
+"""
+Parser incremental de la respuesta JSON del LLM
+
+Recibe la respuesta en fragmentos a medida que llega y emite un evento cada vez que una
+parte de la metodología queda cerrada: la introducción, cada principio, cada fase...
+Solo se guarda el texto de la parte en curso (nunca la respuesta completa), de modo
+que la memoria extra está acotada por el tamaño de una fase.
+"""
+
+import re
+import json
+from collections import namedtuple
+
+from .json_repair import repair_json
+
+
+# kind: clave de primer nivel ('introduction', 'context', 'risks'...), 'principle' o 'phase'
+#       para cada elemento, 'principles' o 'phases' al cerrar la lista (value = cantidad)
+#       y 'end' al terminar (value = True si el objeto raíz se cerró)
+# index: posición del principio o fase (desde 0); None en el resto
+# complete: False si la parte se recuperó de una respuesta truncada
+StreamEvent = namedtuple('StreamEvent', ['kind', 'index', 'value', 'complete'])
+
+# Listas de primer nivel que se emiten elemento por elemento
+ARRAY_PARTS = {'principles': 'principle', 'phases': 'phase'}
+
+_STRING_RUN = re.compile(r'[^"\\]+')
+_NON_WHITESPACE = re.compile(r'[^ \t\r\n]')
+# Caracteres relevantes fuera de strings: en el objeto raíz, en el nivel de la parte
+# en curso (donde una coma o un cierre la terminan) y dentro de la parte
+_ROOT_STOPS = re.compile(r'[{}\[\]",:]')
+_LEVEL_STOPS = re.compile(r'[{}\[\]",]')
+_NESTED_STOPS = re.compile(r'[{}\[\]"]')
+
+_OPENERS = '{['
+_CLOSERS = '}]'
+
+
+class MethodologyStreamParser:
+    """
+    Parser orientado a eventos de la respuesta del LLM
+
+    Uso:
+        parser = MethodologyStreamParser()
+        for chunk in backend.stream(...):
+            for event in parser.feed(chunk):
+                ...
+        for event in parser.close():
+            ...
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._root_state = 'key'   # en el objeto raíz: 'key', 'colon', 'value' o 'after'
+        self._key = None
+        self._key_chars = None     # fragmentos de la clave que se está leyendo
+        self._array = None         # clave de la lista de primer nivel en curso
+        self._index = 0
+        self._part = None          # fragmentos de la parte en curso
+        self._part_level = 0
+        self._done = False
+        self.errors = []
+
+    def feed(self, chunk: str) -> list:
+        """
+        Procesa un fragmento de la respuesta
+
+        Returns:
+            Lista de StreamEvent con las partes que se cerraron en este fragmento
+        """
+        events = []
+        i, n = 0, len(chunk)
+        part_start = 0
+
+        while i < n and not self._done:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    if self._key_chars is not None:
+                        self._key_chars.append(chunk[i])
+                    i += 1
+                    continue
+                match = _STRING_RUN.match(chunk, i)
+                if match:
+                    if self._key_chars is not None:
+                        self._key_chars.append(match.group())
+                    i = match.end()
+                    continue
+                c = chunk[i]
+                if c == '\\':
+                    self._escape = True
+                    if self._key_chars is not None:
+                        self._key_chars.append(c)
+                else:
+                    self._in_string = False
+                    if self._key_chars is not None:
+                        self._end_key()
+                i += 1
+                continue
+
+            if self._depth == 0:
+                # Antes del objeto raíz (bloques ```json, texto del modelo)
+                start = chunk.find('{', i)
+                if start < 0:
+                    break
+                self._depth = 1
+                i = start + 1
+                continue
+
+            expecting_value = self._part is None and (
+                self._depth == 2 or self._root_state == 'value')
+            if expecting_value:
+                match = _NON_WHITESPACE.search(chunk, i)
+            elif self._part is None or self._depth == self._part_level:
+                match = (_ROOT_STOPS if self._part is None else _LEVEL_STOPS).search(chunk, i)
+            else:
+                match = _NESTED_STOPS.search(chunk, i)
+            if not match:
+                break
+            i = match.start()
+            c = chunk[i]
+
+            if self._part is not None:
+                # Fin de la parte en curso: coma o cierre en el nivel que la contiene
+                if self._depth == self._part_level and c in ',}]':
+                    self._part.append(chunk[part_start:i])
+                    events.extend(self._emit_part(''.join(self._part), True))
+                    self._part = None
+                    continue
+                if c == '"':
+                    self._in_string = True
+                elif c in _OPENERS:
+                    self._depth += 1
+                elif c in _CLOSERS:
+                    self._depth -= 1
+                i += 1
+                continue
+
+            if self._depth == 1:
+                i = self._root_char(chunk, i, c, events)
+                if self._part is not None:
+                    part_start = i
+                    i = self._consume_first(chunk, i)
+                continue
+
+            # Dentro de una lista de primer nivel (principles, phases)
+            if c == ',' or c == '}':
+                i += 1  # separador, o cierre cruzado que se ignora
+            elif c == ']':
+                events.append(StreamEvent(self._array, None, self._index, True))
+                self._array = None
+                self._depth = 1
+                self._root_state = 'after'
+                i += 1
+            else:
+                self._start_part(2)
+                part_start = i
+                i = self._consume_first(chunk, i)
+
+        if self._part is not None:
+            self._part.append(chunk[part_start:])
+        return events
+
+    def close(self) -> list:
+        """
+        Señala el fin de la respuesta
+
+        Si la respuesta quedó truncada, repara y emite la parte en curso con complete=False.
+        """
+        if self._done:
+            return []
+        events = []
+        if self._part is not None:
+            events.extend(self._emit_part(''.join(self._part), False))
+            self._part = None
+        if self._array is not None:
+            events.append(StreamEvent(self._array, None, self._index, False))
+            self._array = None
+        events.append(StreamEvent('end', None, False, False))
+        self._done = True
+        return events
+
+    def _root_char(self, chunk: str, i: int, c: str, events: list) -> int:
+        """Procesa un carácter estructural del objeto raíz; retorna el índice siguiente"""
+        if c == '"' and self._root_state == 'key':
+            self._in_string = True
+            self._key_chars = []
+            return i + 1
+        if c == ':':
+            if self._root_state == 'colon':
+                self._root_state = 'value'
+            return i + 1
+        if c == ',':
+            self._root_state = 'key'
+            return i + 1
+        if c == '}':
+            self._depth = 0
+            self._done = True
+            events.append(StreamEvent('end', None, True, True))
+            return i + 1
+        if self._root_state != 'value':
+            return i + 1
+        # Inicio del valor de una clave de primer nivel
+        if c == '[' and self._key in ARRAY_PARTS:
+            self._array = self._key
+            self._index = 0
+            self._depth = 2
+            return i + 1
+        self._start_part(1)
+        return i
+
+    def _consume_first(self, chunk: str, i: int) -> int:
+        """Consume el primer carácter de una parte recién iniciada"""
+        c = chunk[i]
+        if c == '"':
+            self._in_string = True
+        elif c in _OPENERS:
+            self._depth += 1
+        return i + 1
+
+    def _start_part(self, level: int):
+        self._part = []
+        self._part_level = level
+
+    def _end_key(self):
+        raw = ''.join(self._key_chars)
+        self._key_chars = None
+        try:
+            self._key = json.loads(f'"{raw}"')
+        except json.JSONDecodeError:
+            self._key = raw
+        self._root_state = 'colon'
+
+    def _emit_part(self, text: str, complete: bool) -> list:
+        """Decodifica el texto de una parte y genera su evento"""
+        if self._part_level == 2:
+            kind, index = ARRAY_PARTS[self._array], self._index
+            self._index += 1
+        else:
+            kind, index = self._key, None
+            self._root_state = 'after'
+
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError:
+            try:
+                # Envuelta en una lista, la reparación sirve también para strings truncados
+                value = json.loads(repair_json('[' + text))[0]
+            except (json.JSONDecodeError, IndexError) as e:
+                self.errors.append(f"{kind}{'' if index is None else f' {index + 1}'}: {e}")
+                return []
+            complete = False
+        return [StreamEvent(kind, index, value, complete)]
+
+
+def iter_events(chunks):
+    """Genera los eventos de una respuesta recibida como iterable de fragmentos"""
+    parser = MethodologyStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def new_methodology() -> dict:
+    """Metodología vacía a la que add_event agrega las partes"""
+    return {'principles': [], 'phases': []}
+
+
+def add_event(methodology: dict, event: StreamEvent):
+    """Agrega a la metodología la parte de un evento (los de cierre no agregan nada)"""
+    if event.kind in ('principle', 'phase'):
+        methodology[event.kind + 's'].append(event.value)
+    elif event.kind not in ('principles', 'phases', 'end'):
+        methodology[event.kind] = event.value
+
+
+def assemble(events) -> dict:
+    """Reconstruye la metodología a partir de sus eventos"""
+    methodology = new_methodology()
+    for event in events:
+        add_event(methodology, event)
+    return methodology
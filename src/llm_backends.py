@@ -0,0 +1,410 @@
+"""
+Backends de LLM para la generación de metodologías
+Perplexity, Anthropic y un stub local, cada uno con su propia concurrencia y timeouts
+"""
+
+import os
+import re
+import copy
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+import requests
+
+from .profiling import span, timed
+
+
+# Semáforos compartidos por backend: el límite de concurrencia es por proveedor,
+# no por instancia, para que varias llamadas en paralelo respeten el mismo cupo
+_SEMAPHORES = {}
+_SEMAPHORES_LOCK = threading.Lock()
+
+
+def _get_semaphore(name: str, limit: int) -> tuple:
+    """
+    Retorna el semáforo del proveedor y su límite, creándolo la primera vez
+
+    El límite lo fija la primera instancia del proveedor; las siguientes comparten ese
+    semáforo aunque pidan otro límite.
+    """
+    with _SEMAPHORES_LOCK:
+        if name not in _SEMAPHORES:
+            _SEMAPHORES[name] = (threading.BoundedSemaphore(limit), limit)
+        return _SEMAPHORES[name]
+
+
+# Caché de respuestas en memoria (y opcionalmente en disco con LLM_RESPONSE_CACHE_DIR),
+# indexada por backend, modelo, hash del prefijo estático y hash de la parte variable
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_SIZE = 64
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _text_hash(text: str) -> str:
+    """Hash estable de un texto"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def _cache_get(key: str):
+    """Busca una respuesta en la caché de memoria y, si no está, en la de disco"""
+    with _RESPONSE_CACHE_LOCK:
+        if key in _RESPONSE_CACHE:
+            _RESPONSE_CACHE.move_to_end(key)
+            return _RESPONSE_CACHE[key]
+
+    cache_dir = os.getenv('LLM_RESPONSE_CACHE_DIR')
+    if cache_dir:
+        path = os.path.join(cache_dir, f'{key}.txt')
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+    return None
+
+
+def _cache_put(key: str, response: str):
+    """Guarda una respuesta en la caché de memoria (LRU) y, si está configurada, en disco"""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = response
+        _RESPONSE_CACHE.move_to_end(key)
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+    cache_dir = os.getenv('LLM_RESPONSE_CACHE_DIR')
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(os.path.join(cache_dir, f'{key}.txt'), 'w', encoding='utf-8') as f:
+            f.write(response)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Lee un entero de una variable de entorno, con valor por defecto"""
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+class LLMBackend:
+    """
+    Interfaz común de los backends de LLM
+
+    Cada backend recibe el prompt en dos partes:
+    - prefix: parte estática (instrucciones, esquema), reutilizable como caché de prefijo
+    - prompt: parte variable (contenido del TdR)
+    """
+
+    name = 'base'
+    default_model = None
+    fast_model = None
+    default_concurrency = 2
+    default_timeout = 300
+    supports_prefix_cache = False
+
+    def __init__(self, model: str = None, max_concurrency: int = None, timeout: float = None,
+                 max_tokens: int = 32000, temperature: float = 0.5):
+        env_prefix = self.name.upper()
+        self.model = model or os.getenv(f'{env_prefix}_MODEL') or self.default_model
+        self.timeout = timeout or _env_int(f'{env_prefix}_TIMEOUT', self.default_timeout)
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        # Límite efectivo: el del semáforo del proveedor, fijado por la primera instancia
+        self._semaphore, self.max_concurrency = _get_semaphore(
+            self.name, max_concurrency or _env_int(f'{env_prefix}_MAX_CONCURRENCY',
+                                                   self.default_concurrency))
+
+    @timed(name='llm_complete')
+    def complete(self, prompt: str, prefix: str = '', max_tokens: int = None,
+                 timeout: float = None, prefix_hash: str = None, use_cache: bool = True) -> str:
+        """
+        Envía el prompt al modelo respetando el límite de concurrencia del backend
+
+        Args:
+            prompt: Parte variable del prompt
+            prefix: Parte estática del prompt (va primero)
+            prefix_hash: Hash estable del prefijo, si ya se conoce (ver prompt_templates)
+            use_cache: Reutilizar respuestas previas para el mismo prompt y modelo
+
+        Returns:
+            Texto de la respuesta del modelo
+        """
+        max_tokens = max_tokens or self.max_tokens
+        cache_key = self._cache_key(prefix, prompt, max_tokens, prefix_hash) if use_cache else None
+        if cache_key:
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        with self._semaphore, span(f"{self.name} API"):
+            response = self._complete(prefix, prompt, max_tokens, timeout or self.timeout)
+
+        if cache_key:
+            _cache_put(cache_key, response)
+        return response
+
+    def stream(self, prompt: str, prefix: str = '', max_tokens: int = None,
+               timeout: float = None, prefix_hash: str = None, use_cache: bool = True):
+        """
+        Igual que complete(), pero genera la respuesta en fragmentos a medida que llega
+
+        Una respuesta cacheada se entrega en un único fragmento.
+        """
+        max_tokens = max_tokens or self.max_tokens
+        cache_key = self._cache_key(prefix, prompt, max_tokens, prefix_hash) if use_cache else None
+        if cache_key:
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        with self._semaphore:
+            for chunk in self._stream(prefix, prompt, max_tokens, timeout or self.timeout):
+                parts.append(chunk)
+                yield chunk
+
+        if cache_key:
+            _cache_put(cache_key, ''.join(parts))
+
+    def _cache_key(self, prefix: str, prompt: str, max_tokens: int, prefix_hash: str = None) -> str:
+        return _text_hash('|'.join([
+            self.name, str(self.model), str(max_tokens),
+            prefix_hash or _text_hash(prefix), _text_hash(prompt),
+        ]))
+
+    def with_model(self, model: str):
+        """
+        Retorna una copia del backend que usa otro modelo
+
+        La copia comparte sesión, cliente y semáforo: el límite de concurrencia
+        sigue siendo el del proveedor.
+        """
+        if not model or model == self.model:
+            return self
+        clone = copy.copy(self)
+        clone.model = model
+        return clone
+
+    def _complete(self, prefix: str, prompt: str, max_tokens: int, timeout: float) -> str:
+        raise NotImplementedError
+
+    def _stream(self, prefix: str, prompt: str, max_tokens: int, timeout: float):
+        """Por defecto, un único fragmento con la respuesta completa"""
+        yield self._complete(prefix, prompt, max_tokens, timeout)
+
+
+class PerplexityBackend(LLMBackend):
+    """Backend Perplexity (chat completions sobre HTTP)"""
+
+    name = 'perplexity'
+    default_model = 'sonar-pro'
+    fast_model = 'sonar'
+    default_concurrency = 2
+    default_timeout = 300
+
+    URL = "https://api.perplexity.ai/chat/completions"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.api_key = os.getenv('PERPLEXITY_API_KEY')
+        if not self.api_key:
+            raise ValueError("PERPLEXITY_API_KEY environment variable not set")
+        # Sesión persistente: reutiliza la conexión TLS entre llamadas
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
+    def _payload(self, prefix: str, prompt: str, max_tokens: int) -> dict:
+        # Perplexity no expone caché explícita: el prefijo va primero en el mensaje
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prefix + prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": self.temperature
+        }
+
+    def _complete(self, prefix: str, prompt: str, max_tokens: int, timeout: float) -> str:
+        payload = self._payload(prefix, prompt, max_tokens)
+        response = self._session.post(self.URL, json=payload, timeout=(10, timeout))
+        response.raise_for_status()
+
+        result = response.json()
+        return result['choices'][0]['message']['content']
+
+    def _stream(self, prefix: str, prompt: str, max_tokens: int, timeout: float):
+        # Server-sent events: líneas "data: {...}" con el texto nuevo en delta.content
+        payload = dict(self._payload(prefix, prompt, max_tokens), stream=True)
+        with self._session.post(self.URL, json=payload, timeout=(10, timeout),
+                                stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith('data:'):
+                    continue
+                data = line[5:].strip()
+                if data == '[DONE]':
+                    break
+                choices = json.loads(data).get('choices') or [{}]
+                content = (choices[0].get('delta') or {}).get('content')
+                if content:
+                    yield content
+
+
+class AnthropicBackend(LLMBackend):
+    """Backend Anthropic (Messages API) con caché del prefijo estático"""
+
+    name = 'anthropic'
+    default_model = 'claude-sonnet-4-5'
+    fast_model = 'claude-haiku-4-5'
+    default_concurrency = 4
+    default_timeout = 300
+    supports_prefix_cache = True
+
+    def __init__(self, max_tokens: int = 16000, **kwargs):
+        super().__init__(max_tokens=max_tokens, **kwargs)
+        api_key = os.getenv('ANTHROPIC_API_KEY')
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+
+        import anthropic
+        self._client = anthropic.Anthropic(api_key=api_key, timeout=self.timeout)
+
+    def _request(self, prefix: str, prompt: str, max_tokens: int, timeout: float) -> dict:
+        content = []
+        if prefix:
+            # El prefijo estático se marca como cacheable para que las siguientes
+            # generaciones no vuelvan a pagar su procesamiento de entrada
+            content.append({"type": "text", "text": prefix,
+                            "cache_control": {"type": "ephemeral"}})
+        content.append({"type": "text", "text": prompt})
+
+        return dict(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=self.temperature,
+            messages=[{"role": "user", "content": content}],
+            timeout=timeout,
+        )
+
+    def _complete(self, prefix: str, prompt: str, max_tokens: int, timeout: float) -> str:
+        response = self._client.messages.create(**self._request(prefix, prompt, max_tokens, timeout))
+        return ''.join(block.text for block in response.content if block.type == 'text')
+
+    def _stream(self, prefix: str, prompt: str, max_tokens: int, timeout: float):
+        request = self._request(prefix, prompt, max_tokens, timeout)
+        with self._client.messages.stream(**request) as stream:
+            yield from stream.text_stream
+
+
+class StubBackend(LLMBackend):
+    """
+    Backend local sin red, para pruebas y ejecuciones offline
+
+    Si STUB_RESPONSE_FILE apunta a un archivo, devuelve su contenido (útil para
+    reproducir una respuesta real guardada). Si no, genera una metodología
+    mínima válida con las fases listadas en el prompt.
+    """
+
+    name = 'stub'
+    default_model = 'stub'
+    fast_model = 'stub'
+    default_concurrency = 16
+    default_timeout = 5
+
+    PHASE_LINE = re.compile(r'^\s*-\s*(Phase \d+:.*)$', re.MULTILINE)
+    JSON_KEYS_LINE = re.compile(r'^JSON KEYS:\s*(.+)$', re.MULTILINE)
+    TRANSLATE_BLOCK = re.compile(r'^TRANSLATE JSON:\n(.*)\n\nRETURN ONLY', re.MULTILINE | re.DOTALL)
+    STREAM_CHUNK = 64
+
+    def __init__(self, response: str = None, **kwargs):
+        super().__init__(**kwargs)
+        response_file = os.getenv('STUB_RESPONSE_FILE')
+        if response is None and response_file:
+            with open(response_file, 'r', encoding='utf-8') as f:
+                response = f.read()
+        self.response = response
+
+    def _complete(self, prefix: str, prompt: str, max_tokens: int, timeout: float) -> str:
+        if self.response is not None:
+            return self.response
+        # Prompts de traducción: devolver el mismo bloque (traducción identidad)
+        translate_match = self.TRANSLATE_BLOCK.search(prompt)
+        if translate_match:
+            return translate_match.group(1)
+        # Prompts de redacción por secciones: responder con las claves pedidas
+        keys_match = self.JSON_KEYS_LINE.search(prompt)
+        if keys_match:
+            keys = [key.strip() for key in keys_match.group(1).split(',') if key.strip()]
+            return json.dumps({key: f"Text for {key}." for key in keys}, ensure_ascii=False)
+        return json.dumps(self._build_methodology(prefix + prompt), ensure_ascii=False)
+
+    def _stream(self, prefix: str, prompt: str, max_tokens: int, timeout: float):
+        # Fragmentos pequeños, como los de un backend real
+        response = self._complete(prefix, prompt, max_tokens, timeout)
+        for i in range(0, len(response), self.STREAM_CHUNK):
+            yield response[i:i + self.STREAM_CHUNK]
+
+    def _build_methodology(self, prompt: str) -> dict:
+        """Construye una metodología sintética a partir de las fases del prompt"""
+        phase_titles = self.PHASE_LINE.findall(prompt) or ['Phase 1: Project inception']
+
+        phases = []
+        week = 1
+        for p_idx, title in enumerate(phase_titles, 1):
+            tasks = []
+            for t_idx, letter in enumerate('AB'):
+                tasks.append({
+                    "code": f"{p_idx}{letter}",
+                    "title": f"Task {p_idx}{letter}",
+                    "description": "Task description.",
+                    "items": ["Activity 1", "Activity 2"],
+                    "start_week": week + t_idx * 2,
+                    "end_week": week + t_idx * 2 + 1,
+                })
+            tasks[-1]["deliverable_week"] = week + 3
+            tasks[-1]["deliverable_code"] = f"D{p_idx}"
+            phases.append({
+                "title": title.strip(),
+                "description": "Phase description.",
+                "start_week": week,
+                "end_week": week + 3,
+                "tasks": tasks,
+                "deliverables": [{"code": f"D{p_idx}", "name": f"Deliverable {p_idx}"}],
+            })
+            week += 4
+
+        return {
+            "introduction": "Introduction.",
+            "context": "Context.",
+            "principles": [{"name": f"Principle {i}", "description": "Description."}
+                           for i in range(1, 4)],
+            "phases": phases,
+            "risks": "Risks.",
+            "quality": "Quality.",
+        }
+
+
+BACKENDS = {
+    'perplexity': PerplexityBackend,
+    'anthropic': AnthropicBackend,
+    'stub': StubBackend,
+}
+
+
+def get_backend(name: str = None, **kwargs) -> LLMBackend:
+    """
+    Crea el backend indicado (o el de LLM_BACKEND, por defecto Perplexity)
+
+    Args:
+        name: 'perplexity', 'anthropic' o 'stub'
+        **kwargs: model, max_concurrency, timeout, max_tokens, temperature
+
+    Returns:
+        Instancia del backend
+    """
+    name = name or os.getenv('LLM_BACKEND', 'perplexity')
+    if name not in BACKENDS:
+        raise ValueError(f"Backend no soportado: {name}. Use {', '.join(BACKENDS)}.")
+    return BACKENDS[name](**kwargs)
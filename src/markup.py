@@ -0,0 +1,109 @@
+"""
+Marcado de los textos de la metodología
+
+Los textos que redacta el LLM usan un subconjunto de Markdown:
+- **negrita**, *itálica* y ***ambas*** dentro de una línea (sin anidar una en otra)
+- listas con "- ", "• " o "* ", anidadas por sangría (hasta MAX_LIST_LEVEL)
+- listas numeradas "1." a "999." (o "1)"); "3.5 millones" no es un ítem
+- encabezados: una línea entera en negrita (**Título**) o "# Título"
+
+Las expresiones se compilan una vez. Cada texto se recorre una sola vez, línea a línea,
+y devuelve directamente los runs (texto, negrita, itálica) que dibujan los escritores,
+sin volver a partir el texto en cada uno.
+"""
+
+import re
+
+
+# Nivel máximo de anidamiento de las listas (estilos List Bullet / List Bullet 2 / 3)
+MAX_LIST_LEVEL = 2
+
+_INLINE = re.compile(
+    r'\*\*\*(?P<both>[^*]+)\*\*\*'
+    r'|\*\*(?P<bold>[^*]+)\*\*'
+    # Itálica: sin espacio junto a los asteriscos ni letras fuera (2*3*4 no es itálica)
+    r'|(?<![\w*])\*(?P<italic>[^\s*](?:[^*]*[^\s*])?)\*(?![\w*])'
+)
+
+_LINE = re.compile(
+    r'(?P<heading>#{1,6})\s+(?P<heading_text>.*)'
+    r'|[-•*] (?P<bullet>.*)'
+    r'|\d{1,3}[.)](?!\d)(?P<numbered>.*)',
+    re.DOTALL
+)
+# Primeros caracteres posibles de un encabezado o ítem de lista (evita _LINE en el resto)
+_LINE_START = frozenset('#-•*0123456789')
+
+
+def inline_runs(text: str) -> list:
+    """Runs [(texto, negrita, itálica)] de una línea con marcado en línea"""
+    if '*' not in text:
+        return [(text, False, False)] if text else []
+    runs = []
+    pos = 0
+    for match in _INLINE.finditer(text):
+        if match.start() > pos:
+            runs.append((text[pos:match.start()], False, False))
+        if match['both'] is not None:
+            runs.append((match['both'], True, True))
+        elif match['bold'] is not None:
+            runs.append((match['bold'], True, False))
+        else:
+            runs.append((match['italic'], False, True))
+        pos = match.end()
+    if pos < len(text):
+        runs.append((text[pos:], False, False))
+    return runs
+
+
+def plain_text(text: str) -> str:
+    """Texto sin el marcado en línea"""
+    return ''.join(run[0] for run in inline_runs(text))
+
+
+def _indent(line: str) -> int:
+    """Sangría en espacios (un tabulador cuenta 4)"""
+    line = line.expandtabs(4)
+    return len(line) - len(line.lstrip(' '))
+
+
+def parse_content(content: str) -> list:
+    """
+    Líneas de un bloque de texto, en orden
+
+    Returns:
+        [(tipo, nivel, contenido)]: ('heading', 0, texto), ('bullet' o 'numbered',
+        nivel de anidamiento, runs) o ('paragraph', 0, runs)
+    """
+    items = []
+    if not content:
+        return items
+    for para_text in content.split('\n\n'):
+        # Sangrías de las listas abiertas del párrafo, de menor a mayor
+        indents = []
+        for raw in para_text.split('\n'):
+            line = raw.strip()
+            if not line:
+                continue
+            if line.startswith('**') and line.endswith('**') and line.count('**') == 2:
+                items.append(('heading', 0, plain_text(line[2:-2])))
+                indents = []
+                continue
+            match = _LINE.match(line) if line[0] in _LINE_START else None
+            kind = match and ('heading' if match['heading'] else
+                              'bullet' if match['bullet'] is not None else 'numbered')
+            if kind == 'heading':
+                items.append(('heading', 0, plain_text(match['heading_text'])))
+                indents = []
+            elif kind:
+                indent = _indent(raw)
+                while indents and indents[-1] > indent:
+                    indents.pop()
+                if not indents or indents[-1] < indent:
+                    indents.append(indent)
+                text = match['bullet'] if kind == 'bullet' else match['numbered'].strip()
+                items.append((kind, min(len(indents) - 1, MAX_LIST_LEVEL), inline_runs(text)))
+            else:
+                items.append(('paragraph', 0, inline_runs(line)))
+                indents = []
+    return items
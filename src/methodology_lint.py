@@ -0,0 +1,179 @@
+"""
+Verificador de consistencia de metodologías (linter)
+
+Complementa validate_methodology (esquema) con reglas entre partes de la metodología.
+Los códigos y entregables se indexan una vez y cada tarea se revisa una sola vez, de modo
+que el costo es lineal en el tamaño de la metodología. lint_artifacts revisa en una
+pasada todos los artefactos guardados (projects/, directorios de --save-json).
+
+Reglas (severidad):
+- schema (error): violaciones de validate_methodology
+- duplicate_task_code (error): código de tarea repetido
+- duplicate_deliverable_code (error): el mismo código de entregable con nombres distintos
+- unknown_deliverable (error): deliverable_code que no está en los entregables de ninguna fase
+- task_outside_phase (error): tarea que empieza antes o termina después que su fase
+- marker_outside_task (aviso): entregable o evento fuera de las fechas de su tarea (no
+  aparece en los Gantt)
+- unreferenced_deliverable (aviso): entregable que ninguna tarea entrega, cuando la
+  metodología usa deliverable_code
+"""
+
+import time
+from pathlib import Path
+
+from .artifacts import find_artifacts, load_artifact
+from .methodology_model import Methodology, validate_methodology, as_methodology
+from .schedule import build_schedule
+
+
+ERROR = 'error'
+WARNING = 'warning'
+
+RULES = {
+    'schema': ERROR,
+    'duplicate_task_code': ERROR,
+    'duplicate_deliverable_code': ERROR,
+    'unknown_deliverable': ERROR,
+    'task_outside_phase': ERROR,
+    'marker_outside_task': WARNING,
+    'unreferenced_deliverable': WARNING,
+}
+
+
+def _finding(rule: str, path: str, message: str) -> dict:
+    return {'rule': rule, 'severity': RULES[rule], 'path': path, 'message': message}
+
+
+def lint_methodology(methodology) -> list:
+    """
+    Revisa la consistencia de una metodología
+
+    Args:
+        methodology: Diccionario o Methodology
+
+    Returns:
+        Lista de hallazgos {'rule', 'severity', 'path', 'message'} (vacía si no hay)
+    """
+    data = methodology.to_dict() if isinstance(methodology, Methodology) else methodology
+    findings = []
+    for error in validate_methodology(data):
+        path, _, message = error.partition(': ')
+        findings.append(_finding('schema', path, message))
+    if not isinstance(data, dict):
+        return findings
+    methodology = as_methodology(methodology)
+    unit = 'mes' if methodology.period == 'month' else 'semana'
+
+    # Índice de entregables: código -> (ruta, nombre)
+    deliverables = {}
+    for p_idx, phase in enumerate(methodology.phases):
+        for d_idx, deliverable in enumerate(phase.deliverables):
+            if not deliverable.code:
+                continue
+            path = f'phases[{p_idx}].deliverables[{d_idx}]'
+            first = deliverables.setdefault(deliverable.code, (path, deliverable.name))
+            if first[0] != path and first[1].strip() != deliverable.name.strip():
+                findings.append(_finding(
+                    'duplicate_deliverable_code', path,
+                    f"El entregable {deliverable.code} ya está definido en {first[0]} "
+                    f"con otro nombre"))
+
+    # Misma detección que los avisos del cronograma (Schedule.issues)
+    outside = set(build_schedule(methodology).tasks_outside_phase())
+
+    task_codes = {}
+    referenced = set()
+    for p_idx, phase in enumerate(methodology.phases):
+        for t_idx, task in enumerate(phase.tasks):
+            path = f'phases[{p_idx}].tasks[{t_idx}]'
+            label = task.code or path
+
+            if task.code:
+                first = task_codes.setdefault(task.code, path)
+                if first != path:
+                    findings.append(_finding('duplicate_task_code', path,
+                                             f"El código {task.code} ya se usa en {first}"))
+
+            if (p_idx, t_idx) in outside:
+                findings.append(_finding(
+                    'task_outside_phase', path,
+                    f"La tarea {label} ({unit} {task.start_week}-{task.end_week}) sale de su "
+                    f"fase ({phase.start_week}-{phase.end_week})"))
+
+            for kind, period in (('entregable', task.deliverable_week),
+                                 ('evento', task.event_week)):
+                if period is not None and not task.start_week <= period <= task.end_week:
+                    findings.append(_finding(
+                        'marker_outside_task', path,
+                        f"El {kind} de la tarea {label} ({unit} {period}) cae fuera de la "
+                        f"tarea ({task.start_week}-{task.end_week})"))
+
+            if task.deliverable_code:
+                referenced.add(task.deliverable_code)
+                if task.deliverable_code not in deliverables:
+                    findings.append(_finding(
+                        'unknown_deliverable', path,
+                        f"La tarea {label} entrega {task.deliverable_code}, que no está en "
+                        f"los entregables de ninguna fase"))
+
+    if referenced:
+        for code, (path, _) in deliverables.items():
+            if code not in referenced:
+                findings.append(_finding('unreferenced_deliverable', path,
+                                         f"Ninguna tarea entrega {code}"))
+    return findings
+
+
+def lint_artifacts(paths: list) -> dict:
+    """
+    Revisa todos los artefactos de las rutas (archivos o directorios) en una pasada
+
+    find_artifacts no incluye el registro de projects/; otros .json que no son
+    metodologías se omiten y se informan en 'skipped'.
+
+    Returns:
+        {'results': {ruta: hallazgos}, 'skipped': {ruta: motivo}, 'seconds': float}
+    """
+    started = time.perf_counter()
+    results, skipped = {}, {}
+    for source in paths:
+        for path in find_artifacts(source):
+            try:
+                methodology = load_artifact(path)['methodology']
+            except (ValueError, OSError) as e:
+                reason = str(e)
+                skipped[str(path)] = reason if reason.startswith(str(path)) else f"{path}: {reason}"
+                continue
+            results[str(path)] = lint_methodology(methodology)
+    return {'results': results, 'skipped': skipped,
+            'seconds': round(time.perf_counter() - started, 3)}
+
+
+def count_findings(findings: list) -> tuple:
+    """(errores, avisos)"""
+    errors = sum(1 for finding in findings if finding['severity'] == ERROR)
+    return errors, len(findings) - errors
+
+
+def format_lint_report(batch: dict, verbose: bool = True) -> str:
+    """Informe de texto de lint_artifacts (para el CLI)"""
+    lines = []
+    total_errors = total_warnings = failing = 0
+    for source, findings in batch['results'].items():
+        errors, warnings = count_findings(findings)
+        total_errors += errors
+        total_warnings += warnings
+        failing += bool(errors)
+        if not findings:
+            continue
+        lines.append(f"{Path(source).name}: {errors} errores, {warnings} avisos")
+        if verbose:
+            for finding in findings:
+                severity = 'error' if finding['severity'] == ERROR else 'aviso'
+                lines.append(f"  {severity:<6} {finding['rule']:<27} {finding['path']}: "
+                             f"{finding['message']}")
+    for reason in batch['skipped'].values():
+        lines.append(f"Omitido: {reason}")
+    lines.append(f"\n{len(batch['results'])} metodologías, {failing} con errores: "
+                 f"{total_errors} errores, {total_warnings} avisos ({batch['seconds']:.2f} s)")
+    return '\n'.join(lines)
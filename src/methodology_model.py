@@ -0,0 +1,425 @@
+"""
+Modelo tipado de la metodología (Methodology, Principle, Phase, Task, Deliverable)
+
+Los diccionarios que devuelve el LLM (o los scripts de proyecto) se normalizan una sola vez
+al cargarlos: semanas o meses según el caso, números como enteros, valores por defecto de
+fechas y listas. El renderizado trabaja luego con atributos, sin búsquedas defensivas.
+"""
+
+from .profiling import timed
+
+
+# Claves de texto de primer nivel
+TEXT_SECTIONS = ('introduction', 'context', 'risks', 'quality')
+
+# Campos de período de una tarea, sin el sufijo _week/_month
+_TASK_PERIODS = ('start', 'end', 'deliverable', 'event')
+
+# Listas de texto opcionales de una tarea: roles del equipo y códigos de tareas previas
+_TASK_TAGS = ('roles', 'depends_on')
+
+
+def _as_int(value):
+    """Entero a partir de int, float entero o string numérico; None si no es posible"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+def _period_value(data: dict, name: str):
+    """Valor de name_week o, si no existe, de name_month"""
+    value = data.get(f'{name}_week')
+    if value is None:
+        value = data.get(f'{name}_month')
+    return value
+
+
+def _text(value) -> str:
+    return value if isinstance(value, str) else ('' if value is None else str(value))
+
+
+def _text_list(value) -> list:
+    """Lista de textos no vacíos (acepta un solo string)"""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    return [item.strip() for item in value if isinstance(item, str) and item.strip()]
+
+
+def _extra(data: dict, known: frozenset):
+    """Claves no reconocidas, conservadas para to_dict (None si no hay)"""
+    extra = {key: value for key, value in data.items() if key not in known}
+    return extra or None
+
+
+class Deliverable:
+    __slots__ = ('code', 'name', 'extra')
+
+    KNOWN = frozenset(('code', 'name'))
+
+    def __init__(self, code: str = '', name: str = '', extra: dict = None):
+        self.code = code
+        self.name = name
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(_text(data.get('code')), _text(data.get('name')), _extra(data, cls.KNOWN))
+
+    def to_dict(self, period: str = 'week') -> dict:
+        result = {'code': self.code, 'name': self.name}
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+class Task:
+    __slots__ = ('code', 'title', 'description', 'items', 'start_week', 'end_week',
+                 'deliverable_week', 'deliverable_code', 'event_week', 'event_code',
+                 'roles', 'depends_on', 'extra')
+
+    KNOWN = frozenset(['code', 'title', 'description', 'items', 'deliverable_code', 'event_code']
+                      + [f'{name}_{unit}' for name in _TASK_PERIODS for unit in ('week', 'month')]
+                      + list(_TASK_TAGS))
+
+    def __init__(self, code: str = '', title: str = '', description: str = '', items: list = None,
+                 start_week: int = 1, end_week: int = None, deliverable_week: int = None,
+                 deliverable_code: str = None, event_week: int = None, event_code: str = None,
+                 roles: list = None, depends_on: list = None, extra: dict = None):
+        self.code = code
+        self.title = title
+        self.description = description
+        self.items = items if items is not None else []
+        self.start_week = start_week
+        self.end_week = end_week if end_week is not None else start_week
+        self.deliverable_week = deliverable_week
+        self.deliverable_code = deliverable_code
+        self.event_week = event_week
+        self.event_code = event_code
+        self.roles = roles if roles is not None else []
+        self.depends_on = depends_on if depends_on is not None else []
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict, default_start: int = 1):
+        """
+        Args:
+            data: Diccionario de la tarea
+            default_start: Inicio por defecto (el de la fase) si la tarea no lo indica
+        """
+        start = _as_int(_period_value(data, 'start'))
+        if start is None:
+            start = default_start
+        items = data.get('items') or []
+        if isinstance(items, str):
+            items = [items]
+        return cls(
+            code=_text(data.get('code')),
+            title=_text(data.get('title')),
+            description=_text(data.get('description')),
+            items=items,
+            start_week=start,
+            end_week=_as_int(_period_value(data, 'end')),
+            deliverable_week=_as_int(_period_value(data, 'deliverable')),
+            deliverable_code=data.get('deliverable_code') or None,
+            event_week=_as_int(_period_value(data, 'event')),
+            event_code=data.get('event_code') or None,
+            roles=_text_list(data.get('roles')),
+            depends_on=_text_list(data.get('depends_on')),
+            extra=_extra(data, cls.KNOWN),
+        )
+
+    def to_dict(self, period: str = 'week') -> dict:
+        result = {'code': self.code, 'title': self.title, 'description': self.description,
+                  'items': self.items,
+                  f'start_{period}': self.start_week, f'end_{period}': self.end_week}
+        if self.deliverable_week is not None:
+            result[f'deliverable_{period}'] = self.deliverable_week
+        if self.deliverable_code is not None:
+            result['deliverable_code'] = self.deliverable_code
+        if self.event_week is not None:
+            result[f'event_{period}'] = self.event_week
+        if self.event_code is not None:
+            result['event_code'] = self.event_code
+        for key in _TASK_TAGS:
+            if getattr(self, key):
+                result[key] = getattr(self, key)
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+class Phase:
+    __slots__ = ('title', 'description', 'start_week', 'end_week', 'tasks', 'deliverables',
+                 'extra')
+
+    KNOWN = frozenset(('title', 'description', 'tasks', 'deliverables', 'start_week',
+                       'end_week', 'start_month', 'end_month'))
+
+    def __init__(self, title: str = '', description: str = '', start_week: int = 1,
+                 end_week: int = None, tasks: list = None, deliverables: list = None,
+                 extra: dict = None):
+        self.title = title
+        self.description = description
+        self.start_week = start_week
+        self.end_week = end_week if end_week is not None else start_week
+        self.tasks = tasks if tasks is not None else []
+        self.deliverables = deliverables if deliverables is not None else []
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        raw_tasks = [task for task in data.get('tasks') or [] if isinstance(task, dict)]
+
+        # Sin fechas explícitas, la fase cubre sus tareas
+        start = _as_int(_period_value(data, 'start'))
+        if start is None:
+            task_starts = [s for s in (_as_int(_period_value(t, 'start')) for t in raw_tasks)
+                           if s is not None]
+            start = min(task_starts) if task_starts else 1
+        tasks = [Task.from_dict(task, start) for task in raw_tasks]
+        end = _as_int(_period_value(data, 'end'))
+        if end is None:
+            end = max([task.end_week for task in tasks], default=start)
+
+        return cls(
+            title=_text(data.get('title')),
+            description=_text(data.get('description')),
+            start_week=start,
+            end_week=end,
+            tasks=tasks,
+            deliverables=[Deliverable.from_dict(d) for d in data.get('deliverables') or []
+                          if isinstance(d, dict)],
+            extra=_extra(data, cls.KNOWN),
+        )
+
+    def to_dict(self, period: str = 'week') -> dict:
+        result = {'title': self.title, 'description': self.description,
+                  f'start_{period}': self.start_week, f'end_{period}': self.end_week,
+                  'tasks': [task.to_dict(period) for task in self.tasks],
+                  'deliverables': [d.to_dict(period) for d in self.deliverables]}
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+class Principle:
+    __slots__ = ('name', 'description', 'extra')
+
+    KNOWN = frozenset(('name', 'description'))
+
+    def __init__(self, name: str = '', description: str = '', extra: dict = None):
+        self.name = name
+        self.description = description
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(_text(data.get('name')), _text(data.get('description')),
+                   _extra(data, cls.KNOWN))
+
+    def to_dict(self, period: str = 'week') -> dict:
+        result = {'name': self.name, 'description': self.description}
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+class Methodology:
+    """
+    Metodología normalizada
+
+    period indica la unidad original de las fechas ('week' o 'month'): los atributos
+    *_week contienen el número de período en esa unidad, y to_dict la restituye.
+    """
+
+    __slots__ = ('introduction', 'context', 'principles', 'phases', 'risks', 'quality',
+                 'period', 'extra')
+
+    KNOWN = frozenset(TEXT_SECTIONS + ('principles', 'phases'))
+
+    def __init__(self, introduction: str = '', context: str = '', principles: list = None,
+                 phases: list = None, risks: str = '', quality: str = '',
+                 period: str = 'week', extra: dict = None):
+        self.introduction = introduction
+        self.context = context
+        self.principles = principles if principles is not None else []
+        self.phases = phases if phases is not None else []
+        self.risks = risks
+        self.quality = quality
+        self.period = period
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        phases = [phase for phase in data.get('phases') or [] if isinstance(phase, dict)]
+        return cls(
+            introduction=_text(data.get('introduction')),
+            context=_text(data.get('context')),
+            principles=[Principle.from_dict(p) for p in data.get('principles') or []
+                        if isinstance(p, dict)],
+            phases=[Phase.from_dict(phase) for phase in phases],
+            risks=_text(data.get('risks')),
+            quality=_text(data.get('quality')),
+            period=_detect_period(phases),
+            extra=_extra(data, cls.KNOWN),
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Diccionario equivalente; comparte los strings y listas de ítems con el modelo
+        (no se copian)
+        """
+        result = {key: getattr(self, key) for key in TEXT_SECTIONS if getattr(self, key)}
+        result['principles'] = [p.to_dict() for p in self.principles]
+        result['phases'] = [phase.to_dict(self.period) for phase in self.phases]
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+
+def _detect_period(phases: list) -> str:
+    """'month' si las fechas vienen solo en meses; 'week' en cualquier otro caso"""
+    has_months = False
+    for phase in phases:
+        for data in [phase] + [t for t in phase.get('tasks') or [] if isinstance(t, dict)]:
+            if 'start_week' in data or 'end_week' in data:
+                return 'week'
+            if 'start_month' in data or 'end_month' in data:
+                has_months = True
+    return 'month' if has_months else 'week'
+
+
+# Validación
+
+def _check_text(value, path: str, errors: list, required: bool = False):
+    if value is None:
+        if required:
+            errors.append(f"{path}: falta")
+    elif not isinstance(value, str):
+        errors.append(f"{path}: se esperaba texto, se recibió {type(value).__name__}")
+    elif required and not value.strip():
+        errors.append(f"{path}: vacío")
+
+
+def _check_list(value, path: str, errors: list) -> list:
+    """Retorna la lista (o []) y anota el error si el valor no es una lista"""
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        errors.append(f"{path}: se esperaba lista, se recibió {type(value).__name__}")
+        return []
+    return value
+
+
+def _check_periods(data: dict, names: tuple, path: str, errors: list):
+    """Comprueba los campos de período y que el fin no sea anterior al inicio"""
+    values = {}
+    for name in names:
+        for unit in ('week', 'month'):
+            key = f'{name}_{unit}'
+            if key in data and data[key] is not None:
+                value = _as_int(data[key])
+                if value is None or value < 1:
+                    errors.append(f"{path}.{key}: se esperaba entero ≥ 1, se recibió {data[key]!r}")
+                elif name not in values:
+                    values[name] = value
+    if 'start' in values and 'end' in values and values['end'] < values['start']:
+        errors.append(f"{path}: termina ({values['end']}) antes de empezar ({values['start']})")
+
+
+@timed
+def validate_methodology(data) -> list:
+    """
+    Valida el esquema de una metodología en una sola pasada
+
+    Returns:
+        Lista con todas las violaciones encontradas (vacía si es válida)
+    """
+    if not isinstance(data, dict):
+        return [f"metodología: se esperaba objeto, se recibió {type(data).__name__}"]
+
+    errors = []
+    for key in TEXT_SECTIONS:
+        _check_text(data.get(key), key, errors)
+
+    for p_idx, principle in enumerate(_check_list(data.get('principles'), 'principles', errors)):
+        path = f'principles[{p_idx}]'
+        if not isinstance(principle, dict):
+            errors.append(f"{path}: se esperaba objeto")
+            continue
+        _check_text(principle.get('name'), f'{path}.name', errors, required=True)
+        _check_text(principle.get('description'), f'{path}.description', errors)
+
+    for p_idx, phase in enumerate(_check_list(data.get('phases'), 'phases', errors)):
+        path = f'phases[{p_idx}]'
+        if not isinstance(phase, dict):
+            errors.append(f"{path}: se esperaba objeto")
+            continue
+        _check_text(phase.get('title'), f'{path}.title', errors, required=True)
+        _check_text(phase.get('description'), f'{path}.description', errors)
+        _check_periods(phase, ('start', 'end'), path, errors)
+
+        for t_idx, task in enumerate(_check_list(phase.get('tasks'), f'{path}.tasks', errors)):
+            task_path = f'{path}.tasks[{t_idx}]'
+            if not isinstance(task, dict):
+                errors.append(f"{task_path}: se esperaba objeto")
+                continue
+            _check_text(task.get('code'), f'{task_path}.code', errors, required=True)
+            _check_text(task.get('title'), f'{task_path}.title', errors, required=True)
+            _check_text(task.get('description'), f'{task_path}.description', errors)
+            _check_text(task.get('deliverable_code'), f'{task_path}.deliverable_code', errors)
+            _check_periods(task, _TASK_PERIODS, task_path, errors)
+            for key in _TASK_TAGS:
+                value = task.get(key)
+                if not isinstance(value, str):
+                    for v_idx, item in enumerate(_check_list(value, f'{task_path}.{key}', errors)):
+                        _check_text(item, f'{task_path}.{key}[{v_idx}]', errors)
+            items = task.get('items')
+            if not isinstance(items, str):
+                for i_idx, item in enumerate(_check_list(items, f'{task_path}.items', errors)):
+                    _check_text(item, f'{task_path}.items[{i_idx}]', errors)
+
+        deliverables = _check_list(phase.get('deliverables'), f'{path}.deliverables', errors)
+        for d_idx, deliverable in enumerate(deliverables):
+            d_path = f'{path}.deliverables[{d_idx}]'
+            if not isinstance(deliverable, dict):
+                errors.append(f"{d_path}: se esperaba objeto")
+                continue
+            _check_text(deliverable.get('code'), f'{d_path}.code', errors, required=True)
+            _check_text(deliverable.get('name'), f'{d_path}.name', errors)
+
+    return errors
+
+
+def load_methodology(data: dict, strict: bool = False) -> Methodology:
+    """
+    Valida y normaliza una metodología
+
+    Args:
+        data: Diccionario de la metodología
+        strict: Si True, lanza ValueError con todas las violaciones del esquema;
+            si False, las tolera y normaliza lo que pueda
+
+    Returns:
+        Methodology
+    """
+    if strict:
+        errors = validate_methodology(data)
+        if errors:
+            raise ValueError("Metodología inválida:\n" + '\n'.join(f"  - {e}" for e in errors))
+    return Methodology.from_dict(data)
+
+
+def as_methodology(methodology) -> Methodology:
+    """Convierte un diccionario en Methodology (un Methodology se retorna tal cual)"""
+    if isinstance(methodology, Methodology):
+        return methodology
+    return Methodology.from_dict(methodology)
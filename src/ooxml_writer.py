@@ -0,0 +1,404 @@
+"""
+Escritor OOXML directo: genera word/document.xml sin python-docx
+
+Produce el mismo documento que document_writer.create_word_document (mismos estilos,
+sombreados, bordes y celdas combinadas, byte a byte en word/document.xml), pero arma el
+XML concatenando fragmentos precompilados en lugar de construir y recorrer el árbol de
+python-docx. El contenido sale de los mismos bloques del IR (document_ir). Las demás
+partes del paquete (styles.xml, numbering.xml, tema, márgenes...) se copian de la
+plantilla base (base_template.py), leída una vez por proceso; el .docx se escribe
+directamente como zip.
+
+Las particularidades del XML de python-docx se reproducen a propósito (p. ej. el orden
+de los atributos o el ancho de columna que reparte doc.add_table) para que ambos
+escritores sean intercambiables. Los caracteres que XML no admite se eliminan
+(python-docx fallaría con ellos).
+"""
+
+import io
+import re
+import zipfile
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from docx.oxml.ns import qn, nsdecls
+from docx.shared import Cm, Emu, Twips
+from lxml import etree
+
+from .base_template import COLORS, base_template
+from .document_ir import phase_blocks
+from .document_render import render_document
+from .document_writer import HEADING_STYLES, LIST_STYLES
+from .profiling import timed
+
+
+DOCUMENT_PART = 'word/document.xml'
+STYLES_PART = 'word/styles.xml'
+
+# Estilos de párrafo y de tabla usados en el cuerpo (nombre -> styleId del documento base)
+_STYLE_NAMES = ('Aninver Section Heading', 'Aninver Title 1', 'Aninver Title 2',
+                'Aninver Title 3', 'Aninver Body Text', 'List Bullet', 'List Bullet 2',
+                'List Bullet 3', 'List Number', 'List Number 2', 'List Number 3',
+                'Aninver Principles Table', 'Aninver Activities Table', 'Aninver Gantt Table',
+                'Aninver Deliverable Table', 'Aninver Work Plan Table')
+
+# Fragmentos precompilados
+_EMPTY_P = '<w:p/>'
+_STYLED_P = '<w:p><w:pPr><w:pStyle w:val="{}"/></w:pPr>{}</w:p>'
+_HEADER_P = '<w:p><w:pPr><w:spacing w:before="160"/></w:pPr>{}</w:p>'
+_LEGEND_P = ('<w:p><w:pPr><w:jc w:val="right"/></w:pPr><w:r><w:rPr><w:i/>'
+             '<w:sz w:val="18"/></w:rPr>{}</w:r></w:p>')
+_CELL_P = '<w:p>{}</w:p>'
+_CENTERED_P = '<w:p><w:pPr><w:jc w:val="center"/></w:pPr>{}</w:p>'
+_CELL = '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{}"/>{}</w:tcPr>{}</w:tc>'
+_SPAN = '<w:gridSpan w:val="{}"/>'
+_SHADING = '<w:shd w:fill="{}" w:val="clear"/>'
+_GRID_COL = '<w:gridCol w:w="{}"/>'
+_TABLE = ('<w:tbl><w:tblPr><w:tblStyle w:val="{}"/><w:tblW w:type="auto" w:w="0"/>{}</w:tblPr>'
+          '<w:tblGrid>{}</w:tblGrid>{}</w:tbl>')
+_TBL_LOOK = ('<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+             'w:noHBand="0" w:noVBand="1" w:val="04A0"/>')
+_TBL_LOOK_LAST_ROW = ('<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" '
+                      'w:lastRow="1" w:noHBand="0" w:noVBand="1" w:val="04E0"/>')
+_TBL_CENTER = '<w:jc w:val="center"/>'
+_TBL_LEFT = '<w:jc w:val="left"/>'
+_TBL_FIXED = '<w:tblLayout w:type="fixed"/>'
+
+# Propiedades de run (en el orden del esquema: b, i, color, sz); la fuente, el tamaño y
+# el formato de encabezados vienen de los estilos de tabla
+_BOLD = '<w:b/>'
+_ITALIC = '<w:i/>'
+_WHITE = '<w:color w:val="FFFFFF"/>'
+_SIZE_12 = '<w:sz w:val="24"/>'
+
+_BREAKS = re.compile(r'([\t\r\n])')
+_INVALID_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+
+@lru_cache(maxsize=1)
+def _base_package() -> dict:
+    """
+    Partes de la plantilla base (base_template), leídas una vez por proceso
+
+    Returns:
+        {'parts': [(nombre, bytes)], 'head': XML hasta el cuerpo, 'tail': sectPr y cierre,
+         'styles': {nombre: styleId}, 'block_width': ancho útil en EMU}
+    """
+    with zipfile.ZipFile(io.BytesIO(base_template())) as package:
+        parts = [(name, package.read(name)) for name in package.namelist()]
+    contents = dict(parts)
+    document = contents[DOCUMENT_PART].decode('utf-8')
+    body_end = document.rindex('<w:sectPr')
+
+    styles = {}
+    for style in etree.fromstring(contents[STYLES_PART]).iterfind(qn('w:style')):
+        name = style.find(qn('w:name'))
+        if name is not None and name.get(qn('w:val')) in _STYLE_NAMES:
+            styles[name.get(qn('w:val'))] = style.get(qn('w:styleId'))
+    missing = set(_STYLE_NAMES) - set(styles)
+    if missing:
+        raise ValueError(f"La plantilla base no tiene los estilos: {', '.join(sorted(missing))}")
+
+    section = etree.fromstring(document[body_end:document.rindex('</w:body>')].replace(
+        '<w:sectPr', f'<w:sectPr {nsdecls("w")}', 1))
+    margins = section.find(qn('w:pgMar'))
+    block_width = Twips(int(section.find(qn('w:pgSz')).get(qn('w:w')))
+                        - int(margins.get(qn('w:left'))) - int(margins.get(qn('w:right'))))
+    return {
+        'parts': parts,
+        'head': document[:body_end],
+        'tail': document[body_end:],
+        'styles': styles,
+        'block_width': block_width,
+    }
+
+
+def _t(text: str) -> str:
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+    return f'<w:t>{escape(text)}</w:t>'
+
+
+def _run_content(text: str) -> str:
+    """Contenido de un run: w:t, con w:tab y w:br para tabuladores y saltos de línea"""
+    if _INVALID_XML.search(text):
+        text = _INVALID_XML.sub('', text)
+    if not _BREAKS.search(text):
+        return _t(text) if text else ''
+    content = []
+    for piece in _BREAKS.split(text):
+        if piece == '\t':
+            content.append('<w:tab/>')
+        elif piece in ('\r', '\n'):
+            content.append('<w:br/>')
+        elif piece:
+            content.append(_t(piece))
+    return ''.join(content)
+
+
+def _run(text: str, properties: str = '') -> str:
+    content = _run_content(text) if text else ''
+    if properties:
+        return f'<w:r><w:rPr>{properties}</w:rPr>{content}</w:r>'
+    return f'<w:r>{content}</w:r>' if content else '<w:r/>'
+
+
+def _runs(runs: list) -> str:
+    """Runs (texto, negrita, itálica) de markup.inline_runs"""
+    return ''.join(_run(text, (_BOLD if bold else '') + (_ITALIC if italic else ''))
+                   for text, bold, italic in runs)
+
+
+def _styled(style_id: str, text: str) -> str:
+    """Párrafo con estilo (doc.add_paragraph(text, style=...))"""
+    return _STYLED_P.format(style_id, _run(text) if text else '')
+
+
+def _cell(width: int, paragraph: str, shading: str = None, span: int = None) -> str:
+    properties = (_SPAN.format(span) if span else '') + (_SHADING.format(shading) if shading else '')
+    return _CELL.format(width, properties, paragraph)
+
+
+def _table(style_id: str, properties: str, grid: list, rows: list) -> str:
+    return _TABLE.format(style_id, properties, ''.join(_GRID_COL.format(w) for w in grid),
+                         ''.join(f'<w:tr>{"".join(cells)}</w:tr>' for cells in rows))
+
+
+class _Body:
+    """Acumula los fragmentos del cuerpo del documento"""
+
+    def __init__(self, base: dict):
+        self.parts = []
+        self.styles = base['styles']
+        self.block_width = base['block_width']
+
+    def grid_width(self, cols: int) -> int:
+        """Ancho de columna de doc.add_table(rows, cols) en twips"""
+        return Emu(self.block_width // cols).twips
+
+    def styled(self, style: str, text: str):
+        self.parts.append(_styled(self.styles[style], text))
+
+    def paragraph(self, runs: list):
+        """Párrafo Aninver Body Text (como _add_paragraph)"""
+        self.parts.append(_STYLED_P.format(self.styles['Aninver Body Text'], _runs(runs)))
+
+    def subheading(self, text: str):
+        """Línea en negrita de un bloque de texto (como _add_subheading)"""
+        self.parts.append(_HEADER_P.format(_run(text, _BOLD)))
+
+    def list_item(self, kind: str, level: int, runs: list):
+        """Ítem de lista en el estilo de su nivel (como _add_list_item)"""
+        self.parts.append(_STYLED_P.format(self.styles[LIST_STYLES[kind][level]], _runs(runs)))
+
+    def legend(self, text: str):
+        self.parts.append(_LEGEND_P.format(_run_content(text) if text else ''))
+
+
+def _write_blocks(body: _Body, blocks: list):
+    """Bloques del IR (como document_writer._add_blocks)"""
+    for block in blocks:
+        _BLOCK_WRITERS[block['type']](body, block)
+
+
+def _section_fragment(build, *args) -> str:
+    body = _Body(_base_package())
+    _write_blocks(body, build(*args))
+    return ''.join(body.parts)
+
+
+@timed
+def _principles_table(body: _Body, block: dict):
+    """Tabla de principios (como _add_principles_table)"""
+    principles = block['principles']
+    if not principles:
+        return
+    content_width, separator_width = Cm(5.2).twips, Cm(1).twips
+    widths = [content_width, separator_width, content_width, separator_width, content_width]
+
+    def row(items, text_of, shading=None):
+        cells = [_cell(w, _EMPTY_P) for w in widths]
+        for i, item in enumerate(items):
+            cells[2 * i] = _cell(widths[2 * i], _CELL_P.format(_run(text_of(i, item))), shading)
+        return cells
+
+    rows = [
+        row(range(min(len(principles), 3)), lambda i, _: f"{block['label']} {i + 1}",
+            COLORS['principle_header']),
+        row(principles[:3], lambda _, p: p['name'], COLORS['principle_title']),
+        row(principles[:3], lambda _, p: p['description']),
+    ]
+    if len(principles) > 3:
+        rows.append(row(principles[3:6], lambda _, p: p['name'], COLORS['principle_title']))
+        rows.append(row(principles[3:6], lambda _, p: p['description']))
+    grid = [body.grid_width(5)] * 5
+    body.parts.append(_table(body.styles['Aninver Principles Table'],
+                             _TBL_CENTER + _TBL_FIXED + _TBL_LOOK, grid, rows))
+    body.parts.append(_EMPTY_P)
+
+
+@timed
+def _activities_table(body: _Body, block: dict):
+    """Tabla vertical Activities/Timeline (como _add_activities_timeline_table_improved)"""
+    width = body.grid_width(1)
+
+    def cell(text):
+        return [_cell(width, _CELL_P.format(_run(text)))]
+
+    rows = [cell(block['header'])] + [cell(item) for item in block['items']]
+    rows.append(cell(block['footer']))
+    body.parts.append(_table(body.styles['Aninver Activities Table'],
+                             _TBL_LEFT + _TBL_LOOK_LAST_ROW, [width], rows))
+
+
+@timed
+def _gantt_table(body: _Body, block: dict):
+    """Tabla Gantt de la fase (como _add_gantt_table_improved)"""
+    num_columns = len(block['labels'])
+    width = body.grid_width(num_columns + 1)
+    empty_cell = _cell(width, _EMPTY_P)
+    active_cell = _cell(width, _EMPTY_P, COLORS['gantt_active'])
+
+    def text_cell(text, shading=None):
+        return _cell(width, _CELL_P.format(_run(text)), shading)
+
+    rows = [[text_cell(block['header'])] + [text_cell(label) for label in block['labels']]]
+    for row in block['rows']:
+        cells = [text_cell(row['label'])] + [empty_cell] * num_columns
+        for col, _, marker in row['bars']:
+            cells[col + 1] = (text_cell(marker, COLORS['gantt_active']) if marker is not None
+                              else active_cell)
+        rows.append(cells)
+
+    body.parts.append(_table(body.styles['Aninver Gantt Table'], _TBL_CENTER + _TBL_LOOK,
+                             [width] * (num_columns + 1), rows))
+    body.legend(block['legend'])
+
+
+@timed
+def _deliverable_box(body: _Body, block: dict):
+    """Caja de entregable (como _add_deliverable_box)"""
+    code_width, name_width = Twips(2494).twips, Twips(6000).twips
+    cells = [
+        _cell(code_width, _CELL_P.format(_run(block['code']))),
+        _cell(name_width, _CELL_P.format(_run(block['name']))),
+    ]
+    body.parts.append(_table(body.styles['Aninver Deliverable Table'], _TBL_LOOK,
+                             [code_width, name_width], [cells]))
+    body.parts.append(_EMPTY_P)
+
+
+def _phase_fragment(phase, lang_config: dict) -> str:
+    """XML de una fase con su propio cronograma, para render_phase_fragments"""
+    return _section_fragment(phase_blocks, phase, lang_config)
+
+
+@timed
+def _work_plan(body: _Body, block: dict):
+    """Work Plan consolidado (como _add_work_plan)"""
+    num_periods = len(block['labels'])
+    num_cols = 2 + num_periods
+
+    col_widths = [Cm(1.2), Cm(6)] + [Cm(0.8 if block['months'] else 1.0)] * num_periods
+    code_width, title_width = col_widths[0].twips, col_widths[1].twips
+    period_width = col_widths[2].twips if num_periods else 0
+    empty_period = _cell(period_width, _EMPTY_P)
+
+    def text_cell(width, text):
+        return _cell(width, _CELL_P.format(_run(text)))
+
+    def bar_cells(bars, shading):
+        """Celdas de los períodos de una fila (como _bar_cells)"""
+        cells = [empty_period] * num_periods
+        for start, length, marker in bars:
+            paragraph = _CENTERED_P.format(_run(marker, _BOLD)) if marker else _EMPTY_P
+            width = Emu(sum(col_widths[2 + start:2 + start + length])).twips
+            # Las columnas absorbidas por la celda combinada no emiten nada
+            cells[start:start + length] = ([_cell(width, paragraph, shading,
+                                                  length if length > 1 else None)]
+                                           + [''] * (length - 1))
+        return cells
+
+    rows = [
+        [_cell(Emu(sum(col_widths)).twips, _CELL_P.format(_run(block['title'], _SIZE_12)),
+               span=num_cols)],
+        [_cell(code_width, _EMPTY_P), _cell(title_width, _EMPTY_P)]
+        + [_cell(period_width, _CENTERED_P.format(_run(label))) for label in block['labels']],
+    ]
+    for row in block['rows']:
+        if row['phase']:
+            rows.append([_cell(Emu(col_widths[0] + col_widths[1]).twips,
+                               _CELL_P.format(_run(row['title'], _BOLD + _WHITE)),
+                               COLORS['timeline'], 2)]
+                        + bar_cells(row['bars'], COLORS['timeline']))
+        else:
+            rows.append([text_cell(code_width, row['code']), text_cell(title_width, row['title'])]
+                        + bar_cells(row['bars'], COLORS['gantt_active']))
+
+    body.parts.append(_table(body.styles['Aninver Work Plan Table'], _TBL_CENTER + _TBL_LOOK,
+                             [body.grid_width(num_cols)] * num_cols, rows))
+    body.legend(block['legend'])
+
+
+# Escritura de cada tipo de bloque del IR
+_BLOCK_WRITERS = {
+    'heading': lambda body, block: body.styled(HEADING_STYLES[block['level']], block['text']),
+    'paragraph': lambda body, block: body.paragraph(block['runs']),
+    'subheading': lambda body, block: body.subheading(block['text']),
+    'bullet': lambda body, block: body.list_item('bullet', block['level'], block['runs']),
+    'numbered': lambda body, block: body.list_item('numbered', block['level'], block['runs']),
+    'spacer': lambda body, block: body.parts.append(_EMPTY_P),
+    'principles': _principles_table,
+    'activities': _activities_table,
+    'gantt': _gantt_table,
+    'deliverable': _deliverable_box,
+    'work_plan': _work_plan,
+}
+
+
+class OoxmlWriter:
+    """Escritor OOXML directo del documento (interfaz en document_render)"""
+
+    name = 'ooxml'
+
+    def __init__(self):
+        self.base = _base_package()
+        self.body = _Body(self.base)
+
+    def write_blocks(self, blocks: list):
+        _write_blocks(self.body, blocks)
+
+    def append_fragment(self, fragment: str):
+        self.body.parts.append(fragment)
+
+    @staticmethod
+    def section_fragment(build, *args) -> str:
+        return _section_fragment(build, *args)
+
+    @staticmethod
+    def phase_fragment(phase, lang_config: dict) -> str:
+        return _phase_fragment(phase, lang_config)
+
+    def save(self, output_path):
+        """Escribe el paquete: las partes de la plantilla y el document.xml del cuerpo"""
+        document = (self.base['head'] + ''.join(self.body.parts)
+                    + self.base['tail']).encode('utf-8')
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as package:
+            for name, data in self.base['parts']:
+                package.writestr(name, document if name == DOCUMENT_PART else data)
+
+
+@timed
+def write_ooxml_document(methodology, output_path, lang_config: dict, deadline=None,
+                         report: dict = None, work_plan: bool = True, start_date=None,
+                         merge_bars: bool = False, phase_workers: int = 1,
+                         incremental: bool = False):
+    """
+    Escribe el .docx emitiendo word/document.xml directamente
+
+    Mismos argumentos, recortes por deadline y report que
+    document_writer.create_word_document (con writer='ooxml').
+    output_path puede ser una ruta o un archivo binario abierto.
+    """
+    render_document(OoxmlWriter(), methodology, output_path, lang_config, deadline, report,
+                    work_plan, start_date, merge_bars, phase_workers, incremental)
@@ -0,0 +1,56 @@
+"""
+Renderizado de las fases en paralelo
+
+Las fases son bloques independientes del documento (título, descripción, tablas de
+actividades y Gantt, detalle de tareas y entregables). Con varios procesos, cada fase se
+dibuja en un proceso del pool como fragmento XML del cuerpo y el proceso principal los
+inserta en orden. Cada escritor aporta su función de fase (document_writer y ooxml_writer).
+
+Los fragmentos solo referencian estilos de la plantilla base, la misma en todos los
+procesos (base_template); no llevan relaciones (r:id), marcadores ni numeraciones propias
+que haya que renumerar al unirlos. El Gantt de cada fase se calcula con el cronograma de
+la fase sola, que da las mismas columnas que el de la metodología, y la numeración de los
+eventos ya es local a cada fase: el documento es idéntico al del renderizado en serie.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+
+from .deadline import as_deadline
+from .profiling import timed
+
+
+@timed
+def render_phase_fragments(render_phase, phases: list, lang_config: dict, workers: int,
+                           deadline=None) -> list:
+    """
+    Fragmentos XML de las fases, en orden, dibujados en un pool de procesos
+
+    Args:
+        render_phase: Función de módulo render_phase(phase, lang_config) -> str (se envía
+            a los procesos por pickle)
+        phases: Fases (Phase) de la metodología
+        lang_config: Configuración del idioma
+        workers: Procesos del pool (como máximo uno por fase)
+        deadline: Con tiempo limitado, las fases que no terminan a tiempo se descartan
+
+    Returns:
+        Lista de fragmentos, más corta que phases si se agotó el tiempo (quien llama
+        escribe el resto de las fases sin tablas, como en serie)
+    """
+    deadline = as_deadline(deadline)
+    fragments = []
+    if not phases or deadline.expired():
+        return fragments
+    executor = ProcessPoolExecutor(max_workers=max(1, min(workers, len(phases))))
+    try:
+        futures = [executor.submit(render_phase, phase, lang_config) for phase in phases]
+        for future in futures:
+            try:
+                fragments.append(future.result(
+                    timeout=deadline.remaining() if deadline.limited else None))
+            except TimeoutError:
+                break
+    finally:
+        # Sin esperar a las fases que ya no se van a usar
+        executor.shutdown(wait=len(fragments) == len(phases), cancel_futures=True)
+    return fragments
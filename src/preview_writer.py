@@ -0,0 +1,280 @@
+"""
+Vista previa de la metodología en HTML o Markdown
+
+Dibuja los mismos bloques del IR (document_ir) que el Word: una página HTML
+autocontenida (estilos en línea con los colores Aninver) o Markdown. No construye el
+.docx ni abre la plantilla base, así que tarda milisegundos y sirve para revisar el
+contenido en el navegador o en un diff antes de generar el Word.
+"""
+
+from html import escape
+
+from .base_template import COLORS
+from .document_ir import build_document
+
+
+PREVIEW_FORMATS = ('html', 'md')
+
+# Etiquetas HTML y marcas Markdown de los runs (negrita, itálica)
+_RUN_TAGS = {(True, False): 'strong', (False, True): 'em'}
+_RUN_MARKS = {(True, True): '***', (True, False): '**', (False, True): '*'}
+
+_CSS = f"""
+body {{ font-family: Arial, sans-serif; font-size: 10pt; line-height: 1.3; max-width: 60em;
+       margin: 2em auto; color: #222; }}
+h1, h2, h3, h4 {{ color: #{COLORS['principle_title']}; }}
+p {{ text-align: justify; }}
+p.subheading {{ margin-top: 1em; }}
+p.legend {{ text-align: right; font-style: italic; font-size: 9pt; }}
+table {{ border-collapse: collapse; margin: 0.5em 0; }}
+td, th {{ padding: 2px 6px; vertical-align: top; white-space: pre-wrap; }}
+table.grid td, table.grid th {{ border: 1px solid #000; text-align: center; }}
+table.grid td.title {{ text-align: left; }}
+td.active {{ background: #{COLORS['gantt_active']}; font-weight: bold; }}
+td.phase {{ background: #{COLORS['timeline']}; color: #fff; font-weight: bold; }}
+table.principles td {{ width: 12em; }}
+table.principles td.header {{ background: #{COLORS['principle_header']}; font-weight: bold; }}
+table.principles td.name {{ background: #{COLORS['principle_title']}; color: #fff;
+                            font-weight: bold; }}
+table.activities th {{ background: #{COLORS['activities_header']}; color: #fff; text-align: left; }}
+table.activities td {{ background: #{COLORS['activities_body']}; min-width: 20em; }}
+table.activities td.timeline {{ background: #{COLORS['timeline']}; color: #fff; font-weight: bold; }}
+table.deliverable td {{ background: #{COLORS['deliverable_body']}; }}
+table.deliverable td.code {{ background: #{COLORS['deliverable_header']}; font-weight: bold; }}
+th.work-plan {{ background: #{COLORS['activities_header']}; color: #fff; font-size: 12pt; }}
+"""
+
+
+def _runs_html(runs: list) -> str:
+    html = []
+    for text, bold, italic in runs:
+        text = escape(text)
+        if bold and italic:
+            text = f'<strong><em>{text}</em></strong>'
+        elif bold or italic:
+            tag = _RUN_TAGS[bold, italic]
+            text = f'<{tag}>{text}</{tag}>'
+        html.append(text)
+    return ''.join(html)
+
+
+def _row_html(cells: list) -> str:
+    return f"<tr>{''.join(cells)}</tr>"
+
+
+def _bars_html(bars: list, num_periods: int, active_class: str) -> list:
+    """Celdas de los períodos de una fila: los tramos combinados con colspan"""
+    cells = ['<td></td>'] * num_periods
+    for start, length, marker in bars:
+        span = f' colspan="{length}"' if length > 1 else ''
+        cells[start:start + length] = ([f'<td class="{active_class}"{span}>'
+                                        f'{escape(marker or "")}</td>'] + [''] * (length - 1))
+    return cells
+
+
+def _principles_html(block: dict) -> list:
+    principles = block['principles']
+    lines = ['<table class="principles">']
+    header = [f'<td class="header">{escape(block["label"])} {i + 1}</td>'
+              for i in range(min(len(principles), 3))]
+    lines.append(_row_html(header))
+    for first in range(0, min(len(principles), 6), 3):
+        group = principles[first:first + 3]
+        lines.append(_row_html([f'<td class="name">{escape(p["name"])}</td>' for p in group]))
+        lines.append(_row_html([f'<td>{escape(p["description"])}</td>' for p in group]))
+    lines.append('</table>')
+    return lines
+
+
+def _gantt_html(block: dict) -> list:
+    num_periods = len(block['labels'])
+    lines = ['<table class="grid">',
+             _row_html([f'<th><em>{escape(block["header"])}</em></th>']
+                       + [f'<th>{escape(label)}</th>' for label in block['labels']])]
+    for row in block['rows']:
+        lines.append(_row_html([f'<td>{escape(row["label"])}</td>']
+                               + _bars_html(row['bars'], num_periods, 'active')))
+    lines += ['</table>', f'<p class="legend">{escape(block["legend"])}</p>']
+    return lines
+
+
+def _work_plan_html(block: dict) -> list:
+    num_periods = len(block['labels'])
+    lines = ['<table class="grid">',
+             _row_html([f'<th class="work-plan" colspan="{num_periods + 2}">'
+                        f'{escape(block["title"])}</th>']),
+             _row_html(['<th></th>', '<th></th>']
+                       + [f'<th>{escape(label)}</th>' for label in block['labels']])]
+    for row in block['rows']:
+        if row['phase']:
+            cells = [f'<td class="phase title" colspan="2">{escape(row["title"])}</td>']
+            cells += _bars_html(row['bars'], num_periods, 'phase')
+        else:
+            cells = [f'<td>{escape(row["code"])}</td>',
+                     f'<td class="title">{escape(row["title"])}</td>']
+            cells += _bars_html(row['bars'], num_periods, 'active')
+        lines.append(_row_html(cells))
+    lines += ['</table>', f'<p class="legend">{escape(block["legend"])}</p>']
+    return lines
+
+
+def render_html(blocks: list, title: str = '') -> str:
+    """Página HTML autocontenida con los bloques del IR"""
+    lines = []
+    # Listas abiertas, de la exterior a la interior; su último li sigue abierto para
+    # poder anidar dentro la lista del nivel siguiente
+    open_lists = []
+    for block in blocks:
+        kind = block['type']
+        list_tag = {'bullet': 'ul', 'numbered': 'ol'}.get(kind)
+        depth = block['level'] + 1 if list_tag else 0
+        while len(open_lists) > depth or (open_lists and len(open_lists) == depth
+                                          and open_lists[-1] != list_tag):
+            lines.append(f'</li></{open_lists.pop()}>')
+        if list_tag:
+            if len(open_lists) == depth:
+                lines.append('</li>')
+            while len(open_lists) < depth:
+                lines.append(f'<{list_tag}>')
+                open_lists.append(list_tag)
+
+        if kind == 'heading':
+            level = block['level'] + 1
+            lines.append(f'<h{level}>{escape(block["text"])}</h{level}>')
+        elif kind == 'paragraph':
+            lines.append(f'<p>{_runs_html(block["runs"])}</p>')
+        elif kind == 'subheading':
+            lines.append(f'<p class="subheading"><strong>{escape(block["text"])}</strong></p>')
+        elif list_tag:
+            lines.append(f'<li>{_runs_html(block["runs"])}')
+        elif kind == 'principles':
+            lines += _principles_html(block)
+        elif kind == 'activities':
+            lines += (['<table class="activities">',
+                       _row_html([f'<th>{escape(block["header"])}</th>'])]
+                      + [_row_html([f'<td>{escape(item)}</td>']) for item in block['items']]
+                      + [_row_html([f'<td class="timeline">{escape(block["footer"])}</td>']),
+                         '</table>'])
+        elif kind == 'gantt':
+            lines += _gantt_html(block)
+        elif kind == 'deliverable':
+            lines += ['<table class="deliverable">',
+                      _row_html([f'<td class="code">{escape(block["code"])}</td>',
+                                 f'<td>{escape(block["name"])}</td>']),
+                      '</table>']
+        elif kind == 'work_plan':
+            lines += _work_plan_html(block)
+    while open_lists:
+        lines.append(f'</li></{open_lists.pop()}>')
+
+    return ('<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{escape(title)}</title>\n<style>{_CSS}</style>\n</head>\n<body>\n'
+            + '\n'.join(lines) + '\n</body>\n</html>\n')
+
+
+def _cell_md(text: str) -> str:
+    """Texto de una celda de tabla Markdown (sin barras ni saltos de línea)"""
+    text = text.replace('|', '\\|').replace('\r\n', '\n').replace('\t', ' ')
+    return text.replace('\r', '<br>').replace('\n', '<br>').strip()
+
+
+def _table_md(header: list, rows: list) -> list:
+    return (['| ' + ' | '.join(_cell_md(cell) for cell in header) + ' |',
+             '|' + '---|' * len(header)]
+            + ['| ' + ' | '.join(_cell_md(cell) for cell in row) + ' |' for row in rows]
+            + [''])
+
+
+def _runs_md(runs: list) -> str:
+    return ''.join(f"{_RUN_MARKS[bold, italic]}{text}{_RUN_MARKS[bold, italic]}"
+                   if bold or italic else text for text, bold, italic in runs)
+
+
+def _bars_md(bars: list, num_periods: int, active: str = '█') -> list:
+    """Celdas de los períodos de una fila: el marcador o un bloque en las activas"""
+    cells = [''] * num_periods
+    for start, length, marker in bars:
+        cells[start:start + length] = [marker or active] + [active] * (length - 1)
+    return cells
+
+
+def render_markdown(blocks: list) -> str:
+    """Markdown con los bloques del IR (tablas en formato pipe)"""
+    lines = []
+    previous = None
+    for block in blocks:
+        kind = block['type']
+        if kind == 'spacer':
+            continue
+        # Línea en blanco entre bloques, salvo entre ítems de una misma lista (o anidados)
+        is_item = kind in ('bullet', 'numbered')
+        if lines and not (is_item and previous in ('bullet', 'numbered')
+                          and (kind == previous or block['level'] > 0)):
+            lines.append('')
+        previous = kind
+
+        if kind == 'heading':
+            lines.append(f"{'#' * (block['level'] + 1)} {block['text']}")
+        elif kind == 'paragraph':
+            lines.append(_runs_md(block['runs']))
+        elif kind == 'subheading':
+            lines.append(f"**{block['text']}**")
+        elif is_item:
+            marker = '-' if kind == 'bullet' else '1.'
+            lines.append(f"{'    ' * block['level']}{marker} {_runs_md(block['runs'])}")
+        elif kind == 'principles':
+            # Como en el Word: hasta 6 principios, en filas de 3
+            principles = block['principles']
+            rows = []
+            for first in (0, 3):
+                group = principles[first:first + 3]
+                if group:
+                    padding = [''] * (min(len(principles), 3) - len(group))
+                    rows.append([f"**{p['name']}**" for p in group] + padding)
+                    rows.append([p['description'] for p in group] + padding)
+            lines += _table_md([f"{block['label']} {i + 1}"
+                                for i in range(min(len(principles), 3))], rows)
+        elif kind == 'activities':
+            lines += _table_md([block['header']], [[item] for item in block['items']]
+                               + [[f"*{block['footer']}*"]])
+        elif kind == 'gantt':
+            num_periods = len(block['labels'])
+            lines += _table_md([block['header']] + block['labels'],
+                               [[row['label']] + _bars_md(row['bars'], num_periods)
+                                for row in block['rows']])
+            lines.append(f"*{block['legend']}*")
+        elif kind == 'deliverable':
+            lines.append(f"> **{block['code']}**: {block['name']}")
+        elif kind == 'work_plan':
+            num_periods = len(block['labels'])
+            rows = [[f"**{row['title']}**" if row['phase'] else row['code'],
+                     '' if row['phase'] else row['title']]
+                    + _bars_md(row['bars'], num_periods) for row in block['rows']]
+            lines.append(f"**{block['title']}**")
+            lines.append('')
+            lines += _table_md(['', ''] + block['labels'], rows)
+            lines.append(f"*{block['legend']}*")
+    return '\n'.join(lines).rstrip('\n') + '\n'
+
+
+def create_preview(methodology, lang_config: dict, fmt: str = 'html', work_plan: bool = True,
+                   start_date=None, merge_bars: bool = False) -> str:
+    """
+    Vista previa de la metodología (mismo contenido que create_word_document)
+
+    Args:
+        methodology: Diccionario o Methodology
+        lang_config: Configuración del idioma
+        fmt: 'html' o 'md'
+        work_plan, start_date, merge_bars: Como en create_word_document
+
+    Returns:
+        Texto de la vista previa
+    """
+    if fmt not in PREVIEW_FORMATS:
+        raise ValueError(f"Formato de vista previa no soportado: {fmt}. "
+                         f"Use {', '.join(PREVIEW_FORMATS)}.")
+    blocks = build_document(methodology, lang_config, work_plan, start_date, merge_bars)
+    if fmt == 'md':
+        return render_markdown(blocks)
+    return render_html(blocks, lang_config['sections']['title'])
@@ -0,0 +1,183 @@
+"""
+Tramos de tiempo de la ejecución (--profile)
+
+Las etapas del pipeline (parseo del TdR, llamadas al LLM, parseo de la respuesta,
+renderizado...) y los renderizadores _add_* del Word se marcan con span(nombre) o con el
+decorador timed. Sin un Profiler activo ambos se reducen a comprobar una variable global,
+así que el costo es despreciable; con start() cada tramo se acumula en un árbol por
+ruta (mismas llamadas anidadas en el mismo nodo, con su cuenta de llamadas).
+
+Cada hilo tiene su propia pila: los tramos de los hilos de trabajo (redacción en
+paralelo, traducciones) cuelgan de la raíz. Los de los procesos de trabajo (fases en
+paralelo, varios proyectos) no se registran; solo el tramo del proceso principal que los
+espera. El árbol se muestra con format_tree y se guarda con dump: estadísticas de
+cProfile (.prof, .pstats; requiere start(cprofile=True)) o pilas plegadas para
+flamegraph.pl o speedscope (cualquier otra extensión).
+"""
+
+import time
+import cProfile
+import threading
+import functools
+from contextlib import nullcontext
+from pathlib import Path
+
+
+# Extensiones de dump que guardan las estadísticas de cProfile
+PSTATS_SUFFIXES = ('.prof', '.pstats')
+
+_active = None
+_NO_SPAN = nullcontext()
+
+
+def _node(name: str) -> dict:
+    return {'name': name, 'calls': 0, 'seconds': 0.0, 'children': {}}
+
+
+class Profiler:
+    """Árbol de tramos de una ejecución, con cProfile opcional"""
+
+    def __init__(self, cprofile: bool = False):
+        self.root = _node('total')
+        self.root['calls'] = 1
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = [self.root]
+        return stack
+
+    def enter(self, name: str) -> dict:
+        stack = self._stack()
+        with self._lock:
+            node = stack[-1]['children'].get(name)
+            if node is None:
+                node = stack[-1]['children'][name] = _node(name)
+        stack.append(node)
+        return node
+
+    def exit(self, node: dict, seconds: float):
+        self._stack().pop()
+        with self._lock:
+            node['calls'] += 1
+            node['seconds'] += seconds
+
+    def finish(self):
+        self.root['seconds'] = time.perf_counter() - self._started
+
+    def format_tree(self, min_percent: float = 0.0) -> str:
+        """
+        Árbol de tramos: llamadas, segundos, % del total y segundos propios (sin los
+        tramos hijos); se omiten los tramos de menos de min_percent del total
+        """
+        total = self.root['seconds'] or 1e-9
+        lines = [f"{'tramo':<52} {'llamadas':>8} {'s':>9} {'%':>6} {'propio s':>9}"]
+
+        def walk(node, depth):
+            children = list(node['children'].values())
+            own = node['seconds'] - sum(child['seconds'] for child in children)
+            lines.append(f"{'  ' * depth + node['name']:<52} {node['calls']:>8} "
+                         f"{node['seconds']:>9.3f} {node['seconds'] / total * 100:>5.1f}% "
+                         f"{max(own, 0.0):>9.3f}")
+            for child in children:
+                if child['seconds'] / total * 100 >= min_percent:
+                    walk(child, depth + 1)
+
+        walk(self.root, 0)
+        return '\n'.join(lines)
+
+    def folded(self) -> str:
+        """Pilas plegadas ("total;etapa;subetapa microsegundos propios") para flamegraph"""
+        lines = []
+
+        def walk(node, path):
+            path = f"{path};{node['name']}" if path else node['name']
+            children = list(node['children'].values())
+            own = node['seconds'] - sum(child['seconds'] for child in children)
+            if own > 0:
+                lines.append(f"{path} {round(own * 1e6)}")
+            for child in children:
+                walk(child, path)
+
+        walk(self.root, '')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path):
+        """Guarda las estadísticas de cProfile (.prof, .pstats) o las pilas plegadas"""
+        path = Path(path)
+        if path.suffix.lower() in PSTATS_SUFFIXES:
+            if self.cprofile is None:
+                raise ValueError(f"{path.name}: las estadísticas de cProfile requieren "
+                                 "start(cprofile=True)")
+            self.cprofile.dump_stats(str(path))
+        else:
+            path.write_text(self.folded(), encoding='utf-8')
+
+
+class _Span:
+    __slots__ = ('profiler', 'name', 'node', 'started')
+
+    def __init__(self, profiler: Profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.node = self.profiler.enter(self.name)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.exit(self.node, time.perf_counter() - self.started)
+        return False
+
+
+def span(name: str):
+    """Tramo con nombre (with span('save'): ...); sin Profiler activo no hace nada"""
+    if _active is None:
+        return _NO_SPAN
+    return _Span(_active, name)
+
+
+def timed(function=None, *, name: str = None):
+    """Decorador: cada llamada es un tramo con el nombre de la función (o name)"""
+    def decorate(function):
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return function(*args, **kwargs)
+            with _Span(_active, label):
+                return function(*args, **kwargs)
+        return wrapper
+
+    return decorate(function) if function is not None else decorate
+
+
+def active():
+    """Profiler activo, o None"""
+    return _active
+
+
+def start(cprofile: bool = False) -> Profiler:
+    """Activa un Profiler nuevo (con cProfile del hilo principal si cprofile)"""
+    global _active
+    _active = Profiler(cprofile)
+    if _active.cprofile is not None:
+        _active.cprofile.enable()
+    return _active
+
+
+def stop() -> Profiler:
+    """Desactiva el Profiler activo y lo retorna (None si no había)"""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        if profiler.cprofile is not None:
+            profiler.cprofile.disable()
+        profiler.finish()
+    return profiler
@@ -0,0 +1,132 @@
+"""
+Registro de proyectos: metodologías escritas a mano, guardadas como datos en projects/
+
+projects/registry.json describe cada proyecto (título, idioma, archivo, nombre del .docx
+y opciones de renderizado); la metodología de cada uno es un artefacto versionado
+(ver artifacts.py) que solo se lee cuando se pide ese proyecto.
+"""
+
+import os
+import json
+import time
+from functools import lru_cache
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from .artifacts import REGISTRY_FILE, load_artifact
+from .profiling import timed
+
+
+PROJECTS_DIR = Path(__file__).resolve().parent.parent / 'projects'
+
+
+@lru_cache(maxsize=1)
+def _registry() -> dict:
+    with open(PROJECTS_DIR / REGISTRY_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def list_projects() -> dict:
+    """Proyectos registrados: {id: metadatos} (no lee ninguna metodología)"""
+    return dict(_registry())
+
+
+def get_project_info(project_id: str) -> dict:
+    """Metadatos de un proyecto; ValueError si no está registrado"""
+    registry = _registry()
+    if project_id not in registry:
+        raise ValueError(f"Proyecto no registrado: {project_id}. "
+                         f"Disponibles: {', '.join(registry)}")
+    return registry[project_id]
+
+
+def load_project(project_id: str) -> dict:
+    """Lee la metodología de un proyecto (un diccionario nuevo en cada llamada)"""
+    info = get_project_info(project_id)
+    return load_artifact(PROJECTS_DIR / info['file'])['methodology']
+
+
+def project_tdr(project_id: str):
+    """Ruta del TdR del proyecto, si está guardado; None si no"""
+    tdr = get_project_info(project_id).get('tdr')
+    return PROJECTS_DIR / tdr if tdr else None
+
+
+@timed
+def render_project(project_id: str, output_dir: str = 'output', output_path: str = None,
+                   writer: str = 'docx', merge_bars: bool = False,
+                   phase_workers: int = 1, incremental: bool = False) -> str:
+    """
+    Renderiza el Word de un proyecto
+
+    Args:
+        project_id: Identificador en el registro
+        output_dir: Directorio de salida (se usa el nombre de archivo del registro)
+        output_path: Ruta completa de salida; tiene prioridad sobre output_dir
+        writer: Escritor del Word ('docx' u 'ooxml', ver create_word_document)
+        merge_bars: Work Plan con las barras combinadas (se suma a las opciones del registro)
+        phase_workers: Procesos para dibujar las fases en paralelo
+        incremental: Reutiliza las secciones sin cambios de la caché de secciones
+
+    Returns:
+        Ruta del documento generado
+    """
+    # Importación diferida: listar proyectos no necesita python-docx
+    from .document_writer import create_word_document
+    from .translations import get_language_config
+
+    info = get_project_info(project_id)
+    output_path = output_path or os.path.join(output_dir, info['output'])
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    options = dict(info.get('render', {}), writer=writer, phase_workers=phase_workers,
+                   incremental=incremental)
+    if merge_bars:
+        options['merge_bars'] = True
+    create_word_document(load_project(project_id), output_path,
+                         get_language_config(info['language']), **options)
+    return output_path
+
+
+def _render_worker(project_id: str, output_dir: str, writer: str, merge_bars: bool,
+                   phase_workers: int, incremental: bool) -> tuple:
+    started = time.perf_counter()
+    path = render_project(project_id, output_dir, writer=writer, merge_bars=merge_bars,
+                          phase_workers=phase_workers, incremental=incremental)
+    return path, time.perf_counter() - started
+
+
+@timed
+def render_projects(project_ids: list = None, output_dir: str = 'output',
+                    max_workers: int = None, writer: str = 'docx',
+                    merge_bars: bool = False, phase_workers: int = 1,
+                    incremental: bool = False) -> dict:
+    """
+    Renderiza varios proyectos en paralelo (un proceso por documento)
+
+    Args:
+        project_ids: Proyectos a renderizar; por defecto, todos los registrados
+        output_dir: Directorio de salida
+        max_workers: Procesos en paralelo (por defecto, los núcleos disponibles)
+        writer: Escritor del Word ('docx' u 'ooxml')
+        merge_bars: Work Plan con las barras combinadas
+        phase_workers: Procesos por documento para las fases (aparte de max_workers)
+        incremental: Reutiliza las secciones sin cambios de la caché de secciones
+
+    Returns:
+        {id: (ruta, segundos)} o {id: excepción} si ese proyecto falló
+    """
+    project_ids = list(project_ids or _registry())
+    for project_id in project_ids:
+        get_project_info(project_id)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {project_id: executor.submit(_render_worker, project_id, output_dir, writer,
+                                                merge_bars, phase_workers, incremental)
+                   for project_id in project_ids}
+        for project_id, future in futures.items():
+            try:
+                results[project_id] = future.result()
+            except Exception as e:
+                results[project_id] = e
+    return results
@@ -0,0 +1,363 @@
+"""
+Registro de plantillas de prompt precompiladas
+
+Cada plantilla separa una parte estática (instrucciones y esquema JSON) de una parte
+variable (contenido del TdR). La parte estática va siempre primero para que la caché
+de prefijo del proveedor, y la caché de respuestas propia, puedan reutilizarla entre TdR.
+"""
+
+import hashlib
+import threading
+from collections import namedtuple
+from string import Template
+
+
+# Longitudes objetivo (en palabras) que se piden al modelo para cada sección
+WORD_TARGETS = {
+    'introduction': (150, 200),
+    'context': (800, 1000),
+    'principle': (80, 100),
+    'phase': (200, 300),
+    'task': (200, 300),
+    'risks': (600, 800),
+    'quality': (400, 600),
+}
+
+# Caracteres máximos del TdR que se envían al modelo
+MAX_TDR_CHARS = 12000
+
+
+class Prompt(namedtuple('Prompt', ['prefix', 'suffix', 'prefix_hash'])):
+    """Prompt separado en prefijo estático y sufijo variable"""
+
+    __slots__ = ()
+
+    @property
+    def text(self) -> str:
+        return self.prefix + self.suffix
+
+
+def prefix_hash(prefix: str) -> str:
+    """Hash estable (entre procesos y ejecuciones) de un prefijo de prompt"""
+    return hashlib.sha256(prefix.encode('utf-8')).hexdigest()[:16]
+
+
+def word_bounds(section: str, scale: float = 1.0) -> tuple:
+    """
+    Retorna el rango de palabras objetivo de una sección como (mínimo, máximo)
+
+    scale < 1 reduce el objetivo (redondeado a decenas) cuando el tiempo es limitado
+    """
+    low, high = WORD_TARGETS[section]
+    if scale != 1.0:
+        low = max(10, int(round(low * scale, -1)))
+        high = max(low + 10, int(round(high * scale, -1)))
+    return low, high
+
+
+def word_range(section: str, scale: float = 1.0) -> str:
+    """Retorna el rango de palabras objetivo de una sección, p. ej. '800-1000'"""
+    low, high = word_bounds(section, scale)
+    return f"{low}-{high}"
+
+
+def _omit_note(omit: tuple) -> str:
+    """Instrucción para dejar vacías las secciones opcionales omitidas"""
+    if not omit:
+        return ''
+    keys = ', '.join(f'"{key}"' for key in omit)
+    return f"Leave {keys} as empty strings: they are not needed for this draft.\n\n"
+
+
+class PromptTemplate:
+    """
+    Plantilla de prompt con parte estática cacheada y parte variable
+
+    Los parámetros de la parte estática deben ser hashables (str, int, tuple);
+    cada combinación se renderiza una sola vez y se reutiliza con su hash.
+    """
+
+    def __init__(self, name: str, static: str, variable: str, prepare=None):
+        self.name = name
+        self._static = Template(static)
+        self._variable = Template(variable)
+        self._prepare = prepare
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def prefix(self, **params) -> tuple:
+        """Retorna (prefijo, hash) para los parámetros estáticos dados"""
+        key = tuple(sorted(params.items()))
+        cached = self._cache.get(key)
+        if cached is None:
+            values = self._prepare(**params) if self._prepare else params
+            text = self._static.substitute(values)
+            cached = (text, prefix_hash(text))
+            with self._lock:
+                self._cache[key] = cached
+        return cached
+
+    def suffix(self, variables: dict) -> str:
+        """Renderiza la parte variable"""
+        return self._variable.substitute(variables)
+
+    def build(self, variables: dict, **params) -> Prompt:
+        """Construye el prompt completo: prefijo estático + parte variable"""
+        text, digest = self.prefix(**params)
+        return Prompt(text, self.suffix(variables), digest)
+
+
+def _prepare_methodology(language: str, phases: tuple, word_scale: float = 1.0,
+                         omit: tuple = (), tasks_per_phase: str = '3-5') -> dict:
+    """Calcula los valores derivados de la plantilla de metodología"""
+    return {
+        'language': language,
+        'first_phase': phases[0],
+        'num_phases': len(phases),
+        'phases_list': '\n'.join(f"   - {phase}" for phase in phases),
+        'tasks_per_phase': tasks_per_phase,
+        'omit_note': _omit_note(omit),
+        **{f'w_{section}': word_range(section, word_scale) for section in WORD_TARGETS},
+    }
+
+
+_METHODOLOGY_STATIC = """You are a senior development consultant. Based on the Terms of Reference given at the end of this prompt, generate a methodology proposal in JSON format.
+
+INSTRUCTIONS:
+1. Read the ToR carefully and extract: objectives, deliverables, timeline, stakeholders, and location
+2. Generate content in $language
+3. Adapt ALL content specifically to this ToR
+4. Return ONLY valid JSON (no markdown, no explanation)
+
+REQUIRED JSON STRUCTURE:
+
+{
+    "introduction": "$w_introduction word introduction explaining your approach to this specific project",
+
+    "context": "$w_context word analysis including: project background, geographic context, institutional framework, stakeholders, problem statement, and objectives from the ToR",
+
+    "principles": [
+        {"name": "Principle 1 name", "description": "$w_principle word description relevant to this project"},
+        {"name": "Principle 2 name", "description": "$w_principle word description"},
+        {"name": "Principle 3 name", "description": "$w_principle word description"},
+        {"name": "Principle 4 name", "description": "$w_principle word description"},
+        {"name": "Principle 5 name", "description": "$w_principle word description"},
+        {"name": "Principle 6 name", "description": "$w_principle word description"}
+    ],
+
+    "phases": [
+        {
+            "title": "$first_phase",
+            "description": "$w_phase word phase description",
+            "start_week": 1,
+            "end_week": 4,
+            "tasks": [
+                {
+                    "code": "1A",
+                    "title": "Task title from ToR",
+                    "description": "$w_task word task description with methodology and tools",
+                    "items": ["Activity 1", "Activity 2", "Activity 3", "Activity 4", "Activity 5"],
+                    "start_week": 1,
+                    "end_week": 2,
+                    "deliverable_week": 2
+                },
+                {
+                    "code": "1B",
+                    "title": "Second task title",
+                    "description": "$w_task word description",
+                    "items": ["Activity 1", "Activity 2", "Activity 3", "Activity 4"],
+                    "start_week": 2,
+                    "end_week": 4
+                }
+            ],
+            "deliverables": [{"code": "D1", "name": "Deliverable name from ToR"}]
+        }
+    ],
+
+    "risks": "$w_risks word risk management section covering: risk categories, mitigation measures, and contingency plans",
+
+    "quality": "$w_quality word quality assurance section with KPIs, monitoring mechanisms, and reporting protocols"
+}
+
+PHASES TO INCLUDE (generate ALL $num_phases phases with $tasks_per_phase tasks each):
+$phases_list
+
+Extract deliverables and milestones from the ToR and assign them to the appropriate phases.
+
+$omit_note"""
+
+_METHODOLOGY_VARIABLE = """ToR CONTENT:
+$tdr_content
+
+RETURN ONLY THE JSON OBJECT, NO OTHER TEXT."""
+
+
+_OUTLINE_STATIC = """You are a senior development consultant. Based on the Terms of Reference given at the end of this prompt, generate the STRUCTURAL OUTLINE of a methodology proposal in JSON format.
+
+INSTRUCTIONS:
+1. Read the ToR carefully and extract: deliverables, timeline and milestones
+2. Generate names and titles in $language
+3. Do NOT write descriptions or long texts: only names, titles, codes, short activity items and weeks
+4. Return ONLY valid JSON (no markdown, no explanation)
+
+REQUIRED JSON STRUCTURE:
+
+{
+    "principles": [
+        {"name": "Principle 1 name"},
+        {"name": "Principle 2 name"},
+        {"name": "Principle 3 name"},
+        {"name": "Principle 4 name"},
+        {"name": "Principle 5 name"},
+        {"name": "Principle 6 name"}
+    ],
+
+    "phases": [
+        {
+            "title": "$first_phase",
+            "start_week": 1,
+            "end_week": 4,
+            "tasks": [
+                {
+                    "code": "1A",
+                    "title": "Task title from ToR",
+                    "items": ["Activity 1", "Activity 2", "Activity 3", "Activity 4", "Activity 5"],
+                    "start_week": 1,
+                    "end_week": 2,
+                    "deliverable_week": 2,
+                    "deliverable_code": "D1"
+                }
+            ],
+            "deliverables": [{"code": "D1", "name": "Deliverable name from ToR"}]
+        }
+    ]
+}
+
+PHASES TO INCLUDE (generate ALL $num_phases phases with $tasks_per_phase tasks each):
+$phases_list
+
+"""
+
+_PROSE_STATIC = """You are a senior development consultant writing the long-form sections of a methodology proposal. The ToR and the approved structural outline of the methodology are given below.
+
+INSTRUCTIONS:
+1. Write in $language
+2. Adapt ALL content specifically to the ToR and stay consistent with the outline (phase titles, task codes, weeks and deliverables)
+3. Respect the word count requested for each section
+4. Return ONLY a valid JSON object whose keys are exactly the requested JSON KEYS and whose values are the texts (no markdown fences, no explanation)
+
+"""
+
+_PROSE_SHARED = """ToR CONTENT:
+$tdr_content
+
+METHODOLOGY OUTLINE:
+$outline
+
+"""
+
+_PROSE_VARIABLE = """SECTIONS TO WRITE:
+$sections
+
+JSON KEYS: $keys
+
+RETURN ONLY THE JSON OBJECT, NO OTHER TEXT."""
+
+
+_TRANSLATION_STATIC = """You are a professional translator specialised in international development consulting proposals. Translate the VALUES of the JSON object given at the end of this prompt from $source into $target.
+
+RULES:
+1. Keep every key exactly as given; translate only the values
+2. Do not translate or alter codes (1A, 2B, D1, L3, E1...), numbers, weeks, acronyms or proper names
+3. Preserve markdown markers exactly: **bold**, *italic*, list prefixes ("- ", "1.") and line breaks
+4. Keep the professional register and terminology of the source text
+5. Return ONLY the translated JSON object (no markdown fences, no explanation)
+
+"""
+
+_TRANSLATION_VARIABLE = """TRANSLATE JSON:
+$payload
+
+RETURN ONLY THE JSON OBJECT, NO OTHER TEXT."""
+
+
+PROMPT_TEMPLATES = {
+    'methodology': PromptTemplate('methodology', _METHODOLOGY_STATIC, _METHODOLOGY_VARIABLE,
+                                  prepare=_prepare_methodology),
+    'outline': PromptTemplate('outline', _OUTLINE_STATIC, _METHODOLOGY_VARIABLE,
+                              prepare=_prepare_methodology),
+    'prose': PromptTemplate('prose', _PROSE_STATIC, _PROSE_VARIABLE),
+    'translation': PromptTemplate('translation', _TRANSLATION_STATIC, _TRANSLATION_VARIABLE),
+}
+
+_PROSE_SHARED_TEMPLATE = Template(_PROSE_SHARED)
+
+
+def get_template(name: str) -> PromptTemplate:
+    """Retorna una plantilla del registro por nombre"""
+    if name not in PROMPT_TEMPLATES:
+        raise ValueError(f"Plantilla de prompt no encontrada: {name}")
+    return PROMPT_TEMPLATES[name]
+
+
+def build_methodology_prompt(tdr_content: str, phases: list, language: str,
+                             word_scale: float = 1.0, omit: tuple = (),
+                             tasks_per_phase: str = '3-5') -> Prompt:
+    """
+    Construye el prompt de metodología completa
+
+    Args:
+        tdr_content: Contenido del TdR (se trunca a MAX_TDR_CHARS)
+        phases: Títulos de las fases de la plantilla de metodología
+        language: Idioma de generación (prompt_language)
+        word_scale: Factor de reducción de las longitudes objetivo
+        omit: Secciones opcionales que se piden vacías
+        tasks_per_phase: Rango de tareas por fase
+
+    Returns:
+        Prompt con prefijo estático, sufijo variable y hash del prefijo
+    """
+    return get_template('methodology').build(
+        {'tdr_content': tdr_content[:MAX_TDR_CHARS]},
+        language=language, phases=tuple(phases), word_scale=word_scale,
+        omit=tuple(omit), tasks_per_phase=tasks_per_phase,
+    )
+
+
+def build_outline_prompt(tdr_content: str, phases: list, language: str,
+                         tasks_per_phase: str = '3-5') -> Prompt:
+    """Construye el prompt del esqueleto estructural (fases, tareas, semanas, entregables)"""
+    return get_template('outline').build(
+        {'tdr_content': tdr_content[:MAX_TDR_CHARS]},
+        language=language, phases=tuple(phases), tasks_per_phase=tasks_per_phase,
+    )
+
+
+def build_prose_prompt(tdr_content: str, outline: str, language: str, sections: dict) -> Prompt:
+    """
+    Construye el prompt de redacción de secciones largas
+
+    El TdR y el esqueleto forman parte del prefijo: son comunes a todas las llamadas
+    de redacción de una misma metodología, que se lanzan en paralelo.
+
+    Args:
+        tdr_content: Contenido del TdR
+        outline: Esqueleto de la metodología serializado en JSON
+        language: Idioma de generación
+        sections: Diccionario {clave JSON: instrucción de la sección}
+    """
+    template = get_template('prose')
+    static, _ = template.prefix(language=language)
+    shared = _PROSE_SHARED_TEMPLATE.substitute(tdr_content=tdr_content[:MAX_TDR_CHARS],
+                                               outline=outline)
+    prefix = static + shared
+    suffix = template.suffix({
+        'sections': '\n'.join(f"- {key}: {instruction}" for key, instruction in sections.items()),
+        'keys': ', '.join(sections),
+    })
+    return Prompt(prefix, suffix, prefix_hash(prefix))
+
+
+def build_translation_prompt(payload: str, source: str, target: str) -> Prompt:
+    """Construye el prompt de traducción de un bloque JSON {clave: texto}"""
+    return get_template('translation').build({'payload': payload}, source=source, target=target)
@@ -0,0 +1,215 @@
+"""
+Extracción del JSON de las respuestas del LLM
+
+Una sola política para todas las llamadas (metodología completa, esqueleto, redacción y
+traducción). Las estrategias se prueban siempre en este orden y gana la primera que
+obtiene un objeto:
+
+1. direct: la respuesta entera es JSON
+2. fenced: bloque markdown ```json ... ``` (o sin lenguaje); un bloque sin cerrar, como
+   el de una respuesta truncada, llega hasta el final del texto
+3. embedded: el primer objeto completo dentro de la prosa (se ignora el texto posterior,
+   aunque tenga llaves)
+4. double_encoded: el objeto viene como string JSON ("{\\"a\\": 1}") o con las comillas
+   escapadas ({\\"a\\": 1})
+5. repaired: repair_json desde el inicio del objeto hasta el final del bloque o del texto
+
+Si ninguna funciona, extract_json retorna None y quien llama decide la reserva.
+"""
+
+import re
+import json
+
+from .json_repair import repair_json
+from .profiling import timed
+
+
+STRATEGIES = ('direct', 'fenced', 'embedded', 'double_encoded', 'repaired')
+
+# Bloque markdown: ``` al comienzo de una línea, lenguaje opcional y cierre opcional
+# (respuesta truncada); un ``` dentro de un string del JSON no abre ni cierra bloques
+_FENCE = re.compile(r'^[ \t]*```[ \t]*([A-Za-z]*)[^\n]*\n?(.*?)(?:^[ \t]*```|\Z)',
+                    re.DOTALL | re.MULTILINE)
+# Inicio de un objeto: '{' seguido de una clave (evita llaves sueltas en la prosa)
+_OBJECT_START = re.compile(r'\{\s*(?:"|\}|\Z)')
+# Objeto con las comillas escapadas; los saltos de línea pueden venir escapados (\n)
+_ESCAPED_OBJECT_START = re.compile(r'\{(?:\s|\\[nrt])*\\"')
+_BRACE = re.compile(r'\{')
+_TRAILING_BACKSLASHES = re.compile(r'\\+\Z')
+
+# Niveles de codificación doble que se deshacen como máximo
+MAX_DECODE_DEPTH = 2
+
+_decoder = json.JSONDecoder()
+# Para deshacer la codificación doble: admite saltos de línea literales de la prosa que
+# sigue a un objeto con las comillas escapadas
+_lenient_decoder = json.JSONDecoder(strict=False)
+
+
+def _object_start(text: str) -> int:
+    """Posición del primer objeto probable ({"...), o de la primera llave; -1 si no hay"""
+    match = _OBJECT_START.search(text) or _BRACE.search(text)
+    return match.start() if match else -1
+
+
+def _fenced_body(text: str):
+    """Contenido del primer bloque markdown con JSON (prefiere los marcados json); o None"""
+    fallback = None
+    for match in _FENCE.finditer(text):
+        language, body = match.group(1).lower(), match.group(2)
+        if '{' not in body and not body.lstrip().startswith('"'):
+            continue
+        if language == 'json':
+            return body
+        if fallback is None:
+            fallback = body
+    return fallback
+
+
+def _decode_object(text: str, start: int):
+    """Primer valor JSON completo desde start si es un objeto; o None"""
+    try:
+        value, _ = _decoder.raw_decode(text, start)
+    except (json.JSONDecodeError, RecursionError):
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def _unescape(text: str):
+    """
+    Texto de un objeto codificado como string JSON; o None
+
+    Acepta el string entre comillas (con prosa después) o el cuerpo con las comillas
+    escapadas, aunque esté truncado.
+    """
+    stripped = text.lstrip()
+    if stripped.startswith('"'):
+        try:
+            value, _ = _decoder.raw_decode(stripped)
+            return value if isinstance(value, str) else None
+        except json.JSONDecodeError:
+            stripped = stripped[1:]
+    match = _ESCAPED_OBJECT_START.search(stripped)
+    if not match:
+        return None
+    if match.start() and stripped[match.start() - 1] == '"':
+        # String completo dentro de la prosa
+        try:
+            value, _ = _decoder.raw_decode(stripped, match.start() - 1)
+            if isinstance(value, str):
+                return value
+        except json.JSONDecodeError:
+            pass
+    body = stripped[match.start():].rstrip()
+    if body.endswith('"') and not body.endswith('\\"'):
+        body = body[:-1]
+    # Un escape cortado al final ('\') invalidaría el string
+    trailing = _TRAILING_BACKSLASHES.search(body)
+    if trailing and len(trailing.group()) % 2:
+        body = body[:-1]
+    try:
+        return _lenient_decoder.decode(f'"{body}"')
+    except json.JSONDecodeError:
+        return None
+
+
+def extract_json(text: str, report: dict = None, _depth: int = 0):
+    """
+    Extrae el objeto JSON de una respuesta
+
+    Args:
+        text: Respuesta del LLM
+        report: Si se indica, report['strategy'] recibe la estrategia que funcionó
+            (una de STRATEGIES, o None)
+
+    Returns:
+        Diccionario, o None si la respuesta no contiene un objeto recuperable
+    """
+    report = report if report is not None else {}
+    report['strategy'] = None
+    if not isinstance(text, str):
+        return None
+    text = text.lstrip('\ufeff').strip()
+
+    # 1. Directo
+    if text.startswith('{'):
+        try:
+            data, end = _decoder.raw_decode(text)
+        except (json.JSONDecodeError, RecursionError):
+            data, end = None, 0
+        if isinstance(data, dict) and end == len(text):
+            report['strategy'] = 'direct'
+            return data
+
+    # 2. Bloque markdown
+    body = _fenced_body(text)
+    if body is not None:
+        start = _object_start(body)
+        data = _decode_object(body, start) if start >= 0 else None
+        if data is not None:
+            report['strategy'] = 'fenced'
+            return data
+
+    # 3. Incrustado en la prosa (también el caso directo con texto de más)
+    start = _object_start(text)
+    if start >= 0:
+        data = _decode_object(text, start)
+        if data is not None:
+            report['strategy'] = 'embedded'
+            return data
+
+    # 4. Codificación doble
+    if _depth < MAX_DECODE_DEPTH:
+        decoded = _unescape(body if body is not None else text)
+        if decoded is not None:
+            data = extract_json(decoded, report, _depth + 1)
+            if data is not None:
+                if report['strategy'] != 'repaired':
+                    report['strategy'] = 'double_encoded'
+                return data
+            report['strategy'] = None
+
+    # 5. Reparación desde el inicio del objeto (el bloque si lo hay: sin el cierre ```)
+    source = body if body is not None and _object_start(body) >= 0 else text
+    start = _object_start(source)
+    if start >= 0:
+        try:
+            data = json.loads(repair_json(source[start:]))
+        except (json.JSONDecodeError, RecursionError):
+            data = None
+        if isinstance(data, dict):
+            report['strategy'] = 'repaired'
+            return data
+    return None
+
+
+def fallback_methodology(response_text: str) -> dict:
+    """Estructura básica cuando la respuesta no contiene una metodología"""
+    return {
+        "introduction": "",
+        "context": response_text[:2000] if len(response_text) > 2000 else response_text,
+        "principles": [
+            {"name": "Principle 1", "description": ""},
+            {"name": "Principle 2", "description": ""},
+            {"name": "Principle 3", "description": ""}
+        ],
+        "phases": [],
+        "risks": "",
+        "quality": ""
+    }
+
+
+@timed
+def parse_methodology_response(response_text: str, report: dict = None) -> dict:
+    """
+    Metodología de una respuesta del LLM: el objeto extraído con 'phases' y 'principles'
+    garantizados, o fallback_methodology si no hay objeto
+    """
+    methodology = extract_json(response_text, report)
+    if methodology is None:
+        return fallback_methodology(response_text or '')
+    if not methodology.get('phases'):
+        methodology['phases'] = []
+    if not methodology.get('principles'):
+        methodology['principles'] = []
+    return methodology
@@ -0,0 +1,292 @@
+"""
+Motor de cronograma: modelo de intervalos de fases, tareas, eventos y entregables
+
+El cronograma se construye una sola vez por metodología como una matriz de ocupación
+NumPy (filas × períodos) más las columnas de los marcadores de evento y entregable de
+cada fila. El Gantt de cada fase y el Work Plan se dibujan a partir de ella, y al
+construirla se detectan tareas fuera de la ventana de su fase y entregables solapados.
+
+Filas: cada fase seguida de sus tareas, en el orden de la metodología (el del Work Plan).
+
+Granularidades:
+- 'week': un período por columna en la unidad original (semanas, o meses si la
+  metodología viene en meses)
+- 'month': meses de 4 semanas, la conversión aproximada de siempre
+- 'calendar': meses reales del calendario a partir de una fecha de inicio
+"""
+
+from datetime import date
+
+import numpy as np
+
+from .methodology_model import as_methodology
+from .profiling import timed
+
+
+GRANULARITIES = ('week', 'month', 'calendar')
+
+# Con granularity='auto', los cronogramas de más semanas se muestran en meses
+AUTO_MONTH_THRESHOLD = 24
+
+# Semanas por mes en la conversión aproximada
+WEEKS_PER_MONTH = 4
+
+# Marcador ausente (período sin valor o columna fuera del cronograma)
+NO_PERIOD = np.iinfo(np.int64).min
+NO_COLUMN = -1
+
+
+def _periods(values: list) -> np.ndarray:
+    return np.array([NO_PERIOD if v is None else v for v in values], dtype=np.int64)
+
+
+class Schedule:
+    """
+    Cronograma de una metodología en una granularidad
+
+    Atributos principales:
+        occupancy: matriz bool (filas × períodos), True donde la fila está activa
+        labels: etiqueta de cada columna (número de semana/mes, o MM/AA en 'calendar')
+        deliverable_col, event_col: columna del marcador de cada fila (-1 si no hay)
+        phase_rows: fila de cada fase; task_rows: filas de las tareas de cada fase
+        issues: problemas detectados (tareas fuera de su fase, entregables solapados)
+    """
+
+    def __init__(self, methodology, starts, ends, deliverables, events, row_phase, row_task,
+                 phase_rows, task_rows, granularity='week', start_date=None, issues=None):
+        self.methodology = methodology
+        self.unit = methodology.period
+        self.starts = starts
+        self.ends = ends
+        self.deliverables = deliverables
+        self.events = events
+        self.row_phase = row_phase
+        self.row_task = row_task
+        self.phase_rows = phase_rows
+        self.task_rows = task_rows
+        self.granularity = granularity
+        self.start_date = start_date
+
+        if len(starts):
+            self.first = int(min(starts.min(), ends.min()))
+            self.last = int(max(starts.max(), ends.max()))
+        else:
+            self.first = self.last = 1
+
+        first_column = self.column_ids(np.array([self.first]))[0]
+        last_column = self.column_ids(np.array([self.last]))[0]
+        self.column_base = int(first_column)
+        self.num_periods = int(last_column - first_column + 1)
+        self.labels = self._labels()
+
+        # Ocupación: un intervalo [inicio, fin] por fila, convertido a columnas
+        columns = np.arange(self.num_periods)
+        start_cols = self.column_ids(starts) - self.column_base
+        end_cols = self.column_ids(ends) - self.column_base
+        self.occupancy = ((columns >= start_cols[:, None]) & (columns <= end_cols[:, None]))
+        self.deliverable_col = self.columns_of(deliverables)
+        self.event_col = self.columns_of(events)
+        # Los problemas no dependen de la granularidad: se calculan una vez
+        self.issues = self._find_issues() if issues is None else issues
+
+    @property
+    def span(self) -> int:
+        """Períodos de la unidad original entre el primer inicio y el último fin"""
+        return self.last - self.first + 1
+
+    def column_ids(self, periods: np.ndarray) -> np.ndarray:
+        """Identificador de columna de cada período (sin desplazar al inicio del cronograma)"""
+        if self.granularity == 'week' or (self.granularity == 'month' and self.unit == 'month'):
+            return periods
+        if self.granularity == 'month':
+            return (periods - 1) // WEEKS_PER_MONTH + 1
+        # Meses del calendario: año * 12 + mes de la fecha en que empieza cada período
+        base = self.start_date
+        if self.unit == 'month':
+            return base.year * 12 + base.month - 1 + (periods - 1)
+        days = (periods - 1) * 7 + base.toordinal()
+        ids = [date.fromordinal(int(d)) for d in days]
+        return np.array([d.year * 12 + d.month - 1 for d in ids], dtype=np.int64)
+
+    def columns_of(self, periods: np.ndarray) -> np.ndarray:
+        """Columna de cada período, o -1 si no tiene valor o cae fuera del cronograma"""
+        present = periods != NO_PERIOD
+        columns = np.full(len(periods), NO_COLUMN, dtype=np.int64)
+        if present.any():
+            ids = self.column_ids(periods[present]) - self.column_base
+            ids[(ids < 0) | (ids >= self.num_periods)] = NO_COLUMN
+            columns[present] = ids
+        return columns
+
+    def _labels(self) -> list:
+        ids = range(self.column_base, self.column_base + self.num_periods)
+        if self.granularity == 'calendar':
+            return [f"{i % 12 + 1:02d}/{i // 12 % 100:02d}" for i in ids]
+        return [str(i) for i in ids]
+
+    def window(self, rows: list, first_period: int, count: int) -> tuple:
+        """
+        Recorte de count períodos desde first_period (en la unidad original), completando
+        con columnas vacías fuera del cronograma
+
+        Returns:
+            (ocupación len(rows) × count, columna del entregable, columna del evento),
+            con las columnas relativas al recorte (-1 si el marcador queda fuera)
+        """
+        if self.granularity != 'week':
+            raise ValueError("window() requiere un cronograma con granularity='week'")
+        rows = np.asarray(rows, dtype=np.int64)
+        offset = first_period - self.first
+        occupancy = np.zeros((len(rows), count), dtype=bool)
+        lo, hi = max(offset, 0), min(offset + count, self.num_periods)
+        if hi > lo:
+            occupancy[:, lo - offset:hi - offset] = self.occupancy[rows, lo:hi]
+
+        markers = []
+        for periods in (self.deliverables[rows], self.events[rows]):
+            columns = np.where(periods == NO_PERIOD, NO_COLUMN, periods - first_period)
+            columns[(columns < 0) | (columns >= count)] = NO_COLUMN
+            markers.append(columns)
+        return occupancy, markers[0], markers[1]
+
+    def aggregate(self, granularity: str, start_date: date = None):
+        """El mismo cronograma en otra granularidad (ver build_schedule)"""
+        if granularity == 'auto':
+            granularity = ('month' if self.unit == 'week' and self.span > AUTO_MONTH_THRESHOLD
+                           else 'week')
+        if granularity == 'calendar' and start_date is None:
+            raise ValueError("La granularidad 'calendar' requiere una fecha de inicio")
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Granularidad no soportada: {granularity}. "
+                             f"Disponibles: {', '.join(GRANULARITIES)}, auto")
+        if granularity == self.granularity and start_date == self.start_date:
+            return self
+        return Schedule(self.methodology, self.starts, self.ends, self.deliverables, self.events,
+                        self.row_phase, self.row_task, self.phase_rows, self.task_rows,
+                        granularity, start_date, self.issues)
+
+    def tasks_outside_phase(self) -> list:
+        """[(índice de fase, índice de tarea)] de las tareas que salen de la ventana de su fase"""
+        if not len(self.starts):
+            return []
+        phase_of_row = np.asarray(self.phase_rows, dtype=np.int64)[self.row_phase]
+        outside = (self.row_task >= 0) & ((self.starts < self.starts[phase_of_row])
+                                          | (self.ends > self.ends[phase_of_row]))
+        return [(int(self.row_phase[row]), int(self.row_task[row]))
+                for row in np.flatnonzero(outside)]
+
+    def _find_issues(self) -> list:
+        issues = []
+        if not len(self.starts):
+            return issues
+        phases = self.methodology.phases
+        unit = 'mes' if self.unit == 'month' else 'semana'
+        is_task = self.row_task >= 0
+
+        # Tareas fuera de la ventana de su fase
+        for p_idx, t_idx in self.tasks_outside_phase():
+            phase = phases[p_idx]
+            task = phase.tasks[t_idx]
+            issues.append(f"Tarea {task.code or t_idx + 1} "
+                          f"({task.start_week}-{task.end_week}) fuera de la fase "
+                          f"'{phase.title}' ({phase.start_week}-{phase.end_week})")
+
+        # Entregable y evento en la misma celda: solo uno de los dos se ve
+        same_cell = is_task & (self.deliverables == self.events) & (self.deliverables != NO_PERIOD)
+        for row in np.flatnonzero(same_cell):
+            task = phases[self.row_phase[row]].tasks[self.row_task[row]]
+            issues.append(f"Tarea {task.code}: entregable y evento en la misma {unit} "
+                          f"({self.deliverables[row]}), solo se ve uno de los dos")
+
+        # Un mismo entregable con fechas distintas en varias tareas
+        codes = {}
+        for row in np.flatnonzero(is_task & (self.deliverables != NO_PERIOD)):
+            task = phases[self.row_phase[row]].tasks[self.row_task[row]]
+            if task.deliverable_code:
+                codes.setdefault(task.deliverable_code, {}).setdefault(
+                    int(self.deliverables[row]), []).append(task.code)
+        for code, due in codes.items():
+            if len(due) > 1:
+                detail = ', '.join(f"{unit} {period} ({', '.join(tasks)})"
+                                   for period, tasks in sorted(due.items()))
+                issues.append(f"Entregable {code} con fechas distintas: {detail}")
+        return issues
+
+
+@timed
+def build_schedule(methodology, granularity: str = 'week', start_date: date = None) -> Schedule:
+    """
+    Construye el cronograma de una metodología
+
+    Args:
+        methodology: Diccionario o Methodology
+        granularity: 'week', 'month', 'calendar' o 'auto' (meses si supera
+            AUTO_MONTH_THRESHOLD semanas)
+        start_date: Fecha de inicio del proyecto (obligatoria con 'calendar')
+
+    Returns:
+        Schedule
+    """
+    methodology = as_methodology(methodology)
+    starts, ends, deliverables, events = [], [], [], []
+    row_phase, row_task, phase_rows, task_rows = [], [], [], []
+
+    for p_idx, phase in enumerate(methodology.phases):
+        phase_rows.append(len(starts))
+        starts.append(phase.start_week)
+        ends.append(phase.end_week)
+        deliverables.append(None)
+        events.append(None)
+        row_phase.append(p_idx)
+        row_task.append(-1)
+
+        rows = []
+        for t_idx, task in enumerate(phase.tasks):
+            rows.append(len(starts))
+            starts.append(task.start_week)
+            ends.append(task.end_week)
+            deliverables.append(task.deliverable_week)
+            events.append(task.event_week)
+            row_phase.append(p_idx)
+            row_task.append(t_idx)
+        task_rows.append(rows)
+
+    schedule = Schedule(methodology, _periods(starts), _periods(ends), _periods(deliverables),
+                        _periods(events), np.array(row_phase, dtype=np.int64),
+                        np.array(row_task, dtype=np.int64), phase_rows, task_rows)
+    if granularity != 'week':
+        schedule = schedule.aggregate(granularity, start_date)
+    return schedule
+
+
+def bar_runs(active: np.ndarray, split=()) -> list:
+    """
+    Tramos de columnas activas contiguas de una fila de ocupación (barras del Gantt)
+
+    Args:
+        active: Fila de ocupación (booleana)
+        split: Columnas que forman un tramo propio de una columna (marcadores)
+
+    Returns:
+        [(primera columna, número de columnas)] de izquierda a derecha
+    """
+    edges = np.diff(np.concatenate(([0], np.asarray(active, dtype=np.int8), [0])))
+    runs = []
+    for start, end in zip(np.flatnonzero(edges == 1).tolist(),
+                          np.flatnonzero(edges == -1).tolist()):
+        for col in sorted(col for col in set(split) if start <= col < end):
+            if col > start:
+                runs.append((start, col - start))
+            runs.append((col, 1))
+            start = col + 1
+        if end > start:
+            runs.append((start, end - start))
+    return runs
+
+
+def parse_start_date(value: str) -> date:
+    """Fecha de inicio en formato AAAA-MM-DD; ValueError si no es válida"""
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Fecha de inicio no válida: {value!r} (formato AAAA-MM-DD)")
@@ -0,0 +1,258 @@
+"""
+Análisis del cronograma: ruta crítica, holgura y carga por rol del equipo
+
+Trabaja sobre el cronograma de schedule.py con arreglos NumPy, de modo que planes de
+varios años con cientos de tareas se analizan en milisegundos.
+
+Dependencias entre tareas: si alguna tarea indica depends_on (códigos de tareas previas)
+se usan solo las explícitas; si no, se infieren de las fechas planificadas (una tarea
+depende de todas las que terminan antes de que empiece). La holgura es lo que una tarea
+puede retrasarse sin mover a sus sucesoras ni el fin del proyecto; con dependencias
+explícitas, una holgura negativa indica una tarea que empieza antes de que termine una
+de las que la preceden.
+
+La carga por período cuenta las tareas activas de cada rol (campo roles de las tareas).
+"""
+
+import numpy as np
+
+from .methodology_model import as_methodology
+from .schedule import build_schedule
+
+
+# Tareas simultáneas por rol antes de considerarlo sobrecargado
+DEFAULT_ROLE_CAPACITY = 2
+
+
+def _successors(codes: list, starts: np.ndarray, ends: np.ndarray, depends_on: list,
+                errors: list) -> tuple:
+    """
+    Matriz de sucesión (n × n, [a, b] si b depende de a) y el modo de las dependencias
+    """
+    n = len(codes)
+    if not any(depends_on):
+        return ends[:, None] < starts[None, :], 'inferred'
+
+    index = {}
+    for i, code in enumerate(codes):
+        index.setdefault(code, i)
+    successors = np.zeros((n, n), dtype=bool)
+    for b, previous in enumerate(depends_on):
+        for code in previous:
+            a = index.get(code)
+            if a is None:
+                errors.append(f"Tarea {codes[b]}: depende de una tarea inexistente ({code})")
+            elif a == b:
+                errors.append(f"Tarea {codes[b]}: depende de sí misma")
+            else:
+                successors[a, b] = True
+    return successors, 'explicit'
+
+
+def _topological_order(successors: np.ndarray, codes: list) -> np.ndarray:
+    """Orden topológico (Kahn, con el grado de entrada actualizado por vectores)"""
+    indegree = successors.sum(axis=0)
+    pending = np.ones(len(codes), dtype=bool)
+    order = []
+    ready = list(np.flatnonzero(indegree == 0))
+    while ready:
+        node = ready.pop()
+        pending[node] = False
+        order.append(node)
+        released = successors[node] & pending
+        indegree[released] -= 1
+        ready.extend(np.flatnonzero(released & (indegree == 0)))
+    if len(order) < len(codes):
+        cycle = ', '.join(codes[i] for i in np.flatnonzero(pending))
+        raise ValueError(f"Dependencias circulares entre tareas: {cycle}")
+    return np.array(order, dtype=np.int64)
+
+
+def _critical_chains(successors: np.ndarray, critical: np.ndarray, starts: np.ndarray,
+                     latest_start: np.ndarray, latest_finish: np.ndarray) -> list:
+    """
+    Cadenas de tareas críticas encadenadas sin holgura que cubren todas las críticas
+
+    La primera empieza en la tarea crítica más temprana; las siguientes parten de las
+    críticas que quedaron fuera (cadenas paralelas que también llegan al fin del proyecto,
+    como una tarea que abarca todo el plan).
+    """
+    has_critical_predecessor = (successors & critical[:, None]).any(axis=0)
+    pending = critical.copy()
+    chains = []
+    while pending.any():
+        heads = np.flatnonzero(pending & ~has_critical_predecessor)
+        if not len(heads):
+            heads = np.flatnonzero(pending)
+        node = int(heads[np.argmin(starts[heads])])
+        chain = [node]
+        pending[node] = False
+        while len(chain) <= len(starts):
+            tight = np.flatnonzero(successors[node] & critical
+                                   & (latest_start == latest_finish[node] + 1))
+            if not len(tight):
+                break
+            # Preferir las sucesoras que aún no están en otra cadena
+            fresh = tight[pending[tight]]
+            if len(fresh):
+                tight = fresh
+            node = int(tight[np.argmin(starts[tight])])
+            chain.append(node)
+            pending[node] = False
+        chains.append(chain)
+    return chains
+
+
+def analyze_schedule(methodology, granularity: str = 'auto', start_date=None,
+                     capacity: dict = None, default_capacity: int = DEFAULT_ROLE_CAPACITY) -> dict:
+    """
+    Analiza el cronograma de una metodología
+
+    Args:
+        methodology: Diccionario o Methodology
+        granularity: Granularidad de la carga ('week', 'month', 'calendar' o 'auto');
+            la ruta crítica y la holgura se calculan en la unidad original
+        start_date: Fecha de inicio (obligatoria con 'calendar')
+        capacity: Tareas simultáneas admitidas por rol ({rol: entero})
+        default_capacity: Capacidad de los roles que no están en capacity
+
+    Returns:
+        Diccionario con 'unit', 'start', 'end', 'dependencies' ('inferred' o 'explicit'),
+        'tasks' (código, fase, inicio, fin, holgura, crítica), 'critical_path' (códigos),
+        'critical_chains' (la ruta crítica y las cadenas críticas paralelas, en códigos),
+        'load' ({'granularity', 'periods', 'total', 'roles': {rol: [tareas por período]}}),
+        'overloads' y 'errors'
+    """
+    methodology = as_methodology(methodology)
+    schedule = build_schedule(methodology)
+    errors = []
+
+    rows = np.array([row for task_rows in schedule.task_rows for row in task_rows],
+                    dtype=np.int64)
+    tasks = [task for phase in methodology.phases for task in phase.tasks]
+    codes = [task.code or f'#{i + 1}' for i, task in enumerate(tasks)]
+    starts = schedule.starts[rows]
+    ends = np.maximum(schedule.ends[rows], starts)
+    durations = ends - starts + 1
+
+    analysis = {
+        'unit': schedule.unit,
+        'start': schedule.first,
+        'end': schedule.last,
+        'dependencies': 'inferred',
+        'tasks': [],
+        'critical_path': [],
+        'critical_chains': [],
+        'load': {},
+        'overloads': [],
+        'errors': errors,
+    }
+    if not tasks:
+        return analysis
+
+    # Pasada hacia atrás sobre las fechas planificadas: fin y comienzo más tardíos
+    successors, mode = _successors(codes, starts, ends, [t.depends_on for t in tasks], errors)
+    analysis['dependencies'] = mode
+    project_end = int(ends.max())
+    if mode == 'inferred':
+        # Las sucesoras empiezan siempre después: el orden por inicio es topológico
+        order = np.argsort(starts, kind='stable')
+    else:
+        order = _topological_order(successors, codes)
+    latest_finish = np.full(len(tasks), project_end, dtype=np.int64)
+    latest_start = latest_finish - durations + 1
+    for node in order[::-1]:
+        following = successors[node]
+        if following.any():
+            latest_finish[node] = min(project_end, latest_start[following].min() - 1)
+            latest_start[node] = latest_finish[node] - durations[node] + 1
+    slack = latest_finish - ends
+    critical = slack <= 0
+
+    phase_titles = [phase.title for phase in methodology.phases
+                    for _ in phase.tasks]
+    analysis['tasks'] = [
+        {'code': codes[i], 'phase': phase_titles[i], 'start': int(starts[i]),
+         'end': int(ends[i]), 'slack': int(slack[i]), 'critical': bool(critical[i]),
+         'roles': tasks[i].roles}
+        for i in range(len(tasks))
+    ]
+    chains = _critical_chains(successors, critical, starts, latest_start, latest_finish)
+    analysis['critical_chains'] = [[codes[i] for i in chain] for chain in chains]
+    analysis['critical_path'] = analysis['critical_chains'][0] if chains else []
+
+    # Carga: (roles × tareas) @ (tareas × períodos)
+    plan = schedule.aggregate(granularity, start_date)
+    occupancy = plan.occupancy[rows].astype(np.int64)
+    roles = sorted({role for task in tasks for role in task.roles})
+    membership = np.array([[role in task.roles for task in tasks] for role in roles],
+                          dtype=np.int64).reshape(len(roles), len(tasks))
+    load = membership @ occupancy
+    analysis['load'] = {
+        'granularity': plan.granularity,
+        'periods': plan.labels,
+        'total': occupancy.sum(axis=0).tolist(),
+        'roles': {role: load[r].tolist() for r, role in enumerate(roles)},
+    }
+
+    capacity = capacity or {}
+    limits = np.array([capacity.get(role, default_capacity) for role in roles],
+                      dtype=np.int64)
+    for r, col in np.argwhere(load > limits[:, None]):
+        active = np.flatnonzero(membership[r] & occupancy[:, col])
+        analysis['overloads'].append({
+            'role': roles[r], 'period': plan.labels[col], 'load': int(load[r, col]),
+            'capacity': int(limits[r]), 'tasks': [codes[i] for i in active],
+        })
+    return analysis
+
+
+def format_analysis(analysis: dict) -> str:
+    """Informe de texto del análisis (para el CLI)"""
+    units = {'week': ('semana', 'semanas'), 'month': ('mes', 'meses'),
+             'calendar': ('mes', 'meses')}
+    units_label = units[analysis['unit']][1]
+    dependencies = ('explícitas (depends_on)' if analysis['dependencies'] == 'explicit'
+                    else 'inferidas de las fechas')
+    lines = [f"Cronograma: {units_label} {analysis['start']}-{analysis['end']}, "
+             f"{len(analysis['tasks'])} tareas, dependencias {dependencies}"]
+    for error in analysis['errors']:
+        lines.append(f"  Aviso: {error}")
+    if not analysis['tasks']:
+        return '\n'.join(lines)
+
+    lines.append(f"Ruta crítica: {' → '.join(analysis['critical_path']) or '-'}")
+    parallel = analysis['critical_chains'][1:]
+    if parallel:
+        lines.append(f"Cadenas críticas paralelas (también sin holgura hasta el fin del "
+                     f"proyecto): {'; '.join(' → '.join(chain) for chain in parallel)}")
+    lines.append("")
+    lines.append(f"{'Tarea':<10} {'Inicio':>6} {'Fin':>6} {'Holgura':>8}  Fase")
+    for task in analysis['tasks']:
+        mark = ' *' if task['critical'] else '  '
+        lines.append(f"{task['code']:<10} {task['start']:>6} {task['end']:>6} "
+                     f"{task['slack']:>8}{mark} {task['phase']}")
+    lines.append("(* crítica: sin holgura)")
+
+    load = analysis['load']
+    period_unit = units[load['granularity']][0]
+    lines.append("")
+    if not load['roles']:
+        lines.append("Carga por rol: sin roles asignados (campo 'roles' de las tareas)")
+    else:
+        lines.append(f"Carga por rol (tareas simultáneas por {period_unit}):")
+        width = max(len(role) for role in load['roles'])
+        for role, values in load['roles'].items():
+            peak = max(values)
+            peak_period = load['periods'][values.index(peak)]
+            busy = sum(1 for value in values if value)
+            lines.append(f"  {role:<{width}}  pico {peak} ({period_unit} {peak_period}), "
+                         f"activo {busy} de {len(values)}")
+    if analysis['overloads']:
+        lines.append("")
+        lines.append(f"Sobrecargas: {len(analysis['overloads'])}")
+        for overload in analysis['overloads']:
+            lines.append(f"  {overload['role']}: {period_unit} {overload['period']} - "
+                         f"{overload['load']} tareas (capacidad {overload['capacity']}): "
+                         f"{', '.join(overload['tasks'])}")
+    return '\n'.join(lines)
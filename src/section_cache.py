@@ -0,0 +1,138 @@
+"""
+Caché de secciones para el re-renderizado incremental
+
+Al iterar sobre una propuesta suele cambiar una fase o un texto; con incremental=True
+create_word_document guarda el XML ya dibujado de cada sección (contexto, tabla de
+principios, cada fase, riesgos, calidad y Work Plan) y en el siguiente renderizado solo
+dibuja las secciones cuyo contenido cambió: el resto se copia de la caché.
+
+La clave de cada fragmento es un hash de los datos de la sección, la configuración del
+idioma, el escritor ('docx' u 'ooxml', que guardan el fragmento en formatos distintos),
+STYLE_VERSION, la versión de python-docx y el código de los módulos que dibujan el
+documento, de modo que un cambio en cualquiera de ellos invalida los fragmentos
+afectados sin tener que vaciar la caché a mano. Los fragmentos se guardan como archivos
+en <caché de la plantilla>/sections (ver base_template.cache_dir); si no se puede
+escribir, la sección se dibuja igual y no se guarda. El directorio puede borrarse en
+cualquier momento.
+
+Con deadline, las fases que ya están en la caché se escriben completas aunque el tiempo
+se haya agotado: no cuesta dibujarlas.
+"""
+
+import os
+import json
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+import docx
+
+from .base_template import STYLE_VERSION, cache_dir
+from .deadline import as_deadline
+from .phase_pool import render_phase_fragments
+from .profiling import timed
+
+
+# Módulos cuyo código determina el XML de las secciones
+RENDERER_MODULES = ('document_render.py', 'document_writer.py', 'ooxml_writer.py',
+                    'document_ir.py', 'markup.py', 'schedule.py', 'base_template.py')
+
+
+@lru_cache(maxsize=1)
+def _renderer_digest() -> str:
+    digest = hashlib.sha256()
+    for name in RENDERER_MODULES:
+        digest.update(Path(__file__).with_name(name).read_bytes())
+    return digest.hexdigest()
+
+
+class SectionCache:
+    """Fragmentos XML de las secciones de un documento, por hash de su contenido"""
+
+    def __init__(self, writer: str, lang_config: dict, directory=None):
+        self.directory = Path(directory) if directory else cache_dir() / 'sections'
+        self.hits = 0
+        self.misses = 0
+        # Parte de la clave común a todas las secciones del documento
+        self._context = json.dumps([STYLE_VERSION, docx.__version__, _renderer_digest(),
+                                    writer, lang_config], sort_keys=True, default=str)
+
+    def key(self, kind: str, data) -> str:
+        """Clave de una sección: tipo y datos de entrada (serializables a JSON)"""
+        payload = json.dumps([kind, data], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(f"{self._context}\n{payload}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str):
+        """Fragmento guardado, o None"""
+        try:
+            fragment = (self.directory / f"{key}.xml").read_text(encoding='utf-8')
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return fragment
+
+    def put(self, key: str, fragment: str):
+        path = self.directory / f"{key}.xml"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Escritura atómica: varios procesos de render pueden compartir la caché
+            partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            partial.write_text(fragment, encoding='utf-8')
+            os.replace(partial, path)
+        except OSError:
+            pass
+
+    def fragment(self, kind: str, data, render) -> str:
+        """Fragmento de una sección: de la caché o dibujado con render() y guardado"""
+        key = self.key(kind, data)
+        fragment = self.get(key)
+        if fragment is None:
+            fragment = render()
+            self.put(key, fragment)
+        return fragment
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+def work_plan_data(methodology, start_date=None, merge_bars: bool = False) -> list:
+    """
+    Datos de los que depende el Work Plan: títulos, códigos y períodos de fases y tareas
+    (no las descripciones, para que editar un texto no obligue a dibujarlo de nuevo)
+    """
+    return [methodology.period, start_date, merge_bars,
+            [[phase.title, phase.start_week, phase.end_week,
+              [[task.code, task.title, task.start_week, task.end_week, task.deliverable_week,
+                task.deliverable_code, task.event_week, task.event_code]
+               for task in phase.tasks]]
+             for phase in methodology.phases]]
+
+
+@timed
+def cached_phase_fragments(cache: SectionCache, render_phase, phases: list, lang_config: dict,
+                           period: str, workers: int = 1, deadline=None) -> list:
+    """
+    Fragmentos de las fases: los guardados y los que faltan, dibujados con
+    render_phase(phase, lang_config) (en un pool de procesos con workers > 1)
+
+    Returns:
+        Fragmentos en orden hasta la primera fase que no se pudo dibujar a tiempo
+    """
+    deadline = as_deadline(deadline)
+    keys = [cache.key('phase', phase.to_dict(period)) for phase in phases]
+    fragments = [cache.get(key) for key in keys]
+    missing = [i for i, fragment in enumerate(fragments) if fragment is None]
+    if workers > 1 and len(missing) > 1:
+        rendered = render_phase_fragments(render_phase, [phases[i] for i in missing],
+                                          lang_config, workers, deadline)
+    else:
+        rendered = []
+        for i in missing:
+            if deadline.expired():
+                break
+            rendered.append(render_phase(phases[i], lang_config))
+    for i, fragment in zip(missing, rendered):
+        fragments[i] = fragment
+        cache.put(keys[i], fragment)
+    return fragments[:fragments.index(None)] if None in fragments else fragments
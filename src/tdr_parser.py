@@ -7,13 +7,24 @@ from pathlib import Path
 from PyPDF2 import PdfReader
 from docx import Document
 
+from .deadline import as_deadline
+from .profiling import timed
 
-def parse_tdr(file_path: Path) -> str:
+
+# Fracción máxima del tiempo restante que puede consumir el parseo
+PARSE_BUDGET_SHARE = 0.2
+
+
+@timed
+def parse_tdr(file_path: Path, deadline=None, report: dict = None) -> str:
     """
     Extrae el contenido de un archivo TdR
 
     Args:
         file_path: Ruta al archivo TdR
+        deadline: Deadline (o segundos) de la ejecución; un PDF largo se lee
+            solo hasta agotar su parte del presupuesto
+        report: Diccionario opcional donde se anotan los recortes ('cuts')
 
     Returns:
         Contenido del TdR como texto
@@ -21,7 +32,7 @@ def parse_tdr(file_path: Path) -> str:
     suffix = file_path.suffix.lower()
 
     if suffix == '.pdf':
-        return _parse_pdf(file_path)
+        return _parse_pdf(file_path, as_deadline(deadline), report)
     elif suffix == '.docx':
         return _parse_docx(file_path)
     elif suffix == '.txt':
@@ -30,12 +41,22 @@ def parse_tdr(file_path: Path) -> str:
         raise ValueError(f"Formato no soportado: {suffix}. Use PDF, DOCX o TXT.")
 
 
-def _parse_pdf(file_path: Path) -> str:
-    """Extrae texto de un PDF"""
+@timed
+def _parse_pdf(file_path: Path, deadline=None, report: dict = None) -> str:
+    """Extrae texto de un PDF, deteniéndose si se agota el presupuesto de parseo"""
     reader = PdfReader(str(file_path))
     text_parts = []
+    deadline = as_deadline(deadline)
+    budget = deadline.budget(share=PARSE_BUDGET_SHARE)
+    started = deadline.elapsed()
 
-    for page in reader.pages:
+    num_pages = len(reader.pages)
+    for page_num, page in enumerate(reader.pages):
+        if deadline.elapsed() - started > budget:
+            if report is not None:
+                report.setdefault('cuts', []).append(
+                    f"TdR leído parcialmente: {page_num} de {num_pages} páginas")
+            break
         text = page.extract_text()
         if text:
             text_parts.append(text)
@@ -43,6 +64,7 @@ def _parse_pdf(file_path: Path) -> str:
     return "\n\n".join(text_parts)
 
 
+@timed
 def _parse_docx(file_path: Path) -> str:
     """Extrae texto de un DOCX"""
     doc = Document(str(file_path))
@@ -50,6 +72,7 @@ def _parse_docx(file_path: Path) -> str:
     return "\n\n".join(paragraphs)
 
 
+@timed
 def _parse_txt(file_path: Path) -> str:
     """Lee un archivo de texto"""
     with open(file_path, 'r', encoding='utf-8') as f:
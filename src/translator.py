@@ -0,0 +1,189 @@
+"""
+Traducción de metodologías: generar una vez en un idioma pivote y traducir en paralelo
+
+Solo se traducen los textos (títulos, descripciones, ítems, nombres de entregables).
+La estructura JSON, las semanas y los códigos se copian tal cual del pivote.
+"""
+
+import copy
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .deadline import as_deadline
+from .llm_backends import LLMBackend, get_backend
+from .methodology_generator import RENDER_RESERVE, generate_methodology
+from .profiling import timed
+from .response_parser import extract_json
+from .prompt_templates import build_translation_prompt
+from .translations import get_language_config
+
+
+def _collect_sections(methodology: dict) -> dict:
+    """
+    Agrupa los textos traducibles por sección
+
+    Returns:
+        {sección: {ruta: texto}}, donde la ruta es p. ej. 'phases.0.tasks.1.items.2'
+    """
+    sections = {'overview': {}, 'principles': {}, 'closing': {}}
+
+    for key in ('introduction', 'context'):
+        if methodology.get(key):
+            sections['overview'][key] = methodology[key]
+    for key in ('risks', 'quality'):
+        if methodology.get(key):
+            sections['closing'][key] = methodology[key]
+
+    for i, principle in enumerate(methodology.get('principles', [])):
+        for key in ('name', 'description'):
+            if principle.get(key):
+                sections['principles'][f'principles.{i}.{key}'] = principle[key]
+
+    for p_idx, phase in enumerate(methodology.get('phases', [])):
+        texts = {}
+        base = f'phases.{p_idx}'
+        for key in ('title', 'description'):
+            if phase.get(key):
+                texts[f'{base}.{key}'] = phase[key]
+        for t_idx, task in enumerate(phase.get('tasks', [])):
+            for key in ('title', 'description'):
+                if task.get(key):
+                    texts[f'{base}.tasks.{t_idx}.{key}'] = task[key]
+            for i_idx, item in enumerate(task.get('items', [])):
+                if item:
+                    texts[f'{base}.tasks.{t_idx}.items.{i_idx}'] = item
+        for d_idx, deliverable in enumerate(phase.get('deliverables', [])):
+            if deliverable.get('name'):
+                texts[f'{base}.deliverables.{d_idx}.name'] = deliverable['name']
+        sections[f'phase_{p_idx + 1}'] = texts
+
+    return {name: texts for name, texts in sections.items() if texts}
+
+
+def _set_path(methodology: dict, path: str, value: str):
+    """Asigna un texto en la ruta indicada (las rutas vienen de _collect_sections)"""
+    node = methodology
+    parts = path.split('.')
+    for part in parts[:-1]:
+        node = node[int(part)] if isinstance(node, list) else node[part]
+    last = parts[-1]
+    if isinstance(node, list):
+        node[int(last)] = value
+    else:
+        node[last] = value
+
+
+@timed
+def translate_methodologies(methodology: dict, source_lang: str, target_langs: list,
+                            backend=None, report: dict = None, deadline=None) -> dict:
+    """
+    Traduce una metodología a varios idiomas, sección por sección y en paralelo
+
+    Con un deadline, cada llamada recibe como timeout el tiempo que queda antes de la
+    reserva del renderizado, y sin tiempo no se inicia ninguna traducción más: esas
+    secciones se quedan con el texto del pivote y el idioma se anota en report['cuts'].
+
+    Args:
+        methodology: Metodología en el idioma pivote
+        source_lang: Código del idioma pivote ('es', 'en', 'fr', 'pt')
+        target_langs: Códigos de los idiomas destino
+        backend: Instancia o nombre del backend de LLM
+        report: Diccionario opcional con tiempos, secciones no traducidas y recortes
+        deadline: Deadline (o segundos) de toda la ejecución, o None sin límite
+
+    Returns:
+        {código de idioma: metodología traducida}
+    """
+    if not isinstance(backend, LLMBackend):
+        backend = get_backend(backend)
+    report = report if report is not None else {}
+    cuts = report.setdefault('cuts', [])
+    deadline = as_deadline(deadline)
+
+    source = get_language_config(source_lang)['prompt_language']
+    sections = _collect_sections(methodology)
+
+    def run_job(target, texts):
+        available = deadline.budget(reserve=RENDER_RESERVE)
+        if available <= 0:
+            return None
+        target_name = get_language_config(target)['prompt_language']
+        payload = json.dumps(texts, ensure_ascii=False, indent=1)
+        prompt = build_translation_prompt(payload, source, target_name)
+        # Las traducciones devuelven aproximadamente tantos tokens como el original
+        response = backend.complete(prompt.suffix, prefix=prompt.prefix,
+                                    prefix_hash=prompt.prefix_hash,
+                                    timeout=None if available == float('inf') else available)
+        return extract_json(response) or {}
+
+    started = time.perf_counter()
+    results = {lang: copy.deepcopy(methodology) for lang in target_langs}
+    missing = report.setdefault('untranslated', {})
+    out_of_time = []
+
+    with ThreadPoolExecutor(max_workers=max(1, backend.max_concurrency)) as executor:
+        futures = {(lang, name): executor.submit(run_job, lang, texts)
+                   for lang in target_langs for name, texts in sections.items()}
+        for (lang, name), future in futures.items():
+            try:
+                translated = future.result()
+            except Exception:
+                # Un error tras agotar el tiempo (p. ej. el timeout) cuenta como recorte
+                translated = {} if deadline.budget(reserve=RENDER_RESERVE) > 0 else None
+            if translated is None:
+                # Sin tiempo: la sección conserva el texto del pivote
+                if lang not in out_of_time:
+                    out_of_time.append(lang)
+                translated = {}
+            # Solo se aceptan las rutas pedidas: el resto de la estructura no cambia
+            for path in sections[name]:
+                value = translated.get(path)
+                if isinstance(value, str) and value.strip():
+                    _set_path(results[lang], path, value)
+                else:
+                    missing.setdefault(lang, []).append(path)
+
+    for lang in out_of_time:
+        cuts.append(f"Traducción al {lang} incompleta por falta de tiempo "
+                    f"(se mantiene el texto del pivote)")
+    report['translation_seconds'] = round(time.perf_counter() - started, 3)
+    return results
+
+
+@timed
+def generate_multilingual(tdr_content: str, lang_codes: list, pivot: str = None,
+                          methodology_type: str = None, backend=None, report: dict = None,
+                          **kwargs) -> dict:
+    """
+    Genera la metodología una sola vez en el idioma pivote y la traduce al resto
+
+    Args:
+        tdr_content: Contenido del TdR
+        lang_codes: Idiomas de salida (códigos de translations.LANGUAGES)
+        pivot: Idioma de generación; por defecto el primero de lang_codes
+        methodology_type: Tipo de metodología o None para auto-detectar
+        backend: Instancia o nombre del backend de LLM
+        report: Diccionario opcional con tiempos de generación y traducción
+        **kwargs: Parámetros adicionales de generate_methodology (tiered, deadline...)
+
+    Returns:
+        {código de idioma: metodología}
+    """
+    if not isinstance(backend, LLMBackend):
+        backend = get_backend(backend)
+    report = report if report is not None else {}
+    # El mismo deadline para la generación y las traducciones
+    deadline = as_deadline(kwargs.pop('deadline', None))
+
+    pivot = pivot or lang_codes[0]
+    methodology = generate_methodology(tdr_content, get_language_config(pivot),
+                                       methodology_type, backend=backend, report=report,
+                                       deadline=deadline, **kwargs)
+
+    targets = [lang for lang in lang_codes if lang != pivot]
+    results = {pivot: methodology}
+    if targets:
+        results.update(translate_methodologies(methodology, pivot, targets, backend, report,
+                                               deadline))
+    return {lang: results[lang] for lang in [pivot] + targets}
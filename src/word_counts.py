@@ -0,0 +1,138 @@
+"""
+Análisis de longitudes: palabras por sección frente a los objetivos de los prompts
+
+Recorre la metodología una sola vez, cuenta las palabras de cada texto largo y lo compara
+con prompt_templates.WORD_TARGETS (escalado como en la generación con --deadline).
+Cada registro lleva la llamada y la clave de redacción del modo --tiered (job, key), de
+modo que las secciones fuera de rango pueden regenerarse una a una o servir para ajustar
+los prompts.
+"""
+
+import re
+import time
+
+from .artifacts import find_artifacts, load_artifact
+from .methodology_model import as_methodology
+from .prompt_templates import WORD_TARGETS, word_bounds
+
+
+# Palabras: letras/dígitos, con apóstrofos y guiones internos (l'équipe, long-term)
+_WORD = re.compile(r"\w+(?:['’\-]\w+)*")
+
+UNDER = 'under'
+OK = 'ok'
+OVER = 'over'
+EMPTY = 'empty'
+
+
+def count_words(text: str) -> int:
+    """Palabras de un texto (sin contar marcas markdown ni viñetas)"""
+    return sum(1 for _ in _WORD.finditer(text)) if text else 0
+
+
+def iter_sections(methodology):
+    """
+    Textos largos de la metodología en orden de documento
+
+    Yields:
+        (ruta, tipo de sección en WORD_TARGETS, llamada de redacción, clave, texto)
+    """
+    methodology = as_methodology(methodology)
+    yield 'introduction', 'introduction', 'overview', 'introduction', methodology.introduction
+    yield 'context', 'context', 'overview', 'context', methodology.context
+    for i, principle in enumerate(methodology.principles):
+        yield (f'principles[{i}].description', 'principle', 'principles', f'principle_{i + 1}',
+               principle.description)
+    for p_idx, phase in enumerate(methodology.phases):
+        job = f'phase_{p_idx + 1}'
+        yield f'phases[{p_idx}].description', 'phase', job, 'phase_description', phase.description
+        for t_idx, task in enumerate(phase.tasks):
+            yield (f'phases[{p_idx}].tasks[{t_idx}].description', 'task', job,
+                   f'task_{task.code}', task.description)
+    yield 'risks', 'risks', 'closing', 'risks', methodology.risks
+    yield 'quality', 'quality', 'closing', 'quality', methodology.quality
+
+
+def _status(words: int, low: int, high: int, tolerance: float) -> str:
+    if not words:
+        return EMPTY
+    if words < low * (1 - tolerance):
+        return UNDER
+    if words > high * (1 + tolerance):
+        return OVER
+    return OK
+
+
+def analyze_word_counts(methodology, scale: float = 1.0, tolerance: float = 0.0) -> dict:
+    """
+    Compara las palabras de cada sección con su objetivo
+
+    Args:
+        methodology: Diccionario o Methodology
+        scale: Escala de los objetivos (plan['word_scale'] de la generación)
+        tolerance: Margen relativo antes de marcar una sección (0.1 = ±10 %)
+
+    Returns:
+        {'scale', 'tolerance',
+         'sections': [{'path', 'section', 'job', 'key', 'words', 'target', 'status'}],
+         'summary': {sección: {'count', 'words', 'mean', 'under', 'ok', 'over', 'empty'}}}
+        con status 'under', 'ok', 'over' o 'empty'
+    """
+    bounds = {section: word_bounds(section, scale) for section in WORD_TARGETS}
+    sections = []
+    summary = {}
+    for path, section, job, key, text in iter_sections(methodology):
+        words = count_words(text)
+        low, high = bounds[section]
+        status = _status(words, low, high, tolerance)
+        sections.append({'path': path, 'section': section, 'job': job, 'key': key,
+                         'words': words, 'target': [low, high], 'status': status})
+        stats = summary.setdefault(section, {'count': 0, 'words': 0, UNDER: 0, OK: 0,
+                                             OVER: 0, EMPTY: 0})
+        stats['count'] += 1
+        stats['words'] += words
+        stats[status] += 1
+    for stats in summary.values():
+        stats['mean'] = round(stats['words'] / stats['count'], 1)
+    return {'scale': scale, 'tolerance': tolerance, 'sections': sections, 'summary': summary}
+
+
+def analyze_artifacts(paths: list, scale: float = 1.0, tolerance: float = 0.0) -> dict:
+    """
+    Analiza todos los artefactos de las rutas (archivos o directorios) en una pasada
+
+    Returns:
+        {'results': {ruta: análisis}, 'skipped': {ruta: motivo}, 'seconds': float}
+    """
+    started = time.perf_counter()
+    results, skipped = {}, {}
+    for source in paths:
+        for path in find_artifacts(source):
+            try:
+                methodology = load_artifact(path)['methodology']
+            except (ValueError, OSError) as e:
+                skipped[str(path)] = str(e)
+                continue
+            results[str(path)] = analyze_word_counts(methodology, scale, tolerance)
+    return {'results': results, 'skipped': skipped,
+            'seconds': round(time.perf_counter() - started, 3)}
+
+
+def format_word_report(analysis: dict, show: tuple = (UNDER, OVER)) -> str:
+    """Informe de texto de un análisis: resumen por sección y secciones con estado en show"""
+    lines = [f"{'sección':<13} {'n':>4} {'media':>7} {'objetivo':>10} {'cortas':>7} "
+             f"{'ok':>4} {'largas':>7} {'vacías':>7}"]
+    targets = {record['section']: record['target'] for record in analysis['sections']}
+    for section, stats in analysis['summary'].items():
+        low, high = targets[section]
+        lines.append(f"{section:<13} {stats['count']:>4} {stats['mean']:>7} "
+                     f"{f'{low}-{high}':>10} {stats[UNDER]:>7} {stats[OK]:>4} "
+                     f"{stats[OVER]:>7} {stats[EMPTY]:>7}")
+    flagged = [record for record in analysis['sections'] if record['status'] in show]
+    if flagged:
+        lines.append("")
+        for record in flagged:
+            low, high = record['target']
+            lines.append(f"  {record['status']:<5} {record['words']:>5} / {low}-{high}  "
+                         f"{record['path']}  ({record['job']}.{record['key']})")
+    return '\n'.join(lines)
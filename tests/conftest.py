@@ -0,0 +1,9 @@
+"""
+Configuración de pytest: el paquete src se importa desde la raíz del repositorio
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
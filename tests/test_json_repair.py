@@ -0,0 +1,69 @@
+"""
+Pruebas de json_repair: cada fallo típico del LLM y truncados en todos los puntos
+"""
+
+import json
+
+import pytest
+
+from src.json_repair import repair_json
+
+
+METHODOLOGY = {
+    'introduction': 'Texto con "comillas", llaves {} y corchetes [] dentro.',
+    'principles': [{'name': 'Participación', 'description': 'Línea 1\nLínea 2'}],
+    'phases': [
+        {'title': 'Fase 1: Inicio', 'start_week': 1, 'end_week': 4,
+         'tasks': [{'code': '1.1', 'title': 'Revisión', 'items': ['a', 'b'],
+                    'start_week': 1, 'end_week': 2}],
+         'deliverables': [{'code': 'E1', 'name': 'Informe inicial', 'week': 4}]},
+    ],
+    'risks': 'Sin riesgos',
+}
+
+
+@pytest.mark.parametrize('text, expected', [
+    # Truncados: string abierto y contenedores cerrados en orden de anidamiento
+    ('{"a": "hola", "b": [1, 2', {'a': 'hola', 'b': [1, 2]}),
+    ('{"a": "texto cort', {'a': 'texto cort'}),
+    ('{"a": {"b": [1, {"c": "x"', {'a': {'b': [1, {'c': 'x'}]}}),
+    ('{"a": "corte en escape \\', {'a': 'corte en escape '}),
+    # Claves colgantes
+    ('{"a": 1, "b"', {'a': 1}),
+    ('{"a": 1, "b":', {'a': 1}),
+    # Comas faltantes (entre líneas) y finales
+    ('{"a": "x"\n  "b": "y"}', {'a': 'x', 'b': 'y'}),
+    ('{"a": [1\n 2]}', {'a': [1, 2]}),
+    ('{"a": [1, 2,], "b": 3,}', {'a': [1, 2], 'b': 3}),
+    # Cierre cruzado
+    ('{"a": [1, 2}', {'a': [1, 2]}),
+    # Caracteres de control, comillas internas y escapes inválidos
+    ('{"a": "línea 1\nlínea 2\tfin"}', {'a': 'línea 1\nlínea 2\tfin'}),
+    ('{"a": "dijo "hola" y se fue"}', {'a': 'dijo "hola" y se fue'}),
+    ('{"a": "escape \\q inválido"}', {'a': 'escape \\q inválido'}),
+    # Literales de Python, claves sin comillas y comentarios
+    ('{"a": True, "b": None, "c": False}', {'a': True, 'b': None, 'c': False}),
+    ('{a: 1, b_c: "x"}', {'a': 1, 'b_c': 'x'}),
+    ('{"a": 1 // comentario\n, "b": /* otro */ 2}', {'a': 1, 'b': 2}),
+    # Llaves dentro de strings y texto sobrante
+    ('{"a": "llaves {[ dentro", "b": [', {'a': 'llaves {[ dentro', 'b': []}),
+    ('{"a": 1} texto sobrante {', {'a': 1}),
+])
+def test_repairs(text, expected):
+    assert json.loads(repair_json(text)) == expected
+
+
+def test_valid_json_is_unchanged():
+    text = json.dumps(METHODOLOGY, ensure_ascii=False, indent=2)
+    assert json.loads(repair_json(text)) == METHODOLOGY
+
+
+@pytest.mark.parametrize('indent', [None, 2])
+def test_every_truncation_is_repairable(indent):
+    text = json.dumps(METHODOLOGY, ensure_ascii=False, indent=indent)
+    keys = list(METHODOLOGY)
+    for cut in range(1, len(text)):
+        repaired = json.loads(repair_json(text[:cut]))
+        assert isinstance(repaired, dict)
+        # Solo sobreviven claves del original, en su orden
+        assert list(repaired) == keys[:len(repaired)]
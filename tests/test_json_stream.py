@@ -0,0 +1,135 @@
+"""
+Pruebas del parser incremental: eventos, re-troceado aleatorio y corte por deadline
+"""
+
+import json
+import random
+
+import pytest
+
+from src.deadline import Deadline
+from src.json_stream import MethodologyStreamParser, StreamEvent, assemble, iter_events
+from src.llm_backends import StubBackend
+from src.methodology_generator import _stream_methodology
+from src.prompt_templates import build_methodology_prompt
+from src.response_parser import parse_methodology_response
+
+
+METHODOLOGY = {
+    'introduction': 'Introducción con "comillas", llaves {} y una coma, aquí.',
+    'context': 'Contexto\ncon saltos de línea y escapes \\ y \u00e9',
+    'principles': [
+        {'name': 'Participación', 'description': 'Con [corchetes]'},
+        {'name': 'Calidad', 'description': 'Con {llaves}'},
+    ],
+    'phases': [
+        {'title': 'Fase 1', 'start_week': 1, 'end_week': 4,
+         'tasks': [{'code': '1.1', 'title': 'Tarea', 'items': ['a', 'b,c'],
+                    'start_week': 1, 'end_week': 2}],
+         'deliverables': [{'code': 'E1', 'name': 'Informe', 'week': 4}]},
+        {'title': 'Fase 2', 'start_week': 5, 'end_week': 8, 'tasks': [], 'deliverables': []},
+    ],
+    'risks': 'Riesgos',
+    'quality': 'Calidad',
+}
+
+RESPONSE = 'Aquí está la metodología:\n```json\n' + json.dumps(
+    METHODOLOGY, ensure_ascii=False, indent=2) + '\n```\nQuedo atento.'
+
+
+def _chunks(text: str, rng: random.Random) -> list:
+    """Trocea el texto en fragmentos de 1 a 40 caracteres"""
+    chunks, i = [], 0
+    while i < len(text):
+        size = rng.randint(1, 40)
+        chunks.append(text[i:i + size])
+        i += size
+    return chunks
+
+
+def test_events_in_order():
+    events = list(iter_events([RESPONSE]))
+    assert [(e.kind, e.index) for e in events] == [
+        ('introduction', None), ('context', None),
+        ('principle', 0), ('principle', 1), ('principles', None),
+        ('phase', 0), ('phase', 1), ('phases', None),
+        ('risks', None), ('quality', None), ('end', None),
+    ]
+    assert all(e.complete for e in events)
+    assert events[-1] == StreamEvent('end', None, True, True)
+    assert assemble(events) == METHODOLOGY
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_rechunking_gives_same_result(seed):
+    events = list(iter_events(_chunks(RESPONSE, random.Random(seed))))
+    assert events == list(iter_events([RESPONSE]))
+    assert assemble(events) == METHODOLOGY
+
+
+def test_single_character_chunks():
+    assert assemble(iter_events(list(RESPONSE))) == METHODOLOGY
+
+
+def test_truncated_response():
+    text = json.dumps(METHODOLOGY, ensure_ascii=False)
+    cut = text.index('"title": "Fase 2"') + len('"title": "Fa')
+    events = list(iter_events([text[:cut]]))
+    assert [(e.kind, e.index, e.complete) for e in events[-3:]] == [
+        ('phase', 1, False), ('phases', None, False), ('end', None, False)]
+    assert events[-1].value is False
+    assert assemble(events)['phases'][1] == {'title': 'Fa'}
+    assert assemble(events)['phases'][0] == METHODOLOGY['phases'][0]
+
+
+def test_close_after_end_emits_nothing():
+    parser = MethodologyStreamParser()
+    parser.feed(RESPONSE)
+    assert parser.close() == []
+
+
+class _DribbleBackend(StubBackend):
+    """Stub que entrega la respuesta de a fragmentos y cuenta los que se leyeron"""
+
+    def __init__(self, response: str):
+        super().__init__(response=response)
+        self.read = 0
+
+    def _stream(self, prefix, prompt, max_tokens, timeout):
+        for chunk in super()._stream(prefix, prompt, max_tokens, timeout):
+            self.read += 1
+            yield chunk
+
+
+def test_stream_stops_at_deadline():
+    backend = _DribbleBackend(RESPONSE)
+    # Un TdR distinto en cada prueba: la respuesta no sale de la caché del backend
+    prompt = build_methodology_prompt('TdR con deadline', ['Fase 1'], 'Spanish')
+    cuts = []
+    events = []
+    methodology = _stream_methodology(backend, prompt, 1000, None, events.append,
+                                      Deadline(0), cuts)
+    # Se lee un solo fragmento, se cierra el stream y se repara lo recibido
+    assert backend.read == 1
+    assert len(cuts) == 1
+    assert methodology['phases'] == []
+
+
+def test_stream_without_deadline_reads_everything():
+    backend = _DribbleBackend(RESPONSE)
+    prompt = build_methodology_prompt('TdR sin deadline', ['Fase 1'], 'Spanish')
+    cuts = []
+    methodology = _stream_methodology(backend, prompt, 1000, None, lambda event: None,
+                                      None, cuts)
+    assert methodology == METHODOLOGY
+    assert cuts == []
+
+
+def test_stream_truncated_response_is_repaired():
+    truncated = RESPONSE[:len(RESPONSE) // 2]
+    backend = _DribbleBackend(truncated)
+    prompt = build_methodology_prompt('TdR truncado', ['Fase 1'], 'Spanish')
+    events = []
+    methodology = _stream_methodology(backend, prompt, 1000, None, events.append)
+    assert events[-1] == StreamEvent('end', None, False, False)
+    assert methodology == parse_methodology_response(truncated)
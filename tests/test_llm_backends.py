@@ -0,0 +1,36 @@
+"""
+Pruebas del límite de concurrencia compartido por proveedor
+"""
+
+import pytest
+
+import src.llm_backends as llm_backends
+from src.llm_backends import StubBackend
+
+
+@pytest.fixture(autouse=True)
+def fresh_semaphores(monkeypatch):
+    monkeypatch.setattr(llm_backends, '_SEMAPHORES', {})
+
+
+def test_one_semaphore_per_provider():
+    first = StubBackend(max_concurrency=1)
+    # Otro modelo u otro límite pedido: mismo proveedor, mismo semáforo y mismo límite
+    second = StubBackend(model='otro', max_concurrency=4)
+    assert second._semaphore is first._semaphore
+    assert first.max_concurrency == second.max_concurrency == 1
+    assert first.with_model('rápido')._semaphore is first._semaphore
+    assert list(llm_backends._SEMAPHORES) == ['stub']
+
+
+def test_limit_is_enforced_across_instances():
+    first = StubBackend(max_concurrency=1)
+    second = StubBackend(max_concurrency=3)
+    assert first._semaphore.acquire(blocking=False)
+    assert not second._semaphore.acquire(blocking=False)
+    first._semaphore.release()
+
+
+def test_limit_from_environment(monkeypatch):
+    monkeypatch.setenv('STUB_MAX_CONCURRENCY', '5')
+    assert StubBackend().max_concurrency == 5
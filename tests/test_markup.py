@@ -0,0 +1,77 @@
+"""
+Pruebas del marcado de los textos: runs en línea, listas y encabezados
+"""
+
+import pytest
+
+from src.markup import MAX_LIST_LEVEL, inline_runs, parse_content, plain_text
+
+
+def _plain(text):
+    return [(text, False, False)]
+
+
+@pytest.mark.parametrize('text, runs', [
+    ('sin marcado', _plain('sin marcado')),
+    ('', []),
+    ('un **negrita** aquí', [('un ', False, False), ('negrita', True, False),
+                             (' aquí', False, False)]),
+    ('*itálica* al inicio', [('itálica', False, True), (' al inicio', False, False)]),
+    ('***ambas***', [('ambas', True, True)]),
+    ('2*3*4', _plain('2*3*4')),
+    ('a * b * c', _plain('a * b * c')),
+    ('x*y*', _plain('x*y*')),
+    ('texto **sin cerrar', _plain('texto **sin cerrar')),
+    ('**abierta y *itálica*', [('**abierta y ', False, False), ('itálica', False, True)]),
+])
+def test_inline_runs(text, runs):
+    assert inline_runs(text) == runs
+
+
+def test_plain_text():
+    assert plain_text('**A** y *b* con ***c***, 2*3*4') == 'A y b con c, 2*3*4'
+
+
+@pytest.mark.parametrize('content, items', [
+    ('1. Primero', [('numbered', 0, _plain('Primero'))]),
+    ('10. Décimo', [('numbered', 0, _plain('Décimo'))]),
+    ('1) Con paréntesis', [('numbered', 0, _plain('Con paréntesis'))]),
+    ('3.5 millones de usuarios', [('paragraph', 0, _plain('3.5 millones de usuarios'))]),
+    ('1000. no es un ítem', [('paragraph', 0, _plain('1000. no es un ítem'))]),
+    ('- guion\n• punto\n* asterisco', [('bullet', 0, _plain('guion')),
+                                       ('bullet', 0, _plain('punto')),
+                                       ('bullet', 0, _plain('asterisco'))]),
+    ('*itálica* no es viñeta', [('paragraph', 0, [('itálica', False, True),
+                                                  (' no es viñeta', False, False)])]),
+    ('# Título', [('heading', 0, 'Título')]),
+    ('### **Título** con marcado', [('heading', 0, 'Título con marcado')]),
+    ('#sin espacio', [('paragraph', 0, _plain('#sin espacio'))]),
+    ('**Encabezado**', [('heading', 0, 'Encabezado')]),
+    ('**Negrita** y más texto', [('paragraph', 0, [('Negrita', True, False),
+                                                   (' y más texto', False, False)])]),
+    ('**A** y **B**', [('paragraph', 0, [('A', True, False), (' y ', False, False),
+                                         ('B', True, False)])]),
+    ('', []),
+    ('\n\n  \n', []),
+])
+def test_parse_content(content, items):
+    assert parse_content(content) == items
+
+
+def test_nested_lists_clamped():
+    content = '\n'.join(f"{' ' * (2 * depth)}- nivel {depth}" for depth in range(5))
+    content += '\n  - de vuelta\n- raíz'
+    levels = [level for _, level, _ in parse_content(content)]
+    assert levels == [0, 1, 2, MAX_LIST_LEVEL, MAX_LIST_LEVEL, 1, 0]
+
+
+def test_tabs_and_mixed_lists():
+    items = parse_content('1. Uno\n\t- detalle\n2. Dos')
+    assert [(kind, level) for kind, level, _ in items] == [
+        ('numbered', 0), ('bullet', 1), ('numbered', 0)]
+
+
+def test_paragraph_resets_lists():
+    items = parse_content('  - sangrada\ntexto\n    - otra\n\n**Sección**\n- ítem')
+    assert [(kind, level) for kind, level, _ in items] == [
+        ('bullet', 0), ('paragraph', 0), ('bullet', 0), ('heading', 0), ('bullet', 0)]
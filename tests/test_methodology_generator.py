@@ -0,0 +1,72 @@
+"""
+Pruebas del presupuesto de tiempo de la generación en dos niveles (--tiered)
+"""
+
+import time
+
+import pytest
+
+import src.llm_backends as llm_backends
+import src.methodology_generator as generator
+from src.deadline import Deadline
+from src.llm_backends import StubBackend
+from src.methodology_generator import generate_methodology
+from src.translations import get_language_config
+
+
+TDR = 'Términos de referencia de prueba para la generación en dos niveles'
+
+
+class _SlowProseBackend(StubBackend):
+    """Stub cuyo esqueleto es inmediato y cada llamada de redacción tarda delay segundos"""
+
+    def __init__(self, delay: float, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.prose_calls = 0
+
+    def _complete(self, prefix, prompt, max_tokens, timeout):
+        if 'JSON KEYS:' in prompt:
+            self.prose_calls += 1
+            time.sleep(self.delay)
+        return super()._complete(prefix, prompt, max_tokens, timeout)
+
+
+@pytest.fixture
+def tight_levels(monkeypatch):
+    # Un nivel de degradación de menos de un segundo y sin reserva para el renderizado
+    monkeypatch.setattr(generator, 'DEGRADATION_LEVELS',
+                        generator.DEGRADATION_LEVELS + [(0.1, 1.0, (), '3-5')])
+    monkeypatch.setattr(generator, 'RENDER_RESERVE', 0)
+    # Semáforos nuevos: el límite de cada prueba no depende de los stubs ya creados
+    monkeypatch.setattr(llm_backends, '_SEMAPHORES', {})
+
+
+def test_tiered_respects_deadline(tight_levels):
+    # Un solo cupo: las llamadas se encolan y las últimas empiezan sin tiempo
+    backend = _SlowProseBackend(0.3, max_concurrency=1, model='stub-strong-deadline')
+    report = {}
+    started = time.perf_counter()
+    methodology = generate_methodology(TDR, get_language_config('es'), 'general',
+                                       backend=backend, tiered=True, report=report,
+                                       deadline=Deadline(0.8))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 1.2
+    assert methodology['phases']
+    cut = [c for c in report['cuts'] if c.startswith('Secciones sin redactar por falta de tiempo')]
+    assert len(cut) == 1
+    # Las secciones recortadas no se piden al backend (salvo la que estaba en curso)
+    skipped = int(cut[0].split('(')[1].split(')')[0])
+    finished = len(report['tiers']['prose']['jobs'])
+    assert skipped >= 2
+    assert backend.prose_calls <= finished + 1
+
+
+def test_tiered_without_deadline_writes_everything(tight_levels):
+    backend = _SlowProseBackend(0.01, max_concurrency=1, model='stub-strong-free')
+    report = {}
+    generate_methodology(TDR, get_language_config('es'), 'general', backend=backend,
+                         tiered=True, report=report)
+    assert not [c for c in report['cuts'] if 'falta de tiempo' in c]
+    assert backend.prose_calls == len(report['tiers']['prose']['jobs'])
@@ -0,0 +1,116 @@
+"""
+Pruebas del linter de metodologías: cada regla y la revisión de un directorio
+"""
+
+import copy
+import json
+
+import pytest
+
+from src.artifacts import save_artifact
+from src.methodology_lint import (
+    ERROR, WARNING, RULES, count_findings, lint_artifacts, lint_methodology,
+)
+
+
+METHODOLOGY = {
+    'introduction': 'i', 'context': 'c', 'risks': 'r', 'quality': 'q',
+    'principles': [{'name': 'P', 'description': 'd'}],
+    'phases': [
+        {'title': 'F1', 'description': 'd', 'start_week': 1, 'end_week': 4,
+         'tasks': [
+             {'code': '1.1', 'title': 'A', 'description': 'd', 'start_week': 1, 'end_week': 2,
+              'deliverable_week': 2, 'deliverable_code': 'E1'},
+             {'code': '1.2', 'title': 'B', 'description': 'd', 'start_week': 3, 'end_week': 4},
+         ],
+         'deliverables': [{'code': 'E1', 'name': 'Informe', 'week': 2}]},
+        {'title': 'F2', 'description': 'd', 'start_week': 5, 'end_week': 8,
+         'tasks': [
+             {'code': '2.1', 'title': 'C', 'description': 'd', 'start_week': 5, 'end_week': 8,
+              'deliverable_week': 8, 'deliverable_code': 'E2'},
+         ],
+         'deliverables': [{'code': 'E2', 'name': 'Informe final', 'week': 8}]},
+    ],
+}
+
+
+def _variant(change) -> dict:
+    methodology = copy.deepcopy(METHODOLOGY)
+    change(methodology)
+    return methodology
+
+
+def _rules(findings: list) -> list:
+    return [(finding['rule'], finding['path']) for finding in findings]
+
+
+def test_consistent_methodology():
+    assert lint_methodology(METHODOLOGY) == []
+
+
+def _task(methodology, p_idx, t_idx) -> dict:
+    return methodology['phases'][p_idx]['tasks'][t_idx]
+
+
+@pytest.mark.parametrize('change, expected', [
+    (lambda m: _task(m, 1, 0).update(code='1.1'),
+     [('duplicate_task_code', 'phases[1].tasks[0]')]),
+    (lambda m: m['phases'][1]['deliverables'][0].update(code='E1'),
+     [('duplicate_deliverable_code', 'phases[1].deliverables[0]'),
+      ('unknown_deliverable', 'phases[1].tasks[0]')]),
+    (lambda m: _task(m, 0, 1).update(deliverable_code='E9'),
+     [('unknown_deliverable', 'phases[0].tasks[1]')]),
+    (lambda m: _task(m, 0, 1).update(end_week=6),
+     [('task_outside_phase', 'phases[0].tasks[1]')]),
+    (lambda m: _task(m, 1, 0).update(start_week=3),
+     [('task_outside_phase', 'phases[1].tasks[0]')]),
+    (lambda m: _task(m, 0, 0).update(deliverable_week=3),
+     [('marker_outside_task', 'phases[0].tasks[0]')]),
+    (lambda m: _task(m, 0, 1).update(event_week=1),
+     [('marker_outside_task', 'phases[0].tasks[1]')]),
+    (lambda m: _task(m, 1, 0).pop('deliverable_code'),
+     [('unreferenced_deliverable', 'phases[1].deliverables[0]')]),
+])
+def test_rules(change, expected):
+    assert _rules(lint_methodology(_variant(change))) == expected
+
+
+def test_same_deliverable_code_and_name_is_allowed():
+    methodology = _variant(lambda m: m['phases'][1]['deliverables'].append(
+        {'code': 'E1', 'name': 'Informe ', 'week': 8}))
+    assert lint_methodology(methodology) == []
+
+
+def test_schema_errors():
+    findings = lint_methodology(_variant(lambda m: _task(m, 0, 1).pop('title')))
+    assert _rules(findings) == [('schema', 'phases[0].tasks[1].title')]
+    assert all(finding['severity'] == ERROR for finding in findings)
+
+
+def test_task_outside_phase_matches_schedule_issues():
+    from src.schedule import build_schedule
+
+    methodology = _variant(lambda m: _task(m, 0, 1).update(end_week=6))
+    assert len(build_schedule(methodology).issues) == 1
+    assert count_findings(lint_methodology(methodology)) == (1, 0)
+
+
+def test_severities():
+    assert set(RULES.values()) == {ERROR, WARNING}
+    findings = lint_methodology(_variant(lambda m: _task(m, 0, 1).update(event_week=1)))
+    assert count_findings(findings) == (0, 1)
+
+
+def test_lint_artifacts(tmp_path):
+    save_artifact(METHODOLOGY, tmp_path / 'ok.json', 'es')
+    save_artifact(_variant(lambda m: _task(m, 0, 1).update(end_week=6)),
+                  tmp_path / 'outside.jsonz', 'es')
+    (tmp_path / 'registry.json').write_text(json.dumps({'ok': {'file': 'ok.json'}}))
+    (tmp_path / 'notes.json').write_text(json.dumps(['no', 'es', 'una', 'metodología']))
+
+    batch = lint_artifacts([tmp_path])
+    assert {path.split('/')[-1]: count_findings(findings)
+            for path, findings in batch['results'].items()} == {
+        'ok.json': (0, 0), 'outside.jsonz': (1, 0)}
+    # El registro no se revisa; los demás .json que no son metodologías se informan
+    assert [path.split('/')[-1] for path in batch['skipped']] == ['notes.json']
@@ -0,0 +1,102 @@
+"""
+Pruebas de response_parser: formas típicas de respuesta y orden fijo de las estrategias
+"""
+
+import json
+
+import pytest
+
+from src.response_parser import (
+    STRATEGIES, extract_json, fallback_methodology, parse_methodology_response,
+)
+
+
+METHODOLOGY = {
+    'introduction': 'Intro con {llaves}',
+    'principles': [{'name': 'P', 'description': 'd'}],
+    'phases': [{'title': 'Fase 1', 'tasks': []}],
+    'risks': 'r',
+}
+
+TEXT = json.dumps(METHODOLOGY, ensure_ascii=False, indent=2)
+COMPACT = json.dumps(METHODOLOGY, ensure_ascii=False)
+
+
+# Mismas formas que el corpus fijo de benchmarks/bench_response_parser.py
+@pytest.mark.parametrize('text, strategy', [
+    (TEXT, 'direct'),
+    ('﻿' + TEXT, 'direct'),
+    (f'```json\n{TEXT}\n```', 'fenced'),
+    (f'```\n{TEXT}\n```', 'fenced'),
+    (f'Respuesta:\n```json\n{TEXT}\n```\nFin.', 'fenced'),
+    (f'```json\n{TEXT}\n```'.replace('\n', '\r\n'), 'fenced'),
+    (f'Aquí está:\n{TEXT}\nEspero que sirva {{nota}}.', 'embedded'),
+    (json.dumps(COMPACT, ensure_ascii=False), 'double_encoded'),
+    (json.dumps(TEXT, ensure_ascii=False)[1:-1], 'double_encoded'),
+    ('```json\n' + json.dumps(TEXT, ensure_ascii=False) + '\n```', 'double_encoded'),
+    (TEXT.replace('"r"\n', '"r",\n'), 'repaired'),
+])
+def test_complete_responses(text, strategy):
+    report = {}
+    assert extract_json(text, report) == METHODOLOGY
+    assert report['strategy'] == strategy
+
+
+def test_truncated_response():
+    report = {}
+    text = TEXT[:TEXT.index('"Fase 1"') + 5]
+    assert extract_json(text, report) == {
+        'introduction': 'Intro con {llaves}',
+        'principles': [{'name': 'P', 'description': 'd'}],
+        'phases': [{'title': 'Fase'}],
+    }
+    assert report['strategy'] == 'repaired'
+
+
+def test_truncated_fenced_response():
+    report = {}
+    text = '```json\n' + TEXT[:TEXT.index('"risks"') + 3]
+    assert extract_json(text, report) == {
+        'introduction': 'Intro con {llaves}',
+        'principles': [{'name': 'P', 'description': 'd'}],
+        'phases': [{'title': 'Fase 1', 'tasks': []}],
+    }
+    assert report['strategy'] == 'repaired'
+
+
+def test_truncated_double_encoded_response():
+    report = {}
+    text = json.dumps(json.dumps({'a': 'hola mundo', 'b': [1, 2]}))[:25]
+    assert extract_json(text, report) == {'a': 'hola mundo'}
+    assert report['strategy'] == 'repaired'
+
+
+def test_strategy_order():
+    assert STRATEGIES == ('direct', 'fenced', 'embedded', 'double_encoded', 'repaired')
+
+
+@pytest.mark.parametrize('text, expected, strategy', [
+    # El bloque markdown gana al objeto de la prosa que lo precede
+    ('Ejemplo {"x": 1}\n```json\n{"a": 2}\n```', {'a': 2}, 'fenced'),
+    # El primer objeto completo gana; el texto posterior se ignora aunque tenga llaves
+    ('Primero {"a": 1} y luego {"b": 2}', {'a': 1}, 'embedded'),
+    # Un objeto completo gana a la codificación doble
+    ('{"a": "{\\"b\\": 1}"}', {'a': '{"b": 1}'}, 'direct'),
+])
+def test_first_strategy_wins(text, expected, strategy):
+    report = {}
+    assert extract_json(text, report) == expected
+    assert report['strategy'] == strategy
+
+
+@pytest.mark.parametrize('text', ['', 'No puedo generar la metodología.', None, '```json\n```'])
+def test_no_object(text):
+    report = {}
+    assert extract_json(text, report) is None
+    assert report['strategy'] is None
+
+
+def test_parse_methodology_response():
+    assert parse_methodology_response('{"a": 1}') == {'a': 1, 'phases': [], 'principles': []}
+    assert parse_methodology_response('Sin JSON') == fallback_methodology('Sin JSON')
+    assert parse_methodology_response(f'```json\n{TEXT}\n```') == METHODOLOGY
@@ -0,0 +1,112 @@
+"""
+Pruebas del motor de cronograma: ocupación, granularidades, problemas y tramos
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.schedule import AUTO_MONTH_THRESHOLD, NO_COLUMN, bar_runs, build_schedule
+
+
+METHODOLOGY = {'phases': [
+    {'title': 'Inicio', 'start_week': 1, 'end_week': 4, 'tasks': [
+        {'code': '1.1', 'title': 'A', 'start_week': 1, 'end_week': 2,
+         'deliverable_week': 2, 'deliverable_code': 'E1'},
+        {'code': '1.2', 'title': 'B', 'start_week': 3, 'end_week': 6,
+         'event_week': 4, 'deliverable_week': 4, 'deliverable_code': 'E1'},
+    ]},
+    {'title': 'Cierre', 'start_week': 5, 'end_week': 30, 'tasks': [
+        {'code': '2.1', 'title': 'C', 'start_week': 5, 'end_week': 30},
+    ]},
+]}
+
+
+def test_rows_and_occupancy():
+    schedule = build_schedule(METHODOLOGY)
+    assert (schedule.first, schedule.last, schedule.num_periods) == (1, 30, 30)
+    assert schedule.phase_rows == [0, 3]
+    assert schedule.task_rows == [[1, 2], [4]]
+    assert schedule.labels[:3] == ['1', '2', '3']
+    assert schedule.occupancy[:, :8].astype(int).tolist() == [
+        [1, 1, 1, 1, 0, 0, 0, 0],
+        [1, 1, 0, 0, 0, 0, 0, 0],
+        [0, 0, 1, 1, 1, 1, 0, 0],
+        [0, 0, 0, 0, 1, 1, 1, 1],
+        [0, 0, 0, 0, 1, 1, 1, 1],
+    ]
+    assert schedule.occupancy[3:, 4:].all()
+    assert schedule.deliverable_col.tolist() == [NO_COLUMN, 1, 3, NO_COLUMN, NO_COLUMN]
+    assert schedule.event_col.tolist() == [NO_COLUMN, NO_COLUMN, 3, NO_COLUMN, NO_COLUMN]
+
+
+def test_issues():
+    assert build_schedule(METHODOLOGY).issues == [
+        "Tarea 1.2 (3-6) fuera de la fase 'Inicio' (1-4)",
+        "Tarea 1.2: entregable y evento en la misma semana (4), solo se ve uno de los dos",
+        "Entregable E1 con fechas distintas: semana 2 (1.1), semana 4 (1.2)",
+    ]
+
+
+def test_no_issues_without_phases():
+    schedule = build_schedule({'phases': []})
+    assert schedule.issues == []
+    assert schedule.num_periods == 1
+
+
+def test_month_granularity():
+    schedule = build_schedule(METHODOLOGY, 'month')
+    assert schedule.labels == [str(month) for month in range(1, 9)]
+    assert schedule.occupancy.astype(int).tolist() == [
+        [1, 0, 0, 0, 0, 0, 0, 0],
+        [1, 0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 0, 0, 0, 0, 0, 0],
+        [0, 1, 1, 1, 1, 1, 1, 1],
+        [0, 1, 1, 1, 1, 1, 1, 1],
+    ]
+    assert schedule.deliverable_col.tolist() == [NO_COLUMN, 0, 0, NO_COLUMN, NO_COLUMN]
+    # Los problemas no cambian con la granularidad
+    assert schedule.issues == build_schedule(METHODOLOGY).issues
+
+
+def test_auto_granularity():
+    assert build_schedule(METHODOLOGY).span > AUTO_MONTH_THRESHOLD
+    assert build_schedule(METHODOLOGY, 'auto').granularity == 'month'
+    short = {'phases': [{'title': 'F', 'start_week': 1, 'end_week': 8, 'tasks': []}]}
+    assert build_schedule(short, 'auto').granularity == 'week'
+
+
+def test_calendar_granularity():
+    schedule = build_schedule(METHODOLOGY, 'calendar', date(2025, 1, 27))
+    assert schedule.labels == [f'{month:02d}/25' for month in range(1, 9)]
+    # Semanas 1-4 desde el 27/01: enero y febrero
+    assert schedule.occupancy[0].astype(int).tolist() == [1, 1, 0, 0, 0, 0, 0, 0]
+
+
+@pytest.mark.parametrize('granularity, start_date', [('calendar', None), ('day', None)])
+def test_invalid_granularity(granularity, start_date):
+    with pytest.raises(ValueError):
+        build_schedule(METHODOLOGY, granularity, start_date)
+
+
+def test_window():
+    schedule = build_schedule(METHODOLOGY)
+    occupancy, deliverables, events = schedule.window(schedule.task_rows[0], 3, 4)
+    assert occupancy.astype(int).tolist() == [[0, 0, 0, 0], [1, 1, 1, 1]]
+    assert deliverables.tolist() == [NO_COLUMN, 1]
+    assert events.tolist() == [NO_COLUMN, 1]
+    with pytest.raises(ValueError):
+        build_schedule(METHODOLOGY, 'month').window([0], 1, 4)
+
+
+@pytest.mark.parametrize('active, split, expected', [
+    ([0, 1, 1, 1, 0, 1, 1, 0], (), [(1, 3), (5, 2)]),
+    ([1, 1, 1, 1], (), [(0, 4)]),
+    ([1, 1, 1, 1], (0, 2), [(0, 1), (1, 1), (2, 1), (3, 1)]),
+    ([1, 1, 1, 1, 1], (2,), [(0, 2), (2, 1), (3, 2)]),
+    ([1, 1, 1], (5,), [(0, 3)]),
+    ([0, 0, 0], (1,), []),
+])
+def test_bar_runs(active, split, expected):
+    assert bar_runs(np.array(active, dtype=bool), split) == expected
@@ -0,0 +1,112 @@
+"""
+Pruebas del análisis del cronograma: dependencias, holgura, ruta crítica y carga por rol
+"""
+
+import pytest
+
+from src.schedule_analysis import analyze_schedule, format_analysis
+
+
+def _task(code, start, end, **extra):
+    return {'code': code, 'title': code, 'start_week': start, 'end_week': end, **extra}
+
+
+def _methodology(*phases):
+    return {'phases': [{'title': title, 'start_week': min(t['start_week'] for t in tasks),
+                        'end_week': max(t['end_week'] for t in tasks), 'tasks': tasks}
+                       for title, tasks in phases]}
+
+
+# A (1-2) → B (3-6) → C (7-10); D (3-4) tiene dos semanas de margen antes de C
+CHAIN = _methodology(('Fase', [_task('A', 1, 2), _task('B', 3, 6), _task('C', 7, 10),
+                               _task('D', 3, 4)]))
+
+
+def _slack(analysis):
+    return {task['code']: task['slack'] for task in analysis['tasks']}
+
+
+def test_inferred_dependencies():
+    analysis = analyze_schedule(CHAIN)
+    assert analysis['dependencies'] == 'inferred'
+    assert (analysis['start'], analysis['end']) == (1, 10)
+    assert _slack(analysis) == {'A': 0, 'B': 0, 'C': 0, 'D': 2}
+    assert analysis['critical_path'] == ['A', 'B', 'C']
+    assert analysis['critical_chains'] == [['A', 'B', 'C']]
+    assert analysis['errors'] == []
+
+
+def test_explicit_dependencies():
+    tasks = [_task('A', 1, 2), _task('B', 3, 6, depends_on=['A']),
+             _task('C', 7, 10, depends_on=['D']), _task('D', 3, 4, depends_on=['A'])]
+    analysis = analyze_schedule(_methodology(('Fase', tasks)))
+    assert analysis['dependencies'] == 'explicit'
+    # B ya no precede a C: puede terminar hasta el fin del proyecto
+    assert _slack(analysis) == {'A': 2, 'B': 4, 'C': 0, 'D': 2}
+    assert analysis['critical_path'] == ['C']
+
+
+def test_explicit_dependency_started_too_early():
+    tasks = [_task('A', 1, 5), _task('B', 4, 8, depends_on=['A', 'X'])]
+    analysis = analyze_schedule(_methodology(('Fase', tasks)))
+    assert _slack(analysis) == {'A': -2, 'B': 0}
+    assert [task['critical'] for task in analysis['tasks']] == [True, True]
+    assert analysis['critical_path'] == ['A', 'B']
+    assert analysis['errors'] == ["Tarea B: depende de una tarea inexistente (X)"]
+
+
+def test_circular_dependencies():
+    tasks = [_task('A', 1, 2, depends_on=['B']), _task('B', 3, 4, depends_on=['A'])]
+    with pytest.raises(ValueError, match='circulares'):
+        analyze_schedule(_methodology(('Fase', tasks)))
+
+
+def test_umbrella_task_is_a_parallel_chain():
+    methodology = _methodology(('Trabajo', [_task('A', 1, 2), _task('B', 3, 10)]),
+                               ('Gestión', [_task('U', 1, 10)]))
+    analysis = analyze_schedule(methodology)
+    # La tarea que abarca todo el plan termina con el proyecto: crítica sin estar en la ruta
+    assert _slack(analysis) == {'A': 0, 'B': 0, 'U': 0}
+    assert analysis['critical_path'] == ['A', 'B']
+    assert analysis['critical_chains'] == [['A', 'B'], ['U']]
+    report = format_analysis(analysis)
+    assert 'Ruta crítica: A → B' in report
+    assert 'Cadenas críticas paralelas (también sin holgura hasta el fin del proyecto): U' in report
+
+
+def test_role_load_and_overloads():
+    methodology = _methodology(('Trabajo', [_task('A', 1, 2, roles=['PM']),
+                                            _task('B', 3, 10, roles=['PM', 'Ing'])]),
+                               ('Gestión', [_task('U', 1, 10, roles=['PM'])]))
+    analysis = analyze_schedule(methodology)
+    load = analysis['load']
+    assert load['granularity'] == 'week'
+    assert load['periods'] == [str(week) for week in range(1, 11)]
+    assert load['total'] == [2] * 10
+    assert load['roles'] == {'Ing': [0, 0] + [1] * 8, 'PM': [2] * 10}
+    assert analysis['overloads'] == []
+
+    overloads = analyze_schedule(methodology, capacity={'PM': 1})['overloads']
+    assert len(overloads) == 10
+    assert overloads[0] == {'role': 'PM', 'period': '1', 'load': 2, 'capacity': 1,
+                            'tasks': ['A', 'U']}
+    assert overloads[-1]['tasks'] == ['B', 'U']
+    assert 'Sobrecargas: 10' in format_analysis(analyze_schedule(methodology, capacity={'PM': 1}))
+
+
+def test_role_load_without_roles():
+    analysis = analyze_schedule(CHAIN)
+    assert analysis['load']['roles'] == {}
+    assert analysis['load']['total'][:4] == [1, 1, 2, 2]
+    assert analysis['overloads'] == []
+    assert "sin roles asignados" in format_analysis(analysis)
+
+
+@pytest.mark.parametrize('methodology', [{'phases': []},
+                                         {'phases': [{'title': 'Vacía', 'tasks': []}]}])
+def test_empty_methodology(methodology):
+    analysis = analyze_schedule(methodology)
+    assert analysis['tasks'] == []
+    assert analysis['critical_path'] == analysis['critical_chains'] == []
+    assert analysis['load'] == {} and analysis['overloads'] == []
+    assert 'Ruta crítica' not in format_analysis(analysis)